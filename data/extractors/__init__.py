@@ -2,9 +2,11 @@
 from .oireachtas_debate_extractor import OireachtasDebateExtractor
 from .oireachtas_question_extractor import OireachtasQuestionExtractor
 from .boards_discussion_extractor import BoardsDiscussionExtractor
+from .bulk_upsert import BulkUpserter
 
 __all__ = [
     "OireachtasDebateExtractor",
     "OireachtasQuestionExtractor",
     "BoardsDiscussionExtractor",
+    "BulkUpserter",
 ]
\ No newline at end of file
@@ -0,0 +1,65 @@
+# data/extractors/boards_comment_watermark_extractor.py
+from datetime import datetime, timezone
+from typing import Dict, List, Iterable, Optional, Tuple
+from dateutil.parser import isoparse
+from data.models.boards_comment_watermark import BoardsCommentWatermark
+from data.extractors.bulk_upsert import BulkUpserter
+
+IN_CLAUSE_CHUNK = 1000  # stays under SQL Server's 2100 bind-parameter limit
+
+
+class BoardsCommentWatermarkExtractor:
+    """Reads and advances the per-discussion comment high-water marks."""
+
+    def __init__(self, connector):
+        self.connector = connector
+        self.logger = connector.logger
+        self.upserter = BulkUpserter(connector, BoardsCommentWatermark, key_columns=["DiscussionId"])
+
+    def load(self, discussion_ids: Iterable[int]) -> Dict[int, Dict]:
+        """Return {DiscussionId: {"MaxDateInserted", "MaxCommentId"}} for every discussion that has one."""
+        ids = list(discussion_ids)
+        watermarks: Dict[int, Dict] = {}
+        session = self.connector.get_session()
+        try:
+            for i in range(0, len(ids), IN_CLAUSE_CHUNK):
+                rows = session.query(
+                    BoardsCommentWatermark.DiscussionId,
+                    BoardsCommentWatermark.MaxDateInserted,
+                    BoardsCommentWatermark.MaxCommentId,
+                ).filter(BoardsCommentWatermark.DiscussionId.in_(ids[i:i + IN_CLAUSE_CHUNK])).all()
+                for discussion_id, max_date, max_comment in rows:
+                    watermarks[discussion_id] = {"MaxDateInserted": max_date, "MaxCommentId": max_comment}
+        finally:
+            session.close()
+        self.logger.info(f"Loaded watermarks for {len(watermarks)} of {len(ids)} discussions")
+        return watermarks
+
+    def save_data(self, discussion_id: int, records: List[Dict], previous: Dict = None):
+        """Advance the watermark of one discussion past the given (already saved) comment records."""
+        self.save_many([(discussion_id, records, previous)])
+
+    def save_many(self, items: Iterable[Tuple[int, List[Dict], Optional[Dict]]]):
+        """Advance several watermarks in one upsert; items are (discussion_id, records, previous)."""
+        rows = [row for row in (self._row(*item) for item in items) if row is not None]
+        if rows:
+            self.upserter.upsert(rows)
+
+    @staticmethod
+    def _row(discussion_id: int, records: List[Dict], previous: Dict = None) -> Optional[Dict]:
+        dates = [isoparse(r["dateInserted"]) for r in records if r.get("dateInserted")]
+        dates = [d.astimezone(timezone.utc).replace(tzinfo=None) if d.tzinfo else d for d in dates]
+        comment_ids = [r["commentID"] for r in records if r.get("commentID") is not None]
+        previous = previous or {}
+
+        candidates_date = [d for d in dates + [previous.get("MaxDateInserted")] if d is not None]
+        candidates_id = [c for c in comment_ids + [previous.get("MaxCommentId")] if c is not None]
+        if not candidates_date and not candidates_id:
+            return None
+
+        return {
+            "DiscussionId": discussion_id,
+            "MaxDateInserted": max(candidates_date) if candidates_date else None,
+            "MaxCommentId": max(candidates_id) if candidates_id else None,
+            "UpdatedAt": datetime.now(timezone.utc).replace(tzinfo=None),
+        }
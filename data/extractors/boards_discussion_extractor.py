@@ -1,52 +1,43 @@
 # data/extractors/boards_discussion_extractor.py
 from dateutil.parser import isoparse
 from data.models.boards_discussion import BoardsDiscussion
+from data.extractors.bulk_upsert import BulkUpserter
 
 class BoardsDiscussionExtractor:
 
-    def __init__(self, connector, chunk_size=500):
+    def __init__(self, connector, chunk_size=500, upsert_batch_size=1000):
         self.connector = connector
         self.chunk_size = chunk_size
         self.logger = connector.logger
+        # the latest snapshot of a discussion replaces the stored one
+        self.upserter = BulkUpserter(connector, BoardsDiscussion, key_columns=["DiscussionId"], batch_size=upsert_batch_size)
 
     def save_data(self, records: list[dict]):
-        """Save all records as a snapshot using bulk insert."""
-        session = self.connector.get_session()
+        """Save all records as a snapshot, upserting on DiscussionId in set-based batches."""
+        rows = [self._to_row(r) for r in records]
+        if rows:
+            saved = self.upserter.upsert(rows)
+            self.logger.info(f"Saved {saved} discussions as snapshot.")
+        else:
+            self.logger.info("No discussions to save.")
 
-        try:
-            objs = []
-            for r in records:
-                objs.append(
-                    BoardsDiscussion(
-                        DiscussionId=str(r.get("discussionID")),
-                        Type=r.get("type"),
-                        Title=r.get("name"),
-                        Body=r.get("body"),
-                        CategoryId=r.get("categoryID"),
-                        DateInserted=self._dt(r.get("dateInserted")),
-                        DateUpdated=self._dt(r.get("dateUpdated")),
-                        DateLastComment=self._dt(r.get("dateLastComment")),
-                        insertUserId=r.get("insertUserID"),
-                        UpdateUserId=r.get("updateUserID"),
-                        LastUserId=r.get("lastUserID"),
-                        Closed=str(r.get("closed")),
-                        countComments=r.get("countComments"),
-                        CanonicalURL=r.get("canonicalUrl"),
-                    )
-                )
-
-            if objs:
-                session.bulk_save_objects(objs)
-                session.commit()
-                self.logger.info(f"Saved {len(objs)} discussions as snapshot.")
-            else:
-                self.logger.info("No discussions to save.")
-
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
+    def _to_row(self, r: dict) -> dict:
+        return dict(
+            DiscussionId=r.get("discussionID"),
+            Type=r.get("type"),
+            Title=r.get("name"),
+            Body=r.get("body"),
+            CategoryId=r.get("categoryID"),
+            DateInserted=self._dt(r.get("dateInserted")),
+            DateUpdated=self._dt(r.get("dateUpdated")),
+            DateLastComment=self._dt(r.get("dateLastComment")),
+            insertUserId=r.get("insertUserID"),
+            UpdateUserId=r.get("updateUserID"),
+            LastUserId=r.get("lastUserID"),
+            Closed=str(r.get("closed")),
+            countComments=r.get("countComments"),
+            CanonicalURL=r.get("canonicalUrl"),
+        )
 
     @staticmethod
     def _dt(value):
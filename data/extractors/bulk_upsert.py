@@ -0,0 +1,183 @@
+# data/extractors/bulk_upsert.py
+from typing import Dict, List, Optional, Sequence, Any
+from sqlalchemy import bindparam, delete, insert, select, text, tuple_, update
+from sqlalchemy.engine import Connection
+from logs.logger import get_logger
+
+
+class BulkUpserter:
+    """Set-based insert-or-update of plain row dicts into one ORM table.
+
+    Rows are written in batches of `batch_size`, one transaction and one
+    executemany round-trip per batch, using the dialect's native upsert:
+
+      - postgresql / sqlite: INSERT ... ON CONFLICT (keys) DO UPDATE / DO NOTHING
+      - mysql:               INSERT ... ON DUPLICATE KEY UPDATE
+      - mssql:               MERGE ... WITH (HOLDLOCK)
+      - anything else:       one SELECT of the batch's existing keys, then
+                             executemany INSERT for new rows (and UPDATE for existing)
+
+    `key_columns` must be covered by a unique constraint on the table.
+    `on_conflict` is "update" (overwrite the non-key columns) or "ignore" (keep the stored row).
+    """
+
+    def __init__(
+        self,
+        connector,
+        model,
+        key_columns: Sequence[str],
+        batch_size: int = 1000,
+        on_conflict: str = "update",
+        update_columns: Optional[Sequence[str]] = None,
+    ):
+        if on_conflict not in ("update", "ignore"):
+            raise ValueError(f"on_conflict must be 'update' or 'ignore', got '{on_conflict}'")
+
+        self.connector = connector
+        self.table = model.__table__
+        self.key_columns = list(key_columns)
+        self.batch_size = batch_size
+        self.on_conflict = on_conflict
+        self.update_columns = list(update_columns) if update_columns is not None else None
+        self.logger = get_logger(self.__class__.__name__)
+
+    def upsert(self, rows: List[Dict[str, Any]]) -> int:
+        """Upsert rows in batches; returns the number of distinct rows written."""
+        rows = self._dedupe(rows)
+        if not rows:
+            return 0
+
+        engine = self.connector.get_engine()
+        for i in range(0, len(rows), self.batch_size):
+            batch = rows[i:i + self.batch_size]
+            with engine.begin() as conn:
+                self._upsert_batch(conn, batch)
+            self.logger.info(f"Upserted batch of {len(batch)} rows into {self.table.name} ({engine.dialect.name})")
+        return len(rows)
+
+    def replace_by(self, rows: List[Dict[str, Any]], column: str, values: Sequence[Any]) -> int:
+        """Delete every row whose `column` is in `values`, then insert `rows`, in one transaction.
+
+        Used for child rows without a natural unique key (e.g. debate contributions per section).
+        """
+        values = list(dict.fromkeys(v for v in values if v is not None))
+        if not values and not rows:
+            return 0
+
+        with self.connector.get_engine().begin() as conn:
+            col = self.table.c[column]
+            for i in range(0, len(values), self.batch_size):
+                conn.execute(delete(self.table).where(col.in_(values[i:i + self.batch_size])))
+            for i in range(0, len(rows), self.batch_size):
+                conn.execute(insert(self.table), rows[i:i + self.batch_size])
+        self.logger.info(f"Replaced rows of {self.table.name} for {len(values)} {column} values with {len(rows)} rows")
+        return len(rows)
+
+    def _upsert_batch(self, conn: Connection, batch: List[Dict[str, Any]]):
+        dialect = conn.dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            self._upsert_on_conflict(conn, batch, dialect)
+        elif dialect in ("mysql", "mariadb"):
+            self._upsert_on_duplicate_key(conn, batch)
+        elif dialect == "mssql":
+            self._upsert_merge(conn, batch)
+        else:
+            self._upsert_generic(conn, batch)
+
+    def _update_names(self, batch: List[Dict[str, Any]]) -> List[str]:
+        names = self.update_columns if self.update_columns is not None else list(batch[0].keys())
+        return [n for n in names if n not in self.key_columns]
+
+    def _upsert_on_conflict(self, conn: Connection, batch: List[Dict[str, Any]], dialect: str):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(self.table)
+        update_names = self._update_names(batch)
+        if self.on_conflict == "update" and update_names:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=self.key_columns,
+                set_={n: stmt.excluded[n] for n in update_names},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=self.key_columns)
+        conn.execute(stmt, batch)
+
+    def _upsert_on_duplicate_key(self, conn: Connection, batch: List[Dict[str, Any]]):
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(self.table)
+        update_names = self._update_names(batch)
+        if self.on_conflict == "update" and update_names:
+            stmt = stmt.on_duplicate_key_update({n: stmt.inserted[n] for n in update_names})
+        else:
+            # no-op update keeps the stored row without raising on the duplicate
+            key = self.key_columns[0]
+            stmt = stmt.on_duplicate_key_update({key: stmt.inserted[key]})
+        conn.execute(stmt, batch)
+
+    def _upsert_merge(self, conn: Connection, batch: List[Dict[str, Any]]):
+        preparer = conn.dialect.identifier_preparer
+        names = list(batch[0].keys())
+        q = preparer.quote
+
+        source = ", ".join(f":{n} AS {q(n)}" for n in names)
+        on = " AND ".join(f"target.{q(k)} = source.{q(k)}" for k in self.key_columns)
+        insert_cols = ", ".join(q(n) for n in names)
+        insert_vals = ", ".join(f"source.{q(n)}" for n in names)
+
+        sql = (
+            f"MERGE INTO {preparer.format_table(self.table)} WITH (HOLDLOCK) AS target "
+            f"USING (SELECT {source}) AS source ON {on} "
+        )
+        update_names = self._update_names(batch)
+        if self.on_conflict == "update" and update_names:
+            sets = ", ".join(f"target.{q(n)} = source.{q(n)}" for n in update_names)
+            sql += f"WHEN MATCHED THEN UPDATE SET {sets} "
+        sql += f"WHEN NOT MATCHED THEN INSERT ({insert_cols}) VALUES ({insert_vals});"
+
+        # typed bind params so JSON/DateTime columns get the same conversion as ORM inserts
+        stmt = text(sql).bindparams(*[bindparam(n, type_=self.table.c[n].type) for n in names])
+        conn.execute(stmt, batch)
+
+    def _upsert_generic(self, conn: Connection, batch: List[Dict[str, Any]]):
+        key_cols = [self.table.c[k] for k in self.key_columns]
+        keys = [self._key(r) for r in batch]
+
+        if len(key_cols) == 1:
+            existing_stmt = select(key_cols[0]).where(key_cols[0].in_([k[0] for k in keys]))
+        else:
+            existing_stmt = select(*key_cols).where(tuple_(*key_cols).in_(keys))
+        existing = {tuple(row) for row in conn.execute(existing_stmt)}
+
+        new_rows = [r for r, k in zip(batch, keys) if k not in existing]
+        if new_rows:
+            conn.execute(insert(self.table), new_rows)
+
+        update_names = self._update_names(batch)
+        old_rows = [r for r, k in zip(batch, keys) if k in existing]
+        if self.on_conflict == "update" and update_names and old_rows:
+            # SET columns come from the parameter keys; the key columns bind under a prefixed name
+            stmt = update(self.table).where(*[c == bindparam(f"_key_{c.name}") for c in key_cols])
+            params = [
+                {**{n: r.get(n) for n in update_names}, **{f"_key_{k}": r.get(k) for k in self.key_columns}}
+                for r in old_rows
+            ]
+            conn.execute(stmt, params)
+
+    def _key(self, row: Dict[str, Any]) -> tuple:
+        return tuple(row.get(k) for k in self.key_columns)
+
+    def _dedupe(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop rows with a missing key and keep the last row per key (a statement may not touch a key twice)."""
+        by_key: Dict[tuple, Dict[str, Any]] = {}
+        for r in rows:
+            key = self._key(r)
+            if any(k is None for k in key):
+                continue
+            by_key[key] = r
+        if len(by_key) < len(rows):
+            self.logger.info(f"Collapsed {len(rows)} rows to {len(by_key)} distinct {self.key_columns}")
+        return list(by_key.values())
@@ -1,7 +1,8 @@
 # data/extractors/oireachtas_debate_extractor.py
-from typing import List, Dict
-from sqlalchemy.orm import Session
+from typing import List, Dict, Tuple
+from dateutil.parser import isoparse
 from logs.logger import get_logger
+from .bulk_upsert import BulkUpserter
 from ..models import (
     OireachtasDebateSection,
     OireachtasDebateContribution,
@@ -9,28 +10,50 @@ from ..models import (
 
 
 class OireachtasDebateExtractor:
-    def __init__(self, connector, chunk_size: int = 100):
+    def __init__(self, connector, chunk_size: int = 100, upsert_batch_size: int = 1000):
         self.connector = connector
         self.chunk_size = chunk_size
         self.logger = get_logger(self.__class__.__name__)
+        self.section_upserter = BulkUpserter(
+            connector, OireachtasDebateSection, key_columns=["DebateSectionId"], batch_size=upsert_batch_size
+        )
+        # contributions have no natural unique key, so each section's contributions are replaced wholesale
+        self.contribution_upserter = BulkUpserter(
+            connector, OireachtasDebateContribution, key_columns=["DebateSectionId", "Sequence"], batch_size=upsert_batch_size
+        )
 
     def save_data(self, debates: List[Dict]):
+        """Upsert debate sections and replace their contributions using set-based batches."""
         self.logger.info(f"Saving {len(debates)} debate records to the database")
-        with self.connector.get_session() as session:
-            for debate in debates:
-                self._process_debate(session, debate)
-            session.commit()
+        sections: List[Dict] = []
+        contributions: List[Dict] = []
+        for debate in debates:
+            debate_sections, debate_contributions = self._process_debate(debate)
+            sections.extend(debate_sections)
+            contributions.extend(debate_contributions)
 
-    def _process_debate(self, session: Session, debate: Dict):
-        debate_record = debate_wrapper.get("debateRecord")
+        self.section_upserter.upsert(sections)
+        self.contribution_upserter.replace_by(
+            contributions,
+            column="DebateSectionId",
+            values=[s["DebateSectionId"] for s in sections],
+        )
+        self.logger.info(f"Saved {len(sections)} debate sections and {len(contributions)} contributions")
+
+    def _process_debate(self, debate: Dict) -> Tuple[List[Dict], List[Dict]]:
+        """Flatten one API debate record into section rows and contribution rows."""
+        sections: List[Dict] = []
+        contributions: List[Dict] = []
+
+        debate_record = debate.get("debateRecord")
         if not debate_record:
-            return
+            return sections, contributions
 
         debate_date = debate_record.get("date")
+        if isinstance(debate_date, str):
+            debate_date = isoparse(debate_date).date()
 
-        sections = debate_record.get("debateSections", [])
-
-        for section_wrapper in sections:
+        for section_wrapper in debate_record.get("debateSections", []):
             section = section_wrapper.get("debateSection")
             if not section:
                 continue
@@ -39,23 +62,20 @@ class OireachtasDebateExtractor:
             if not section_id:
                 continue
 
-            debate_section = OireachtasDebateSection(
+            sections.append(dict(
                 DebateSectionId=section_id,
                 DebateDate=debate_date,
                 Title=section.get("showAs"),
                 RawJSON=section,
-            )
-
-            session.add(debate_section)
+            ))
 
             # need to rewrite this as contributions doesn't always exist
-            contributions = section.get("contributions", [])
-            for idx, c in enumerate(contributions):
+            for idx, c in enumerate(section.get("contributions", [])):
                 text = c.get("text")
                 if not text:
                     continue
 
-                contribution = OireachtasDebateContribution(
+                contributions.append(dict(
                     DebateSectionId=section_id,
                     SpeakerName=c.get("speaker", {}).get("showAs"),
                     SpeakerURI=c.get("speaker", {}).get("uri"),
@@ -64,6 +84,6 @@ class OireachtasDebateExtractor:
                     ContributionText=text,
                     Sequence=idx,
                     RawJSON=c,
-                )
+                ))
 
-                session.add(contribution)
+        return sections, contributions
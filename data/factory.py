@@ -1,5 +1,5 @@
 # data/factory.py
-from typing import Optional, Type
+from typing import List, Optional, Type
 from .sqlalchemy_connector import SQLAlchemyConnector
 from .table_extractor import TableDataExtractor
 from .abstract_connector import DBConnector
@@ -8,7 +8,7 @@ from sqlalchemy.orm import DeclarativeMeta
 from .steam_extractor import SteamAPIExtractor
 from typing import Dict, Any
 #from data.query.filter_spec import build_filters
-from data.query import build_filters, build_order_by
+from data.query import build_filters, build_order_by, build_sampling
 from data.models.registry import MODEL_REGISTRY
 
 
@@ -70,7 +70,9 @@ class ExtractorFactory:
             db_url: Optional[str] = None,
             sample_size: Optional[int] = None,
             order_by = None,
-            filters: Optional[Dict[str, Any]] = None
+            filters: Optional[Dict[str, Any]] = None,
+            columns: Optional[List[str]] = None,
+            sampling: Optional[Dict[str, Any]] = None
     ) -> TableDataExtractor:
 
         if model not in MODEL_REGISTRY:
@@ -89,5 +91,7 @@ class ExtractorFactory:
                                 model=model_cls,
                                 sample_size=sample_size,
                                 order_by=sa_order_by,
-                                filters=sa_filters
+                                filters=sa_filters,
+                                columns=columns,
+                                sampling=build_sampling(sampling)
         )
@@ -9,6 +9,7 @@ from .oireachtas_question import OireachtasQuestion
 from .oireachtas_debate import OireachtasDebateSection
 from .oireachtas_contribution import OireachtasDebateContribution
 from .boards_comment import BoardsComment
+from .boards_comment_watermark import BoardsCommentWatermark
 from .boards_discussion import BoardsDiscussion
 
 from .oireachtas_party import OireachtasParty
@@ -29,6 +30,7 @@ __all__ = [
     "OireachtasDebateSection",
     "OireachtasDebateContribution",
     "BoardsComment",
+    "BoardsCommentWatermark",
     "BoardsDiscussion",
     "OireachtasParty",
     "OireachtasMember",
@@ -0,0 +1,18 @@
+# data/models/boards_comment_watermark.py
+
+from sqlalchemy import Column, BigInteger, DateTime
+from .base import Base
+
+class BoardsCommentWatermark(Base):
+    """Per-discussion high-water mark for incremental comment ingestion."""
+    __tablename__ = "boards_comment_watermarks"
+    __table_args__ = {"schema": "dbo"}
+
+    Id = Column(BigInteger, primary_key=True, autoincrement=True)
+    DiscussionId = Column(BigInteger, unique=True, nullable=False)
+    MaxDateInserted = Column(DateTime)
+    MaxCommentId = Column(BigInteger)
+    UpdatedAt = Column(DateTime)
+
+    def to_dict(self):
+        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
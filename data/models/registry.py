@@ -1,5 +1,6 @@
 #data/models/registry.py
 from data.models.boards_comment import BoardsComment
+from data.models.boards_comment_watermark import BoardsCommentWatermark
 from data.models.boards_discussion import BoardsDiscussion
 from data.models.roblox import RobloxGame
 from data.models.steam import SteamGame
@@ -12,6 +13,7 @@ from data.models.oireachtas_member_representation import OireachtasMemberReprese
 
 MODEL_REGISTRY = {
     "BoardsComment": BoardsComment,
+    "BoardsCommentWatermark": BoardsCommentWatermark,
     "BoardsDiscussion": BoardsDiscussion,
     "OireachtasQuestion": OireachtasQuestion,
     "OireachtasParty": OireachtasParty,
@@ -12,13 +12,13 @@ AKN_NS = {"akn": "http://docs.oasis-open.org/legaldocml/ns/akn/3.0/CSD13"}
 
 class OireachtasAnswerXMLParser:
 
-    def __init__(self):
+    def __init__(self, keep_alive: bool = False, pool_size: int = 8):
         self.logger = get_logger(self.__class__.__name__)
         self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0",
-            "Connection": "close",  # important for this API
-        })
+        self.session.headers.update({"User-Agent": "Mozilla/5.0"})
+        if not keep_alive:
+            # the XML endpoint has dropped reused connections in the past; opt in to keep-alive explicitly
+            self.session.headers["Connection"] = "close"
         retries = Retry(
             total=3,
             backoff_factor=1.5,
@@ -28,8 +28,8 @@ class OireachtasAnswerXMLParser:
 
         adapter = HTTPAdapter(
             max_retries=retries,
-            pool_connections=5,
-            pool_maxsize=5,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
         )
 
         self.session.mount("https://", adapter)
@@ -1,4 +1,5 @@
 from .filter_spec import build_filters
 from .order_by import build_order_by
+from .sampling import SamplingSpec, build_sampling
 
-__all__ = ["build_filters", "build_order_by"]
\ No newline at end of file
+__all__ = ["build_filters", "build_order_by", "build_sampling", "SamplingSpec"]
\ No newline at end of file
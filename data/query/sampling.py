@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import BigInteger, Integer, String, cast, func, literal, literal_column
+from sqlalchemy.orm import DeclarativeMeta
+from sqlalchemy.sql import ColumnElement
+
+SAMPLING_METHODS = ("random", "tablesample", "hash", "bernoulli")
+
+
+@dataclass
+class SamplingSpec:
+    """
+    How TableDataExtractor picks a sample.
+
+      - random:      ORDER BY NEWID() + LIMIT (full scan and sort; the legacy behaviour)
+      - tablesample: SQL Server TABLESAMPLE SYSTEM (page-level; reads only `percent` of the pages)
+      - hash:        hash(primary key) % buckets, a fixed pseudo-random slice of the key space;
+                     rows keep their membership as the table grows
+      - bernoulli:   per-row draw with probability `percent` from a hash of (key, seed); each
+                     seed gives an unrelated sample (the hash mixes the seed in non-linearly,
+                     so one seed's sample is not a shifted copy of another's)
+
+    Every method except `random` is reproducible for a fixed `seed` and needs no sort of the
+    table. When `percent` is omitted it is derived from `sample_size` and the table's row
+    count; the slightly larger sample is then cut to `sample_size` by sorting only the sampled
+    rows on a seeded hash of the key (`sampling_order`), so every key range stays reachable.
+    """
+    method: str = "random"
+    percent: Optional[float] = None
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.method not in SAMPLING_METHODS:
+            raise ValueError(f"Invalid sampling method '{self.method}'. Available: {list(SAMPLING_METHODS)}")
+        if self.percent is not None and not 0 < self.percent <= 100:
+            raise ValueError(f"Sampling percent must be in (0, 100], got {self.percent}")
+
+
+def build_sampling(spec: Dict[str, Any] | str | None) -> Optional[SamplingSpec]:
+    """
+    Translate a sampling spec into a SamplingSpec.
+
+    Example spec:
+      { "method": "hash", "percent": 1.0, "seed": 42 }
+    or just the method name: "bernoulli"
+    """
+    if not spec:
+        return None
+    if isinstance(spec, str):
+        return SamplingSpec(method=spec)
+    return SamplingSpec(
+        method=spec.get("method", "random"),
+        percent=spec.get("percent"),
+        seed=int(spec.get("seed", 0)),
+    )
+
+
+def primary_key_column(model: DeclarativeMeta):
+    pk = list(model.__table__.primary_key.columns)
+    if len(pk) != 1:
+        raise ValueError(f"Key-based sampling needs a single-column primary key; {model.__name__} has {len(pk)}")
+    return pk[0]
+
+
+def _is_integer(column) -> bool:
+    return isinstance(column.type, (Integer, BigInteger))
+
+
+def _hash_bucket(model: DeclarativeMeta, seed: int, dialect: str) -> Tuple[ColumnElement, int]:
+    """Map each row's primary key (salted with `seed`) to a bucket; returns (bucket, bucket count)."""
+    pk = primary_key_column(model)
+    if dialect == "mssql":
+        # MD5 over "seed:key" is well mixed for sequential ids and strings alike;
+        # the low 8 bytes as BIGINT, masked non-negative
+        digest = func.hashbytes(literal_column("'MD5'"), func.concat(str(seed), ":", cast(pk, String(100))))
+        return cast(digest, BigInteger).op("&")(literal(0x7FFFFFFFFFFFFFFF)) % 1_000_000, 1_000_000
+
+    if not _is_integer(pk):
+        raise ValueError(f"Hash sampling on a non-integer key ({model.__name__}.{pk.name}) is only supported on mssql")
+    # Knuth multiplicative hash of the key, then the seed folded in and two xorshift-multiply
+    # rounds (murmur-style finaliser), all within 32 bits. The seed enters before the
+    # non-linear rounds, so different seeds select unrelated rows rather than a shifted window.
+    # Products stay inside signed 64-bit arithmetic for keys below ~3e9.
+    mask = 4294967296
+    x = (pk * 2654435761 + (seed * 2246822519) % mask) % mask
+    x = _xor(x, x.op(">>")(16))
+    x = (x * 0x45D9F3B) % mask
+    x = _xor(x, x.op(">>")(16))
+    x = (x * 0x45D9F3B) % mask
+    return _xor(x, x.op(">>")(16)), mask
+
+
+def _xor(a, b):
+    # portable XOR: SQLite has no XOR operator, and PostgreSQL/MySQL spell it differently
+    return a.op("|")(b) - a.op("&")(b)
+
+
+def sampling_filter(model: DeclarativeMeta, method: str, percent: float, seed: int, dialect: str) -> ColumnElement:
+    """WHERE clause keeping roughly `percent` of the rows for the hash and bernoulli methods."""
+    if method == "hash":
+        bucket, buckets = _hash_bucket(model, 0, dialect)
+        threshold = int(percent / 100 * buckets)
+        # a contiguous run of buckets starting at an offset chosen by the seed
+        start = (seed * 7919 * 1_000_003) % buckets
+        return (bucket - start + buckets) % buckets < threshold
+    if method == "bernoulli":
+        bucket, buckets = _hash_bucket(model, seed, dialect)
+        return bucket < int(percent / 100 * buckets)
+    raise ValueError(f"Sampling method '{method}' is not a row filter")
+
+
+def sampling_order(model: DeclarativeMeta, method: str, seed: int, dialect: str) -> ColumnElement:
+    """Sort key for cutting a sample down to `sample_size`: position in the seeded hash order.
+
+    Sorting by the primary key instead would keep only the lowest keys of the sample.
+    """
+    if method == "hash":
+        bucket, buckets = _hash_bucket(model, 0, dialect)
+        start = (seed * 7919 * 1_000_003) % buckets
+        # the sampled buckets in run order, starting at the seed's offset
+        return (bucket - start + buckets) % buckets
+    # bernoulli (the lowest buckets are a smaller Bernoulli draw) and tablesample pages
+    return _hash_bucket(model, seed, dialect)[0]
+
+
+def tablesample_hint(percent: float, seed: int) -> str:
+    """SQL Server table hint text rendered right after the table name."""
+    # REPEATABLE needs a positive seed
+    return f"TABLESAMPLE SYSTEM ({percent:.6g} PERCENT) REPEATABLE ({abs(seed) or 1})"
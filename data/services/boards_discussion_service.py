@@ -16,7 +16,13 @@ class BoardsDiscussionIngestionService:
             limit: int = 50,
             date_start: Optional[str] = None,
             date_end: Optional[str] = None,
+            concurrency: Optional[int] = None,
     ):
+        """Save discussion batches as they arrive.
+
+        With `concurrency` above 1 (or the fetcher context's), days are crawled in parallel
+        and batches are saved here while the fetcher's workers keep crawling.
+        """
         self.logger.info(
             f"Ingesting Boards discussions: "
             f"category={category_id}, {date_start} → {date_end}"
@@ -28,6 +34,7 @@ class BoardsDiscussionIngestionService:
                 limit=limit,
                 start_date=date_start,
                 end_date=date_end,
+                concurrency=concurrency,
         ):
             if not batch:
                 continue
@@ -1,20 +1,40 @@
 #data/services/oireachtas_question_service.py
 from datetime import date, timedelta
 from calendar import monthrange
-from concurrent.futures import ThreadPoolExecutor
+import queue
 import threading
+import time
 
 from data.parsers.oireachtas_answer_xml_parser import OireachtasAnswerXMLParser
 
 SAFE_THRESHOLD = 9_500
+CHECKPOINT_JOB = "oireachtas_questions"
+_DONE = object()
 
 class OireachtasQuestionIngestionService:
+    """Ingests Oireachtas questions month by month (day by day for high-volume months).
 
-    def __init__(self, fetcher, extractor=None, chunk_size=100):
+    Each date range streams through three stages connected by bounded queues:
+    page fetch (the fetcher's own concurrency) → answer XML fetch/parse (`answer_workers`
+    threads) → DB write (`write_workers` threads, `chunk_size` records per save). A full
+    queue makes the stage before it wait, so network and DB time overlap and memory is
+    bounded by `queue_size` records per queue rather than by the size of the month.
+
+    With a `checkpoint`, a month or day is marked done only if no page of it was dropped
+    (or the saved count still reached the API's total), so partial ranges are retried.
+    """
+
+    def __init__(self, fetcher, extractor=None, chunk_size=100, checkpoint=None,
+                 answer_workers=8, write_workers=1, queue_size=2000):
         self.fetcher = fetcher
         self.logger = fetcher.logger
         self.extractor = extractor
         self.chunk_size = chunk_size
+        # optional utils.checkpoint_store.CheckpointStore: months/days already saved are skipped
+        self.checkpoint = checkpoint
+        self.answer_workers = max(1, answer_workers)
+        self.write_workers = max(1, write_workers)
+        self.queue_size = queue_size
         self.answer_parser = OireachtasAnswerXMLParser()
         # caching
         self._answer_cache = {}  # cache for fetched answer XMLs
@@ -23,7 +43,13 @@ class OireachtasQuestionIngestionService:
 
 
     def ingest(self, start: date, end: date):
+        done = self.checkpoint.completed(CHECKPOINT_JOB) if self.checkpoint else set()
         for month_start, month_end in self._month_ranges(start, end):
+            month_unit = f"{month_start.isoformat()}..{month_end.isoformat()}"
+            if month_unit in done:
+                self.logger.info(f"Skipping {month_start} → {month_end}: already ingested")
+                continue
+
             self.logger.info(f"Checking volume for {month_start} → {month_end}")
             self._answer_cache.clear()  # clear cache for each month
 
@@ -40,33 +66,138 @@ class OireachtasQuestionIngestionService:
 
             if expected < SAFE_THRESHOLD:
                 self.logger.info(f"Fetching month {month_start} → {month_end}")
-                results = self.fetcher.fetch(
-                    date_start=month_start.isoformat(),
-                    date_end=month_end.isoformat(),
-                )
-
-                self._enrich_records(results)
-                self._save_in_chunks(results)
+                saved = self._stream_range(month_start.isoformat(), month_end.isoformat())
+                complete = self._range_complete(f"{month_start} → {month_end}", saved)
             else:
                 self.logger.warning(f"High volume ({expected}); falling back to daily fetch")
+                complete = True
                 for day in self._day_ranges(month_start, month_end):
+                    if day.isoformat() in done:
+                        self.logger.info(f"Skipping day {day}: already ingested")
+                        continue
                     self.logger.info(f"Fetching day {day}")
-                    results = self.fetcher.fetch(
-                        date_start=day.isoformat(),
-                        date_end=day.isoformat(),
-                    )
-                    self._enrich_records(results)
-                    self._save_in_chunks(results)
-
-    def _save_in_chunks(self, records: list[dict]):
-        self.logger.info(f"Saving total {len(records)} records in chunks of {self.chunk_size}")
-        if not self.extractor:
-            return
-        for i in range(0, len(records), self.chunk_size):
-            chunk = records[i:i + self.chunk_size]
+                    saved = self._stream_range(day.isoformat(), day.isoformat())
+                    if self._range_complete(str(day), saved):
+                        self._mark_done(day.isoformat(), saved)
+                    else:
+                        complete = False
+
+            # an incomplete month (or any incomplete day in it) is fetched again on the next run
+            if complete:
+                self._mark_done(month_unit, expected)
+
+    def _range_complete(self, label: str, saved: int) -> bool:
+        """True when the last fetched range lost no pages, or its saved count still reached the API's total."""
+        dropped = self.fetcher.last_dropped_offsets
+        expected = self.fetcher.last_expected_count or 0
+        if not dropped or saved >= expected:
+            return True
+        self.logger.warning(
+            f"{label}: saved {saved} of {expected} records, pages at skip {dropped} were not fetched; "
+            f"not checkpointing"
+        )
+        return False
+
+    def _mark_done(self, unit: str, records: int):
+        if self.checkpoint and self.extractor:
+            self.checkpoint.mark_done(CHECKPOINT_JOB, unit, records=records)
+
+    def _stream_range(self, date_start: str, date_end: str) -> int:
+        """Fetch, enrich and save one date range through the staged pipeline; returns records saved."""
+        records = queue.Queue(maxsize=self.queue_size)
+        enriched = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        errors = []
+        counts = {"fetched": 0, "saved": 0}
+        counts_lock = threading.Lock()
+        started = time.monotonic()
+
+        def put(q, item) -> bool:
+            # blocks while the next stage is behind (back-pressure); gives up once stopped
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def get(q):
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+            return _DONE
+
+        def fetch_stage():
+            for page in self.fetcher.fetch_pages(date_start=date_start, date_end=date_end):
+                for r in page:
+                    if not put(records, r):
+                        return
+                counts["fetched"] += len(page)
+
+        def answer_stage():
+            while (r := get(records)) is not _DONE:
+                self._enrich_record(r)
+                if not put(enriched, r):
+                    return
+
+        def write_stage():
+            chunk = []
+            while (r := get(enriched)) is not _DONE:
+                chunk.append(r)
+                if len(chunk) >= self.chunk_size:
+                    self._save_chunk(chunk, counts, counts_lock)
+                    chunk = []
+            if chunk and not stop.is_set():
+                self._save_chunk(chunk, counts, counts_lock)
+
+        def run(stage):
+            try:
+                stage()
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+
+        def start(stage, n):
+            threads = [threading.Thread(target=run, args=(stage,), daemon=True) for _ in range(n)]
+            for t in threads:
+                t.start()
+            return threads
+
+        fetcher = start(fetch_stage, 1)
+        answerers = start(answer_stage, self.answer_workers)
+        writers = start(write_stage, self.write_workers)
+
+        # each stage's end is signalled downstream with one _DONE per consumer
+        for t in fetcher:
+            t.join()
+        for _ in answerers:
+            put(records, _DONE)
+        for t in answerers:
+            t.join()
+        for _ in writers:
+            put(enriched, _DONE)
+        for t in writers:
+            t.join()
+
+        if errors:
+            raise errors[0]
+        seconds = time.monotonic() - started
+        self.logger.info(
+            f"{date_start} → {date_end}: fetched {counts['fetched']}, saved {counts['saved']} records "
+            f"in {seconds:.1f}s ({counts['saved'] / max(seconds, 1e-6):.1f} records/s)"
+        )
+        return counts["saved"]
+
+    def _save_chunk(self, chunk: list[dict], counts: dict, lock: threading.Lock):
+        if self.extractor:
             self.logger.info(f"Saving chunk of {len(chunk)} records")
             self.extractor.save_data(chunk)
             self.logger.info("Chunk saved")
+        with lock:
+            counts["saved"] += len(chunk)
 
     @staticmethod
     def _month_ranges(start, end):
@@ -85,61 +216,34 @@ class OireachtasQuestionIngestionService:
             current += timedelta(days=1)
 
 
-    def _enrich_records(self, records, max_workers=8):
-        self.logger.info(f"Enriching {len(records)} records with answers using {max_workers} workers")
+    def _enrich_record(self, r):
+        """Attach the parsed answer (text, speaker, time and raw XML) to one question record."""
+        q = r.get("question", r)
+        debate = q.get("debateSection", {})
+        xml_uri = debate.get("formats", {}).get("xml", {}).get("uri")
 
-        def enrich(r):
-            q = r.get("question", r)
-            debate = q.get("debateSection", {})
-            xml_uri = debate.get("formats", {}).get("xml", {}).get("uri")
+        if not xml_uri:
+            return
 
-            if not xml_uri:
+        # check cache without lock first
+        cached = self._answer_cache.get(xml_uri)
+        if cached:
+            parsed, xml = cached
+        else:
+            # fetch & parse outside the lock
+            xml = self.answer_parser.fetch_xml(xml_uri)
+            if not xml:
                 return
-
-            # Check cache first
-                # check cache without lock first
-            cached = self._answer_cache.get(xml_uri)
-            if cached:
-                parsed, xml = cached
-            else:
-                # fetch & parse outside the lock
-                xml = self.answer_parser.fetch_xml(xml_uri)
-                if not xml:
-                    return
-                parsed = self.answer_parser.parse(xml)
-
-                # write to cache with lock
-                with self._cache_lock:
-                    # double-check if another thread already wrote it
-                    if xml_uri not in self._answer_cache:
-                        self._answer_cache[xml_uri] = (parsed, xml)
-
-            # stash enrichment onto the record
-            r["_answer_xml"] = xml
-            r["_answer_text"] = parsed.get("text")
-            r["_answer_speaker"] = parsed.get("speaker")
-            r["_answer_recorded_time"] = parsed.get("recorded_time")
-            # xml = self.answer_parser.fetch_xml(xml_uri)
-            # if not xml:
-            #     return
-            #
-            # parsed = self.answer_parser.parse(xml)
-            #
-            # # stash enrichment onto the record
-            # r["_answer_xml"] = xml
-            # r["_answer_text"] = parsed.get("text")
-            # r["_answer_speaker"] = parsed.get("speaker")
-            # recorded_time = parsed.get("recorded_time")
-            # # JSON-safe: store as ISO string
-            # # Store a JSON-safe string separately
-            # # r["_answer_recorded_time_json"] = (
-            # #     recorded_time.isoformat() if recorded_time else None
-            # # )
-            #
-            # # Store Python datetime separately for SQL
-            # r["_answer_recorded_time"] = recorded_time
-
-
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            list(executor.map(enrich, records))
+            parsed = self.answer_parser.parse(xml)
+
+            # write to cache with lock
+            with self._cache_lock:
+                # double-check if another thread already wrote it
+                if xml_uri not in self._answer_cache:
+                    self._answer_cache[xml_uri] = (parsed, xml)
+
+        # stash enrichment onto the record
+        r["_answer_xml"] = xml
+        r["_answer_text"] = parsed.get("text")
+        r["_answer_speaker"] = parsed.get("speaker")
+        r["_answer_recorded_time"] = parsed.get("recorded_time")
@@ -53,7 +53,9 @@ class SQLAlchemyConnector(DBConnector):
 
         # Create engine and session factory
         # Use future=True for SQLAlchemy 1.4+ style
-        self._engine = create_engine(db_url, future=True)
+        # fast_executemany lets pyodbc send executemany batches (bulk upserts) in one round-trip
+        engine_kwargs = {"fast_executemany": True} if db_url.startswith("mssql+pyodbc") else {}
+        self._engine = create_engine(db_url, future=True, **engine_kwargs)
         self._SessionFactory = sessionmaker(bind=self._engine, future=True)
 
     def get_engine(self):
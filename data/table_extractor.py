@@ -1,8 +1,12 @@
 # data/table_extractor.py
-from typing import List, Optional, Dict, Any, Type
-from sqlalchemy import select, func
+import datetime
+import decimal
+from typing import Iterator, List, Optional, Dict, Any, Type
+import pandas as pd
+from sqlalchemy import select, func, text
 from .extractor import DataExtractor
 from .abstract_connector import DBConnector
+from .query.sampling import SamplingSpec, sampling_filter, sampling_order, tablesample_hint
 from sqlalchemy.orm import DeclarativeMeta
 from logs.logger import get_logger
 
@@ -11,42 +15,155 @@ class TableDataExtractor(DataExtractor):
     """
     Generic table extractor that works with any SQLAlchemy ORM model.
 
-    Supports full dataset or a sample (limit).
+    Supports full dataset or a sample (limit and/or a `sampling` strategy, see
+    SamplingSpec), and streaming the result in DataFrame/Arrow batches via `fetch_batches`.
+    The number of rows the last fetch returned is kept in `last_sample_size`.
     """
 
-    def __init__(self, connector: DBConnector, model: Type[DeclarativeMeta], sample_size: Optional[int] = None, order_by = None, filters: Optional[Dict[str, Any]] = None):
+    def __init__(self, connector: DBConnector, model: Type[DeclarativeMeta], sample_size: Optional[int] = None, order_by = None, filters: Optional[Dict[str, Any]] = None, columns: Optional[List[str]] = None, sampling: Optional[SamplingSpec] = None):
         self._connector = connector
         self._model = model
         self._sample_size = sample_size
         self._order_by = order_by
         self._filters = filters or []
+        self._columns = columns
+        # a bare sample_size keeps the legacy ORDER BY NEWID() sample
+        self._sampling = sampling or (SamplingSpec() if sample_size else None)
+        self.last_sample_size: Optional[int] = None
         self.logger = get_logger(self.__class__.__name__)
 
     def fetch_all(self) -> List[Dict[str, Any]]:
         self.logger.info(f"Fetching all rows from {self._model.__tablename__}")
         with self._connector.get_session() as session:
-            stmt = select(self._model)
-
-            for f in self._filters:
-                if isinstance(f, str):
-                    stmt = stmt.filter(getattr(self._model, f))
-                else:
-                    stmt = stmt.filter(f)  # already a SQLAlchemy expression
-
-            if self._order_by is not None:
-                if isinstance(self._order_by, str):
-                    stmt = stmt.order_by(getattr(self._model, self._order_by))
-                else:
-                    stmt = stmt.order_by(self._order_by)  # already an expression
+            if self._columns:
+                stmt = self._apply_query_options(select(*self._select_columns()), session)
+                rows = [dict(r) for r in session.execute(stmt).mappings().all()]
             else:
-                stmt = stmt.order_by(func.newid())
+                stmt = self._apply_query_options(select(self._model), session)
+                rows = [r.to_dict() for r in session.execute(stmt).scalars().all()]
+        self._report_sample(len(rows))
+        return rows
 
+    def fetch_batches(self, batch_size: int = 50_000, as_arrow: bool = False) -> Iterator[Any]:
+        """Stream the query result in batches of at most `batch_size` rows.
 
-            if self._sample_size:
-                stmt = stmt.limit(self._sample_size)
-                self.logger.info(f"Randomly sampling {self._sample_size} rows for sample")
-            rows = session.execute(stmt).scalars().all()
-            return [r.to_dict() for r in rows]
+        Only the configured `columns` (default: every table column) are selected, as plain
+        rows rather than ORM objects, through a server-side cursor, so memory is bounded by
+        one batch. Yields pandas DataFrames, or pyarrow RecordBatches when `as_arrow` is set.
+        """
+        columns = self._select_columns()
+        names = [c.name for c in columns]
+
+        if as_arrow:
+            import pyarrow as pa
+
+        self.logger.info(f"Streaming {len(names)} columns from {self._model.__tablename__} in batches of {batch_size}")
+        with self._connector.get_session() as session:
+            stmt = self._apply_query_options(select(*columns), session)
+            result = session.execute(stmt.execution_options(stream_results=True, yield_per=batch_size))
+            total = 0
+            for partition in result.partitions(batch_size):
+                df = pd.DataFrame.from_records(partition, columns=names)
+                total += len(df)
+                yield pa.RecordBatch.from_pandas(df, preserve_index=False) if as_arrow else df
+            self.logger.info(f"Streamed {total} rows from {self._model.__tablename__}")
+            self._report_sample(total)
+
+    def arrow_schema(self):
+        """pyarrow schema of the selected columns, taken from the model's column types.
+
+        Lets a streaming writer fix its schema up front instead of inferring it from the
+        first batch, where an all-null column carries no type at all.
+        """
+        import pyarrow as pa
+
+        return pa.schema([pa.field(c.name, _arrow_type(c.type), nullable=c.nullable) for c in self._select_columns()])
+
+    def _select_columns(self):
+        """Table columns to select: the configured `columns`, or all of them."""
+        table_columns = self._model.__table__.columns
+        if not self._columns:
+            return list(table_columns)
+        unknown = [n for n in self._columns if n not in table_columns]
+        if unknown:
+            raise ValueError(f"Unknown columns {unknown} for {self._model.__name__}")
+        return [table_columns[n] for n in self._columns]
+
+    def _apply_query_options(self, stmt, session):
+        """Apply the configured filters, sampling, ordering and sample limit to a select()."""
+        for f in self._filters:
+            if isinstance(f, str):
+                stmt = stmt.filter(getattr(self._model, f))
+            else:
+                stmt = stmt.filter(f)  # already a SQLAlchemy expression
+
+        sampling = self._sampling
+        dialect = session.get_bind().dialect.name
+        method = sampling.method if sampling is not None else None
+        if sampling is not None and sampling.method != "random":
+            method = sampling.method
+            if method == "tablesample" and dialect != "mssql":
+                self.logger.warning(f"TABLESAMPLE is only wired up for mssql; using bernoulli sampling on {dialect}")
+                method = "bernoulli"
+            percent = self._sampling_percent(session, dialect)
+            if method == "tablesample":
+                stmt = stmt.with_hint(self._model.__table__, tablesample_hint(percent, sampling.seed), "mssql")
+            else:
+                stmt = stmt.filter(sampling_filter(self._model, method, percent, sampling.seed, dialect))
+            self.logger.info(f"Sampling ~{percent:.4g}% of {self._model.__tablename__} ({method}, seed={sampling.seed})")
+
+        if self._order_by is not None:
+            if isinstance(self._order_by, str):
+                stmt = stmt.order_by(getattr(self._model, self._order_by))
+            else:
+                stmt = stmt.order_by(self._order_by)  # already an expression
+        elif sampling is not None and sampling.method == "random":
+            stmt = stmt.order_by(func.newid())
+            self.logger.info(f"Randomly sampling {self._sample_size} rows for sample")
+        elif sampling is not None and self._sample_size:
+            # capping a reproducible sample needs a stable order; only the sampled rows get sorted,
+            # by their seeded hash position so the cap keeps a spread of keys, not the lowest ones
+            stmt = stmt.order_by(sampling_order(self._model, method, sampling.seed, dialect))
+
+        if self._sample_size:
+            stmt = stmt.limit(self._sample_size)
+        return stmt
+
+    def _sampling_percent(self, session, dialect: str) -> float:
+        """The configured percent, or enough of the table to cover `sample_size` (LIMIT caps the rest)."""
+        if self._sampling.percent is not None:
+            return self._sampling.percent
+        if not self._sample_size:
+            raise ValueError("Sampling needs either `percent` or `sample_size`")
+
+        total = self._estimate_row_count(session, dialect)
+        if not total:
+            return 100.0
+        # 20% headroom: page-level and per-row draws land either side of the target
+        return min(100.0, self._sample_size / total * 100 * 1.2)
+
+    def _estimate_row_count(self, session, dialect: str) -> int:
+        table = self._model.__table__
+        if dialect == "mssql":
+            # catalogue row count: no scan of the table itself
+            name = f"{table.schema}.{table.name}" if table.schema else table.name
+            count = session.execute(
+                text(
+                    "SELECT SUM(p.rows) FROM sys.partitions p "
+                    "WHERE p.object_id = OBJECT_ID(:name) AND p.index_id IN (0, 1)"
+                ),
+                {"name": name},
+            ).scalar()
+            if count:
+                return int(count)
+        return int(session.execute(select(func.count()).select_from(table)).scalar() or 0)
+
+    def _report_sample(self, rows: int) -> None:
+        self.last_sample_size = rows
+        if self._sampling is None:
+            return
+        target = f" (requested {self._sample_size})" if self._sample_size else ""
+        self.logger.info(f"Achieved sample of {rows} rows from {self._model.__tablename__}{target}")
 
     def fetch_by_game_id(self, game_id: int) -> Optional[Dict[str, Any]]:
         with self._connector.get_session() as session:
@@ -59,3 +176,23 @@ class TableDataExtractor(DataExtractor):
             stmt = select(self._model).filter(getattr(self._model, id_column) == id_value)
             result = session.execute(stmt).scalars().first()
             return result.to_dict() if result else None
+
+
+def _arrow_type(sql_type):
+    """Arrow type for a SQLAlchemy column type, by the Python type it maps to (string if unknown)."""
+    import pyarrow as pa
+
+    try:
+        python_type = sql_type.python_type
+    except NotImplementedError:
+        return pa.string()
+    return {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        decimal.Decimal: pa.float64(),
+        datetime.datetime: pa.timestamp("us"),
+        datetime.date: pa.date32(),
+        datetime.time: pa.time64("us"),
+        bytes: pa.binary(),
+    }.get(python_type, pa.string())
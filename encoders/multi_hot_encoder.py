@@ -2,7 +2,7 @@
 from typing import Any, Iterable, List, Optional, Union
 import numpy as np
 import pandas as pd
-from scipy.sparse import lil_matrix
+from scipy import sparse
 from .base import Encoder
 from logs.logger import get_logger
 
@@ -17,103 +17,105 @@ class MultiHotEncoder(Encoder):
     - sep: separator used when transforming raw string cells (default: ',')
     - dtype: output dtype (default int)
     - handle_unknown: 'ignore' or 'error' when new categories are seen in transform
+    - output: 'sparse' (DataFrame of SparseDtype columns, default) or 'csr' (scipy CSR matrix)
     """
 
-    def __init__(self, sep: str = ',', dtype: Optional[type] = None, handle_unknown: str = 'ignore'):
+    def __init__(
+        self,
+        sep: str = ',',
+        dtype: Optional[type] = None,
+        handle_unknown: str = 'ignore',
+        output: str = 'sparse',
+    ):
+        if output not in ('sparse', 'csr'):
+            raise ValueError(f"output must be 'sparse' or 'csr', got '{output}'")
         self.sep = sep
         self.dtype = dtype
         self.handle_unknown = handle_unknown
+        self.output = output
         self.categories_: List[str] = []
+        self._index = {}
         self._fitted = False
         self.logger = get_logger(self.__class__.__name__)
-        self.logger.info(f"Initialized MultiHotEncoder with sep='{self.sep}', dtype={self.dtype}, handle_unknown='{self.handle_unknown}'")
+        self.logger.info(f"Initialized MultiHotEncoder with sep='{self.sep}', dtype={self.dtype}, handle_unknown='{self.handle_unknown}', output='{self.output}'")
 
     def _split_cell(self, cell):
-        if pd.isna(cell):
-            return []
         if isinstance(cell, (list, tuple, set)):
             return [str(x).strip() for x in cell if x is not None and str(x).strip() != '']
+        if pd.isna(cell):
+            return []
         s = str(cell)
         # split and strip
         parts = [p.strip() for p in s.split(self.sep) if p.strip() != '']
         return parts
 
-    def fit(self, y: Iterable[Any]) -> "MultiHotEncoder":
-        # collect unique category tokens across all cells, preserving order
-        seen = []
+    def _iter_tokens(self, y: Iterable[Any]):
+        """Yield the token list of each cell, splitting each distinct string cell only once."""
+        split_cache = {}
         for cell in y:
-            tokens = self._split_cell(cell)
+            if isinstance(cell, str):
+                tokens = split_cache.get(cell)
+                if tokens is None:
+                    tokens = split_cache[cell] = self._split_cell(cell)
+                yield tokens
+            else:
+                yield self._split_cell(cell)
+
+    def fit(self, y: Iterable[Any]) -> "MultiHotEncoder":
+        # collect unique category tokens across all cells, preserving first-seen order
+        index = {}
+        for tokens in self._iter_tokens(y):
             for t in tokens:
-                if t not in seen:
-                    seen.append(t)
-        self.categories_ = seen
+                if t not in index:
+                    index[t] = len(index)
+        self._index = index
+        self.categories_ = list(index)
         self._fitted = True
         return self
 
-    # def transform(self, y: Iterable[Any]) -> Union[pd.DataFrame, np.ndarray]:
-    #     if not self._fitted:
-    #         raise ValueError("MultiHotEncoder has not been fitted yet. Call fit() first.")
-    #
-    #     # Accept Series for index preservation
-    #     index = None
-    #     name = None
-    #     if isinstance(y, pd.Series):
-    #         index = y.index
-    #         name = y.name or 'feature'
-    #
-    #     # Prepare output array
-    #     values = list(y)
-    #     n = len(values)
-    #     m = len(self.categories_)
-    #     arr = np.zeros((n, m), dtype=self.dtype if self.dtype is not None else int)
-    #     cat_to_idx = {c: i for i, c in enumerate(self.categories_)}
-    #
-    #     for i, cell in enumerate(values):
-    #         tokens = self._split_cell(cell)
-    #         for t in tokens:
-    #             if t not in cat_to_idx:
-    #                 if self.handle_unknown == 'error':
-    #                     raise ValueError(f"Unknown token '{t}' encountered in transform and handle_unknown='error'")
-    #                 else:
-    #                     continue
-    #             arr[i, cat_to_idx[t]] = 1
-    #
-    #     if index is not None:
-    #         colnames = [f"{name}__{c}" for c in self.categories_]
-    #         df = pd.DataFrame(arr, index=index, columns=colnames)
-    #         if self.dtype is not None:
-    #             df = df.astype(self.dtype)
-    #         return df
-    #     return arr
-
-    def transform(self, y: Iterable[Any]) -> pd.DataFrame:
+    def transform_csr(self, y: Iterable[Any]) -> sparse.csr_matrix:
+        """Build the (n_cells x n_categories) indicator matrix directly as CSR.
+
+        One pass collects each row's column indices into flat `indices`/`indptr` arrays;
+        there is no dense or LIL intermediate.
+        """
         if not self._fitted:
             raise ValueError("MultiHotEncoder has not been fitted yet.")
 
-        if not isinstance(y, pd.Series):
-            y = pd.Series(y)
-
-        n = len(y)
-        m = len(self.categories_)
-        name = y.name or "feature"
-
-        cat_to_idx = {c: i for i, c in enumerate(self.categories_)}
-
-        # sparse matrix (LIL is efficient for incremental writes)
-        mat = lil_matrix((n, m), dtype=self.dtype)
-
-        for i, cell in enumerate(y):
-            for t in self._split_cell(cell):
-                idx = cat_to_idx.get(t)
+        index = self._index
+        indptr = [0]
+        indices: List[int] = []
+        for tokens in self._iter_tokens(y):
+            for t in tokens:
+                idx = index.get(t)
                 if idx is None:
                     if self.handle_unknown == "error":
                         raise ValueError(f"Unknown token '{t}'")
                     continue
-                mat[i, idx] = 1
+                indices.append(idx)
+            indptr.append(len(indices))
 
-        # convert to CSR for efficiency
-        mat = mat.tocsr()
+        dtype = np.dtype(self.dtype) if self.dtype is not None else np.float64
+        mat = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=dtype), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, len(self.categories_)),
+        )
+        # a token repeated within a cell is still a single 1
+        mat.sum_duplicates()
+        mat.data[:] = 1
+        return mat
+
+    def transform(self, y: Iterable[Any]) -> Union[pd.DataFrame, sparse.csr_matrix]:
+        """Indicator matrix as a DataFrame of SparseDtype columns (default) or, with
+        `output='csr'`, the raw CSR matrix (columns in `categories_` order)."""
+        mat = self.transform_csr(y)
+        if self.output == "csr":
+            self.logger.info(f"MultiHotEncoder transformed input into CSR matrix with shape {mat.shape} and {mat.nnz} non-zeros")
+            return mat
 
+        if not isinstance(y, pd.Series):
+            y = pd.Series(y)
+        name = y.name or "feature"
         colnames = [f"{name}__{c}" for c in self.categories_]
 
         #pandas sparse DataFrame
@@ -136,18 +138,26 @@ class MultiHotEncoder(Encoder):
         if not self._fitted:
             raise ValueError("MultiHotEncoder has not been fitted yet. Call fit() first.")
 
+        idx = None
         if isinstance(y_enc, pd.DataFrame):
-            arr = y_enc.values
             idx = y_enc.index
-        else:
-            arr = np.asarray(y_enc)
-            idx = None
+            if all(isinstance(dt, pd.SparseDtype) for dt in y_enc.dtypes):
+                y_enc = y_enc.sparse.to_coo()
+            else:
+                y_enc = y_enc.values
 
         out = []
-        for row in arr:
-            ones = np.where(row != 0)[0]
-            tokens = [self.categories_[int(i)] for i in ones]
-            out.append(tokens)
+        if sparse.issparse(y_enc):
+            mat = sparse.csr_matrix(y_enc)
+            mat.eliminate_zeros()
+            mat.sort_indices()
+            for i in range(mat.shape[0]):
+                cols = mat.indices[mat.indptr[i]:mat.indptr[i + 1]]
+                out.append([self.categories_[int(c)] for c in cols])
+        else:
+            for row in np.asarray(y_enc):
+                ones = np.where(row != 0)[0]
+                out.append([self.categories_[int(i)] for i in ones])
 
         if idx is not None:
             return pd.Series(out, index=idx)
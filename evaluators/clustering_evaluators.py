@@ -2,8 +2,9 @@
 import os
 import numpy as np
 import matplotlib.pyplot as plt
-from sklearn.metrics import silhouette_score, silhouette_samples
 from visualisations.factory import VisualisationFactory
+from evaluators.elbow import ElbowSearch
+from evaluators.silhouette import SilhouetteEstimator
 from logs.logger import get_logger
 
 logger = get_logger("ClusteringEvaluator")
@@ -17,6 +18,12 @@ class ClusteringEvaluator:
     assigned `labels` and the `clusterer` wrapper that was used to produce the
     clusters (so elbow can reinstantiate the same wrapper with different
     n_clusters values).
+
+    Elbow params, besides k_min/k_max/step: n_jobs, sample_size, warm_start, patience and
+    random_state (see evaluators.elbow.ElbowSearch).
+
+    Silhouette params go in a `silhouette` block, e.g. {mode: sampled, sample_size: 5000};
+    modes exact (default), chunked, sampled and simplified (see evaluators.silhouette).
     """
 
     def __init__(self, name: str = "clustering", plotter_name: str = "cluster_plot", plotter_params: dict = None, **kwargs):
@@ -84,17 +91,23 @@ class ClusteringEvaluator:
             if len(effective) < 2:
                 self.logger.warning("Silhouette requires >=2 clusters (ignoring -1). Skipping silhouette metrics.")
             else:
-                if "silhouette_average" in metrics:
-                    try:
-                        avg = float(silhouette_score(X_arr, labels))
-                        self.logger.info(f"silhouette_average: {avg:.6f}")
-                        results["silhouette_average"] = avg
-                    except Exception as e:
-                        self.logger.error(f"Error computing silhouette_average: {e}")
+                silhouette = None
+                try:
+                    silhouette = SilhouetteEstimator.from_params(params.get("silhouette")).evaluate(X_arr, labels)
+                except Exception as e:
+                    self.logger.error(f"Error computing silhouette ({params.get('silhouette')}): {e}")
+
+                if "silhouette_average" in metrics and silhouette is not None:
+                    avg = silhouette["average"]
+                    self.logger.info(f"silhouette_average: {avg:.6f}")
+                    results["silhouette_average"] = avg
+                    if silhouette["ci"] is not None:
+                        results["silhouette_ci"] = list(silhouette["ci"])
 
-                if "silhouette_per_point" in metrics:
+                if "silhouette_per_point" in metrics and silhouette is not None:
                     try:
-                        s_vals = silhouette_samples(X_arr, labels)
+                        s_vals = silhouette["values"]
+                        point_labels = silhouette["labels"]
                         #results["silhouette_per_point"] = s_vals.tolist()
 
                         # Create silhouette plot
@@ -103,7 +116,7 @@ class ClusteringEvaluator:
                         # consider clusters in sorted order ignoring -1
                         clusters = sorted(effective)
                         for i, cluster in enumerate(clusters):
-                            ith_vals = s_vals[labels == cluster]
+                            ith_vals = s_vals[point_labels == cluster]
                             ith_vals.sort()
                             size_cluster = ith_vals.shape[0]
                             y_upper = y_lower + size_cluster
@@ -138,47 +151,10 @@ class ClusteringEvaluator:
                     k_max = int(params.get("k_max", 10))
                     step = int(params.get("step", 1))
                     ks = list(range(k_min, k_max + 1, step))
-                    inertias = []
 
-                    # Prepare X array for fitting
                     # Some clusterer wrappers expect DataFrame and convert internally; we will pass numpy
-                    X_fit = X_arr
-
-                    for k in ks:
-                        # create new wrapper instance of same class with same params
-                        cls = clusterer.__class__
-                        # copy params if present
-                        original_params = getattr(clusterer, "params", {})
-                        params_copy = dict(original_params) if isinstance(original_params, dict) else {}
-                        params_copy["n_clusters"] = k
-                        new_clusterer = cls(name=clusterer.name, **params_copy)
-
-                        # build and fit underlying sklearn estimator
-                        if hasattr(new_clusterer, "build"):
-                            new_clusterer.build()
-                        # if the wrapper exposes .model, fit directly
-                        if hasattr(new_clusterer, "model") and new_clusterer.model is not None:
-                            new_clusterer.model.fit(X_fit)
-                            inertia = getattr(new_clusterer.model, "inertia_", None)
-                        else:
-                            # fallback: call fit on wrapper and then inspect model
-                            new_clusterer.fit(X_fit)
-                            inertia = getattr(new_clusterer, "model", None)
-                            inertia = getattr(inertia, "inertia_", None) if inertia is not None else None
-
-                        inertias.append(float(inertia) if inertia is not None else None)
-
-                    # compute elbow via max absolute second derivative where defined
-                    inertias_arr = np.array([i for i in inertias if i is not None])
-                    if inertias_arr.size >= 3:
-                        second_deriv = np.diff(inertias_arr, n=2)
-                        if second_deriv.size > 0:
-                            elbow_idx = int(np.argmax(np.abs(second_deriv))) + 2
-                            best_k = ks[elbow_idx]
-                        else:
-                            best_k = ks[0]
-                    else:
-                        best_k = ks[0]
+                    sweep = ElbowSearch.from_params(params).run(clusterer, X_arr, ks)
+                    ks, inertias, best_k = sweep["ks"], sweep["inertias"], sweep["elbow_k"]
 
                     results["elbow_k"] = int(best_k)
                     results["ks"] = ks
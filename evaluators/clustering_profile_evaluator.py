@@ -1,14 +1,48 @@
 #evaluators/clustering_profile_evaluator.py
 import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
 from logs.logger import get_logger
 
 
+NUMERIC_STATS = ["count", "mean", "median", "std", "min", "max"]
+
+
+def _use_agg_backend():
+    """Plot pool initializer: workers only write files, so they never need a GUI backend."""
+    matplotlib.use("Agg")
+
+
+def _render_boxplot(path, data, tick_labels, title, ylabel=None):
+    """Draw and save one boxplot; module-level so it can run in a worker process."""
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.boxplot(data)
+    # set separately: boxplot's labels= keyword was renamed in newer matplotlib releases
+    ax.set_xticks(range(1, len(data) + 1), [str(t) for t in tick_labels])
+    ax.set_title(title)
+    if ylabel:
+        ax.set_ylabel(ylabel)
+    fig.savefig(path, bbox_inches="tight")
+    plt.close(fig)
+    return path
+
+
 class ClusterProfileEvaluator:
     """
     Profiles clusters using original dataframe.
+
+    All per-cluster statistics come from grouped aggregations over the cluster codes: one
+    groupby for every numeric column, and sparse indicator columns are summarised from their
+    stored values only (never densified). The input frame is not copied.
+
+    params:
+      top_n: 10             # categories kept per categorical column
+      plots: true           # true = render boxplots inline, background = render them in a
+                            # process pool while the summaries are computed, false = skip
+      plot_workers: 4       # pool size for plots: background
     """
 
     def __init__(self, name="cluster_profile", output_dir=".", params=None, plotter_name=None, plotter_params=None):
@@ -17,85 +51,97 @@ class ClusterProfileEvaluator:
         self.logger = get_logger(f"ClusterProfileEvaluator.{name}")
         self.logger.info(f"Initialized ClusterProfileEvaluator '{name}' with output_dir: {output_dir}")
 
-    def _save_fig(self, fig, fname):
-        path = os.path.join(self.output_dir, fname)
-        fig.savefig(path, bbox_inches="tight")
-        plt.close(fig)
-        self.logger.info(f"Saved {path}")
-
     def evaluate(self, df, labels, metrics=None, params=None):
         self.logger.info("Starting cluster profiling evaluation")
         metrics = metrics or []
         params = params or {}
         results = {}
 
-        df = df.copy()
-        df["cluster"] = labels
+        clusters = pd.Series(np.asarray(labels), index=df.index, name="cluster")
+        codes, cluster_ids = pd.factorize(clusters, sort=True)
+        cluster_ids = list(cluster_ids)
 
-        # ---- success metric ----
-        required_cols = {"Total_Reviews", "Review_Score"}
-        if required_cols.issubset(df.columns):
-            df["success_index"] = np.log1p(df["Total_Reviews"]) * df["Review_Score"]
-        else:
-            self.logger.warning(
-                "Missing columns for success_index; skipping success metric"
+        plots = params.get("plots", True)
+        pool = None
+        if plots == "background":
+            pool = ProcessPoolExecutor(
+                max_workers=int(params.get("plot_workers", min(4, os.cpu_count() or 1))),
+                initializer=_use_agg_backend,
             )
-            df["success_index"] = np.nan
-
-        # ---------------- numeric ----------------
-        # exclude sparse numeric columns as they are likely binary indicators and handled separately
-        numeric_cols = [
-            c for c in df.select_dtypes(include=[np.number]).columns
-            if c != "cluster" and not isinstance(df[c].dtype, pd.SparseDtype)
-        ]
-
-        results["numeric_summary"] = {}
-
-        for col in numeric_cols:
-            grp = df.groupby("cluster")[col]
-            stats = grp.agg(["count", "mean", "median", "std", "min", "max"])
-            results["numeric_summary"][col] = stats.to_dict()
-
-            fig, ax = plt.subplots(figsize=(8, 6))
-            data = [df[df.cluster == c][col].dropna() for c in sorted(df.cluster.unique())]
-            ax.boxplot(data, labels=sorted(df.cluster.unique()))
-            ax.set_title(f"{col} by cluster")
-
-            self._save_fig(fig, f"{self.name}_{col}_boxplot.png")
-
-        # ---------------- sparse binary ----------------
-        sparse_cols = [
-            c for c in df.columns
-            if isinstance(df[c].dtype, pd.SparseDtype)
-        ]
-
-        results["binary_sparse_summary"] = {}
+        pending = []
+
+        def boxplot(values: pd.Series, fname, title, ylabel=None):
+            if not plots:
+                return
+            # one stable sort splits the column into per-cluster arrays
+            v = values.to_numpy()
+            order = np.argsort(codes, kind="stable")
+            bounds = np.cumsum(np.bincount(codes, minlength=len(cluster_ids)))[:-1]
+            data = [part[~pd.isna(part)] for part in np.split(v[order], bounds)]
+            path = os.path.join(self.output_dir, fname)
+            if pool is not None:
+                pending.append(pool.submit(_render_boxplot, path, data, cluster_ids, title, ylabel))
+            else:
+                _render_boxplot(path, data, cluster_ids, title, ylabel)
+                self.logger.info(f"Saved {path}")
+
+        try:
+            # ---- success metric ----
+            required_cols = {"Total_Reviews", "Review_Score"}
+            if required_cols.issubset(df.columns):
+                success = np.log1p(df["Total_Reviews"]) * df["Review_Score"]
+            else:
+                self.logger.warning(
+                    "Missing columns for success_index; skipping success metric"
+                )
+                success = pd.Series(np.nan, index=df.index)
+            success = success.rename("success_index")
+
+            # ---------------- numeric ----------------
+            # exclude sparse numeric columns as they are likely binary indicators and handled separately
+            numeric_cols = [
+                c for c in df.select_dtypes(include=[np.number]).columns
+                if c not in ("cluster", "success_index") and not isinstance(df[c].dtype, pd.SparseDtype)
+            ]
+            numeric = pd.concat([df[numeric_cols], success], axis=1)
+
+            results["numeric_summary"] = {}
+            stats = numeric.groupby(clusters).agg(NUMERIC_STATS)
+            for col in numeric.columns:
+                results["numeric_summary"][col] = stats[col].to_dict()
+                if col != success.name:  # plotted with the success summary below
+                    boxplot(numeric[col], f"{self.name}_{col}_boxplot.png", f"{col} by cluster")
+
+            # ---------------- sparse binary ----------------
+            sparse_cols = [
+                c for c in df.columns
+                if isinstance(df[c].dtype, pd.SparseDtype)
+            ]
 
-        for col in sparse_cols:
-            dense = df[col].sparse.to_dense()
-            proportions = dense.groupby(df["cluster"]).mean()
-            results["binary_sparse_summary"][col] = proportions.to_dict()
+            results["binary_sparse_summary"] = {}
 
-        # ---------------- categorical ----------------
-        cat_cols = df.select_dtypes(include=["object", "category"]).columns
-        cat_cols = [c for c in cat_cols if c != "cluster"]
+            cluster_sizes = np.bincount(codes, minlength=len(cluster_ids))
+            for col in sparse_cols:
+                results["binary_sparse_summary"][col] = self._sparse_cluster_means(
+                    df[col].array, codes, cluster_sizes, cluster_ids
+                )
 
-        results["categorical_summary"] = {}
+            # ---------------- categorical ----------------
+            cat_cols = df.select_dtypes(include=["object", "category"]).columns
+            cat_cols = [c for c in cat_cols if c != "cluster"]
 
-        top_n = int(params.get("top_n", 10))
+            results["categorical_summary"] = {}
 
-        for col in cat_cols:
-            counts = df.groupby(["cluster", col]).size().unstack(fill_value=0)
-            top = counts.sum().sort_values(ascending=False).head(top_n).index
-            results["categorical_summary"][col] = counts[top].to_dict()
+            top_n = int(params.get("top_n", 10))
 
-        # ---------------- success summary ----------------
-        results["success_summary"] = {}
-        self.logger.info("Generating success index summary by cluster")
-        if "success_index" in df.columns:
-            grp = df.groupby("cluster")["success_index"]
+            for col in cat_cols:
+                counts = df.groupby([clusters, col]).size().unstack(fill_value=0)
+                top = counts.sum().sort_values(ascending=False).head(top_n).index
+                results["categorical_summary"][col] = counts[top].to_dict()
 
-            summary = grp.agg(
+            # ---------------- success summary ----------------
+            self.logger.info("Generating success index summary by cluster")
+            summary = success.groupby(clusters).agg(
                 count="count",
                 mean="mean",
                 median="median",
@@ -103,35 +149,49 @@ class ClusterProfileEvaluator:
                 min="min",
                 max="max",
             )
-
             results["success_summary"] = summary.to_dict()
-
-            # Boxplot
-            fig, ax = plt.subplots(figsize=(8, 6))
-            data = [
-                df[df.cluster == c]["success_index"].dropna()
-                for c in sorted(df.cluster.unique())
-            ]
-            ax.boxplot(data, labels=sorted(df.cluster.unique()))
-            ax.set_title("Success Index by Cluster")
-            ax.set_ylabel("Success Index")
-
-            self._save_fig(fig, f"{self.name}_success_index_boxplot.png")
+            boxplot(success, f"{self.name}_success_index_boxplot.png", "Success Index by Cluster", "Success Index")
             self.logger.info("Generated success index summary by cluster")
 
-        # Persist CSVs for  interpretation
-        self.logger.info("Saving cluster profile summaries to CSV")
-        self._save_numeric_csv(results["numeric_summary"])
-        self._save_binary_csv(results["binary_sparse_summary"])
-        self._save_categorical_csv(results["categorical_summary"])
+            # Persist CSVs for  interpretation
+            self.logger.info("Saving cluster profile summaries to CSV")
+            self._save_numeric_csv(results["numeric_summary"])
+            self._save_binary_csv(results["binary_sparse_summary"])
+            self._save_categorical_csv(results["categorical_summary"])
 
-        self.logger.info("Saved cluster profile summaries to CSV")
-        if "success_index" in df.columns:
+            self.logger.info("Saved cluster profile summaries to CSV")
             self.logger.info("Saving cluster success ranking to CSV")
-            self._save_cluster_ranking(df)
+            self._save_cluster_ranking(pd.concat([clusters, success], axis=1))
+
+            for future in pending:
+                self.logger.info(f"Saved {future.result()}")
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
 
         return results
 
+    @staticmethod
+    def _sparse_cluster_means(arr, codes, cluster_sizes, cluster_ids):
+        """Per-cluster mean of a SparseArray, skipping NaN like groupby().mean() on the dense
+        column, computed from the stored values plus the count of fill positions."""
+        positions = arr.sp_index.indices
+        values = np.asarray(arr.sp_values, dtype=np.float64)
+        present = ~np.isnan(values)
+        k = len(cluster_ids)
+        stored_codes = codes[positions]
+        total = np.bincount(stored_codes[present], weights=values[present], minlength=k)
+        count = np.bincount(stored_codes[present], minlength=k).astype(np.float64)
+
+        fill = float(arr.fill_value) if not pd.isna(arr.fill_value) else np.nan
+        if not np.isnan(fill):
+            n_fill = cluster_sizes - np.bincount(stored_codes, minlength=k)
+            total += fill * n_fill
+            count += n_fill
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = total / count
+        return {cid: float(m) for cid, m in zip(cluster_ids, means)}
+
     def _save_numeric_csv(self, numeric_summary):
         rows = []
         for feature, stats in numeric_summary.items():
@@ -2,7 +2,8 @@
 import os
 import numpy as np
 import matplotlib.pyplot as plt
-from sklearn.metrics import silhouette_score, silhouette_samples
+from evaluators.elbow import ElbowSearch
+from evaluators.silhouette import SilhouetteEstimator
 from logs.logger import get_logger
 
 
@@ -12,7 +13,10 @@ class ClusteringQualityEvaluator:
     Metrics:
       - silhouette_average
       - silhouette_per_point
-      - elbow
+        (params.silhouette: {mode: exact|chunked|sampled|simplified, sample_size, working_memory_mb};
+        see evaluators.silhouette.SilhouetteEstimator)
+      - elbow (params: k_min, k_max, plus n_jobs, sample_size, warm_start, patience and
+        random_state for the sweep; see evaluators.elbow.ElbowSearch)
     """
 
     def __init__(self, name="clustering_quality", output_dir=".", params=None, plotter_name=None, plotter_params=None):
@@ -48,20 +52,25 @@ class ClusteringQualityEvaluator:
             if len(unique) < 2:
                 self.logger.warning("Silhouette requires >=2 clusters.")
             else:
+                silhouette = SilhouetteEstimator.from_params(params.get("silhouette")).evaluate(X_arr, labels)
+
                 if "silhouette_average" in metrics:
-                    avg = float(silhouette_score(X_arr, labels))
+                    avg = silhouette["average"]
                     results["silhouette_average"] = avg
+                    if silhouette["ci"] is not None:
+                        results["silhouette_ci"] = list(silhouette["ci"])
                     self.logger.info(f"silhouette_average={avg:.4f}")
 
                 if "silhouette_per_point" in metrics:
-                    s_vals = silhouette_samples(X_arr, labels)
+                    s_vals = silhouette["values"]
+                    point_labels = silhouette["labels"]
 
                     fig, ax = plt.subplots(figsize=(8, 6))
                     y_lower = 10
                     clusters = sorted(unique)
 
                     for i, cl in enumerate(clusters):
-                        vals = np.sort(s_vals[labels == cl])
+                        vals = np.sort(s_vals[point_labels == cl])
                         y_upper = y_lower + len(vals)
                         ax.fill_betweenx(
                             np.arange(y_lower, y_upper),
@@ -85,26 +94,9 @@ class ClusteringQualityEvaluator:
             k_max = int(params.get("k_max", 10))
             ks = range(k_min, k_max + 1)
 
-            inertias = []
-            for k in ks:
-                cls = clusterer.__class__
-                p = dict(getattr(clusterer, "params", {}))
-                p["n_clusters"] = k
-
-                new_clusterer = cls(name=clusterer.name, **p)
-                new_clusterer.build()
-                new_clusterer.model.fit(X_arr)
-
-                inertias.append(new_clusterer.model.inertia_)
-
-            # Compute elbow: max absolute second derivative
-            inertias_arr = np.array(inertias)
-            if len(inertias_arr) >= 3:
-                second_deriv = np.diff(inertias_arr, n=2)
-                elbow_idx = int(np.argmax(np.abs(second_deriv))) + 2  # +2 because np.diff reduces array size
-                best_k = ks[elbow_idx]
-            else:
-                best_k = ks[0]
+            sweep = ElbowSearch.from_params(params).run(clusterer, X_arr, ks)
+            ks, inertias, best_k = sweep["ks"], sweep["inertias"], sweep["elbow_k"]
+            results["elbow_k"] = best_k
 
             fig, ax = plt.subplots(figsize=(6, 4))
             ax.plot(list(ks), inertias, marker="o")
@@ -0,0 +1,187 @@
+#evaluators/elbow.py
+import os
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from joblib import Parallel, delayed
+from logs.logger import get_logger
+
+
+def elbow_k(ks: Sequence[int], inertias: Sequence[Optional[float]]) -> int:
+    """k at the maximum absolute second derivative of inertia (first k when undefined)."""
+    inertias_arr = np.array([i for i in inertias if i is not None])
+    if inertias_arr.size >= 3:
+        second_deriv = np.diff(inertias_arr, n=2)
+        elbow_idx = int(np.argmax(np.abs(second_deriv))) + 2  # +2 because np.diff reduces array size
+        return int(ks[elbow_idx])
+    return int(ks[0])
+
+
+def _build_model(clusterer_cls, name: str, params: Dict[str, Any], k: int):
+    p = dict(params)
+    p["n_clusters"] = k
+    wrapper = clusterer_cls(name=name, **p)
+    if hasattr(wrapper, "build"):
+        wrapper.build()
+    return wrapper
+
+
+def _fit_inertia(clusterer_cls, name: str, params: Dict[str, Any], k: int, X) -> Optional[float]:
+    """Fit a fresh copy of the clusterer with n_clusters=k and return its inertia (None if it has none)."""
+    wrapper = _build_model(clusterer_cls, name, params, k)
+    if getattr(wrapper, "model", None) is not None:
+        wrapper.model.fit(X)
+    else:
+        wrapper.fit(X)
+    inertia = getattr(getattr(wrapper, "model", None), "inertia_", None)
+    return float(inertia) if inertia is not None else None
+
+
+class ElbowSearch:
+    """Inertia sweep over k for the elbow method.
+
+    Every k refits a fresh copy of the pipeline's clusterer wrapper (same class and params,
+    `n_clusters=k`). Options, all off by default so the sweep matches the plain loop:
+      - n_jobs:      fit up to n_jobs values of k at once with joblib (-1 = all cores)
+      - sample_size: fit on a seeded random subsample of rows instead of all of X
+      - warm_start:  seed each k from the k-1 centres plus one k-means++ draw, fitting with
+                     n_init=1 (KMeans / MiniBatchKMeans only; runs sequentially)
+      - patience:    stop once the elbow k has not changed for `patience` further values of k
+                     and the inertia curve has flattened after it (see `flat_ratio`)
+    """
+
+    def __init__(
+        self,
+        n_jobs: Optional[int] = 1,
+        sample_size: Optional[int] = None,
+        warm_start: bool = False,
+        patience: Optional[int] = None,
+        random_state: Optional[int] = None,
+        flat_ratio: float = 0.25,
+    ):
+        self.n_jobs = n_jobs or 1
+        self.sample_size = sample_size
+        self.warm_start = warm_start
+        self.patience = patience
+        self.random_state = random_state
+        self.flat_ratio = flat_ratio
+        self.logger = get_logger(self.__class__.__name__)
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> "ElbowSearch":
+        return cls(
+            n_jobs=params.get("n_jobs", 1),
+            sample_size=params.get("sample_size"),
+            warm_start=bool(params.get("warm_start", False)),
+            patience=params.get("patience"),
+            random_state=params.get("random_state"),
+            flat_ratio=params.get("flat_ratio", 0.25),
+        )
+
+    def run(self, clusterer, X, ks: Sequence[int]) -> Dict[str, Any]:
+        """Return {"ks", "inertias", "elbow_k", "stopped_early"} for the values of k actually fitted."""
+        ks = list(ks)
+        params = getattr(clusterer, "params", {})
+        params = dict(params) if isinstance(params, dict) else {}
+        if self.random_state is None:
+            self.random_state = params.get("random_state")
+        X = self._sample(X)
+
+        start = time.perf_counter()
+        if self.warm_start and self._supports_warm_start(clusterer, params, ks):
+            fitted, inertias, stopped = self._run_warm(clusterer, params, X, ks)
+        else:
+            fitted, inertias, stopped = self._run_batches(clusterer, params, X, ks)
+
+        best_k = elbow_k(fitted, inertias)
+        self.logger.info(
+            f"Elbow sweep fitted {len(fitted)}/{len(ks)} values of k on {X.shape[0]} rows in "
+            f"{time.perf_counter() - start:.1f}s (n_jobs={self.n_jobs}, warm_start={self.warm_start}); "
+            f"elbow k={best_k}" + (" (stopped early)" if stopped else "")
+        )
+        return {"ks": fitted, "inertias": inertias, "elbow_k": best_k, "stopped_early": stopped}
+
+    def _sample(self, X):
+        if not self.sample_size or X.shape[0] <= self.sample_size:
+            return X
+        rng = np.random.default_rng(self.random_state)
+        rows = np.sort(rng.choice(X.shape[0], size=int(self.sample_size), replace=False))
+        self.logger.info(f"Elbow sweep on a sample of {len(rows)} of {X.shape[0]} rows")
+        return X[rows]
+
+    def _stable(self, ks: List[int], inertias: List[Optional[float]]) -> bool:
+        """True when the elbow has stayed put for the last `patience` values of k and the curve
+        has flattened since: each of their second differences is at most `flat_ratio` of the
+        elbow's, so a later, sharper bend is unlikely."""
+        if not self.patience or len(ks) < 3 + self.patience or any(i is None for i in inertias):
+            return False
+        current = elbow_k(ks, inertias)
+        if any(elbow_k(ks[:n], inertias[:n]) != current for n in range(len(ks) - self.patience, len(ks))):
+            return False
+        second_deriv = np.abs(np.diff(np.asarray(inertias), n=2))
+        return bool(np.all(second_deriv[-self.patience:] <= self.flat_ratio * second_deriv.max()))
+
+    def _run_batches(self, clusterer, params, X, ks):
+        # with patience, one batch of n_jobs values of k at a time so the sweep can stop early
+        batch = max(1, self._workers()) if self.patience else len(ks)
+        fitted: List[int] = []
+        inertias: List[Optional[float]] = []
+        with Parallel(n_jobs=self.n_jobs) as parallel:
+            for i in range(0, len(ks), batch):
+                chunk = ks[i:i + batch]
+                if self.n_jobs == 1:
+                    results = [_fit_inertia(clusterer.__class__, clusterer.name, params, k, X) for k in chunk]
+                else:
+                    results = parallel(
+                        delayed(_fit_inertia)(clusterer.__class__, clusterer.name, params, k, X) for k in chunk
+                    )
+                for k, inertia in zip(chunk, results):
+                    fitted.append(k)
+                    inertias.append(inertia)
+                    self.logger.info(f"k={k}: inertia={inertia}")
+                if i + batch < len(ks) and self._stable(fitted, inertias):
+                    return fitted, inertias, True
+        return fitted, inertias, False
+
+    def _workers(self) -> int:
+        cpus = os.cpu_count() or 1
+        return cpus + 1 + self.n_jobs if self.n_jobs < 0 else self.n_jobs
+
+    def _supports_warm_start(self, clusterer, params, ks) -> bool:
+        model = getattr(_build_model(clusterer.__class__, clusterer.name, params, ks[0]), "model", None)
+        if model is None or "init" not in model.get_params() or not hasattr(model, "transform"):
+            self.logger.warning(f"warm_start needs a KMeans-style estimator; {type(model).__name__} refits from scratch")
+            return False
+        return True
+
+    def _run_warm(self, clusterer, params, X, ks):
+        rng = np.random.default_rng(self.random_state)
+        fitted: List[int] = []
+        inertias: List[Optional[float]] = []
+        previous = None
+        for i, k in enumerate(ks):
+            model = _build_model(clusterer.__class__, clusterer.name, params, k).model
+            if previous is not None:
+                model.set_params(init=self._grow_centers(previous, X, k, rng), n_init=1)
+            model.fit(X)
+            previous = model
+            fitted.append(k)
+            inertias.append(float(model.inertia_))
+            self.logger.info(f"k={k}: inertia={inertias[-1]} (warm start)")
+            if i + 1 < len(ks) and self._stable(fitted, inertias):
+                return fitted, inertias, True
+        return fitted, inertias, False
+
+    @staticmethod
+    def _grow_centers(model, X, k, rng) -> np.ndarray:
+        """Keep the fitted centres and add k - len(centres) k-means++ draws (D^2 weighting)."""
+        centers = np.asarray(model.cluster_centers_, dtype=np.float64)
+        d2 = model.transform(X).min(axis=1) ** 2
+        while centers.shape[0] < k:
+            total = d2.sum()
+            idx = rng.choice(X.shape[0], p=d2 / total) if total > 0 else int(rng.integers(X.shape[0]))
+            new = np.asarray(X[idx], dtype=np.float64).reshape(1, -1)
+            centers = np.vstack([centers, new])
+            d2 = np.minimum(d2, ((X - new) ** 2).sum(axis=1))
+        return centers
@@ -0,0 +1,169 @@
+#evaluators/silhouette.py
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+from scipy import sparse
+from sklearn.metrics import pairwise_distances, silhouette_samples
+from logs.logger import get_logger
+
+SILHOUETTE_MODES = ("exact", "chunked", "sampled", "simplified")
+
+
+class SilhouetteEstimator:
+    """Silhouette coefficients for large clusterings.
+
+    Modes (labels are used as given, so a noise label such as -1 counts as its own cluster,
+    as in sklearn):
+      - exact:      sklearn's silhouette_samples on all points
+      - chunked:    the same values, computed block by block: each block of points gets its
+                    distances to all of X, reduced straight to per-cluster sums, so memory is
+                    bounded by `working_memory_mb` instead of growing with n^2
+      - sampled:    a stratified sample of `sample_size` points (allocated to clusters in
+                    proportion to their size, at least 2 per cluster where possible), each
+                    scored exactly against all of X; the average is the stratified estimate
+                    with a 95% confidence interval
+      - simplified: centroid-based: distance to the own centroid versus the nearest other
+                    centroid, O(n * k) instead of O(n^2)
+
+    `evaluate` returns {"mode", "average", "ci", "values", "labels", "n_points", "seconds"};
+    `values`/`labels` are per point for the points actually scored (the sample in sampled mode).
+    """
+
+    def __init__(
+        self,
+        mode: str = "exact",
+        sample_size: int = 5000,
+        working_memory_mb: int = 256,
+        metric: str = "euclidean",
+        random_state: Optional[int] = None,
+    ):
+        if mode not in SILHOUETTE_MODES:
+            raise ValueError(f"Unknown silhouette mode '{mode}'. Use one of {SILHOUETTE_MODES}")
+        self.mode = mode
+        self.sample_size = int(sample_size)
+        self.working_memory_mb = working_memory_mb
+        self.metric = metric
+        self.random_state = random_state
+        self.logger = get_logger(self.__class__.__name__)
+
+    @classmethod
+    def from_params(cls, params: Optional[Dict[str, Any]]) -> "SilhouetteEstimator":
+        """Build from an evaluator's `silhouette` params block (missing block = exact)."""
+        params = params or {}
+        return cls(
+            mode=params.get("mode", "exact"),
+            sample_size=params.get("sample_size", 5000),
+            working_memory_mb=params.get("working_memory_mb", 256),
+            metric=params.get("metric", "euclidean"),
+            random_state=params.get("random_state"),
+        )
+
+    def evaluate(self, X, labels) -> Dict[str, Any]:
+        labels = np.asarray(labels)
+        start = time.perf_counter()
+        ci = None
+        if self.mode == "exact":
+            values, scored = silhouette_samples(X, labels, metric=self.metric), labels
+            average = float(np.mean(values))
+        elif self.mode == "chunked":
+            values, scored = self._point_values(X, labels, np.arange(X.shape[0])), labels
+            average = float(np.mean(values))
+        elif self.mode == "sampled":
+            values, scored, average, ci = self._sampled(X, labels)
+        else:
+            values, scored = self._simplified(X, labels), labels
+            average = float(np.mean(values))
+
+        seconds = time.perf_counter() - start
+        self.logger.info(
+            f"Silhouette ({self.mode}) over {len(values)} of {len(labels)} points: {average:.4f}"
+            + (f" (95% CI {ci[0]:.4f}..{ci[1]:.4f})" if ci else "") + f" in {seconds:.1f}s"
+        )
+        return {
+            "mode": self.mode,
+            "average": average,
+            "ci": ci,
+            "values": values,
+            "labels": scored,
+            "n_points": int(len(values)),
+            "seconds": seconds,
+        }
+
+    def _point_values(self, X, labels: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Exact silhouette of X[rows] against all of X, one bounded block of rows at a time."""
+        clusters, codes = np.unique(labels, return_inverse=True)
+        counts = np.bincount(codes, minlength=len(clusters)).astype(np.float64)
+        onehot = sparse.csr_matrix(
+            (np.ones(len(codes)), (np.arange(len(codes)), codes)), shape=(len(codes), len(clusters))
+        )
+        # float64 distance rows: block * n * 8 bytes within the memory budget
+        block = max(1, int(self.working_memory_mb * 2 ** 20 // (8 * max(X.shape[0], 1))))
+
+        out = np.empty(len(rows), dtype=np.float64)
+        for i in range(0, len(rows), block):
+            idx = rows[i:i + block]
+            # per-cluster distance sums for each point in the block: (block x n) @ (n x k)
+            sums = np.asarray((onehot.T @ pairwise_distances(X, X[idx], metric=self.metric)).T)
+            own = codes[idx]
+            own_count = counts[own] - 1
+            with np.errstate(divide="ignore", invalid="ignore"):
+                a = sums[np.arange(len(idx)), own] / own_count
+                mean_other = sums / counts
+            mean_other[np.arange(len(idx)), own] = np.inf
+            b = mean_other.min(axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                s = (b - a) / np.maximum(a, b)
+            # singletons score 0, as in sklearn
+            s[own_count == 0] = 0.0
+            out[i:i + len(idx)] = np.nan_to_num(s)
+        return out
+
+    def _sampled(self, X, labels: np.ndarray):
+        rng = np.random.default_rng(self.random_state)
+        clusters, codes = np.unique(labels, return_inverse=True)
+        sizes = np.bincount(codes)
+        n = len(labels)
+        if self.sample_size >= n:
+            values = self._point_values(X, labels, np.arange(n))
+            average = float(np.mean(values))
+            return values, labels, average, (average, average)
+
+        # proportional allocation, at least 2 per cluster (or the whole cluster if smaller)
+        alloc = np.maximum(np.minimum(sizes, 2), np.floor(self.sample_size * sizes / n).astype(int))
+        alloc = np.minimum(alloc, sizes)
+        rows = np.concatenate([
+            rng.choice(np.flatnonzero(codes == c), size=int(alloc[c]), replace=False)
+            for c in range(len(clusters)) if alloc[c] > 0
+        ])
+        rows.sort()
+        values = self._point_values(X, labels, rows)
+
+        # stratified mean and standard error (with finite population correction)
+        sample_codes = codes[rows]
+        weights = sizes / n
+        average = 0.0
+        variance = 0.0
+        for c in range(len(clusters)):
+            v = values[sample_codes == c]
+            if len(v) == 0:
+                continue
+            average += weights[c] * v.mean()
+            if len(v) > 1:
+                variance += weights[c] ** 2 * v.var(ddof=1) / len(v) * (1 - len(v) / sizes[c])
+        half = 1.96 * float(np.sqrt(variance))
+        return values, labels[rows], float(average), (float(average) - half, float(average) + half)
+
+    def _simplified(self, X, labels: np.ndarray) -> np.ndarray:
+        clusters, codes = np.unique(labels, return_inverse=True)
+        if len(clusters) < 2:
+            return np.zeros(len(labels))
+        centroids = np.vstack([np.asarray(X[codes == c].mean(axis=0)).ravel() for c in range(len(clusters))])
+        d = pairwise_distances(X, centroids, metric=self.metric)
+        rows = np.arange(len(codes))
+        a = d[rows, codes].copy()
+        d[rows, codes] = np.inf
+        b = d.min(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s = (b - a) / np.maximum(a, b)
+        return np.nan_to_num(s)
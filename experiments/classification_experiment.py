@@ -11,10 +11,45 @@ from typing import Optional, Dict, List, Any
 from sklearn.model_selection import KFold, StratifiedKFold
 import numpy as np
 from vectorizers.factory import VectorizerFactory
+from vectorizers.cache import fit_transform_cached
+from utils.stage_cache import StageCache
 from mlflow.models import infer_signature
 from visualisations.factory import VisualisationFactory
 from samplers.factory import SamplerFactory
 from collections import Counter
+from joblib import Parallel, delayed
+
+
+def _class_balanced_weights(y):
+    """Per-sample weights inversely proportional to class frequency."""
+    counter = Counter(y)
+    num_classes = len(counter)
+    total_samples = len(y)
+
+    class_weights = {
+        c: total_samples / (num_classes * count)
+        for c, count in counter.items()
+    }
+    return np.array([class_weights[label] for label in y])
+
+
+def _fit_fold(model, sampler, evaluator, calculate_sample_weights, X, y, train_idx, val_idx):
+    """Fit and score one cross-validation fold. Runs in a joblib worker, so it only
+    returns results: (metrics, y_val, y_pred). Logging to MLflow is left to the parent."""
+    X_train_fold, X_val_fold = X[train_idx], X[val_idx]
+    y_train_fold, y_val_fold = y[train_idx], y[val_idx]
+
+    # --- Apply sampler inside fold ---
+    if sampler is not None:
+        X_train_fold, y_train_fold = sampler.fit_resample(X_train_fold, y_train_fold)
+
+    if calculate_sample_weights:
+        model.fit(X_train_fold, y_train_fold, sample_weight=_class_balanced_weights(y_train_fold))
+    else:
+        model.fit(X_train_fold, y_train_fold)
+
+    y_pred = model.predict(X_val_fold)
+    return evaluator.evaluate(y_val_fold, y_pred), y_val_fold, y_pred
 
 
 class ClassificationExperiment(Experiment):
@@ -67,6 +102,7 @@ class ClassificationExperiment(Experiment):
         self.vectorizer_name = self.vectorizer.get("vectorizer_name")
         self.vectorizer_field = self.vectorizer.get("vectorizer_field")
         self.vectorizer_params = self.vectorizer.get("vectorizer_params", {})
+        self.vectorizer_cache = StageCache.from_config(self.vectorizer.get("cache"))
 
         self.visualisations = visualisations or []
 
@@ -91,7 +127,7 @@ class ClassificationExperiment(Experiment):
         self.model_params = (model_params or {}).copy()
         for k, v in kwargs.items():
             if k not in ["cv_enabled", "cv_folds", "cv_shuffle", "cv_random_state",
-                         "cv_stratified", "visualisations", "vectorizer"]:
+                         "cv_stratified", "cv_n_jobs", "visualisations", "vectorizer"]:
                 self.model_params.setdefault(k, v)
 
         self.logger.info(f"Model params resolved: {self.model_params}")
@@ -102,6 +138,8 @@ class ClassificationExperiment(Experiment):
         self.cv_stratified = kwargs.get("cv_stratified", True)
         self.cv_shuffle = kwargs.get("cv_shuffle", True)
         self.cv_random_state = kwargs.get("cv_random_state", 42)
+        # folds fitted in parallel (joblib semantics: -1 = all cores); 1 keeps them in-process
+        self.cv_n_jobs = kwargs.get("cv_n_jobs", 1)
 
         # Initializing model/evaluator
         self.model = ModelFactory.get_model(self.model_name, **self.model_params)
@@ -126,8 +164,18 @@ class ClassificationExperiment(Experiment):
                     self.vectorizer_name,
                     **self.vectorizer_params
                 )
-                X_train = vectorizer.fit_transform(X_train.fillna(""))  # Fit on training set
-                X_test = vectorizer.transform(X_test.fillna(""))  # Transform on test set
+                if self.vectorizer_cache is not None:
+                    # reuse the train/test matrices when neither the split nor the vectorizer config changed
+                    vectorizer, (X_train, X_test) = fit_transform_cached(
+                        vectorizer,
+                        self.vectorizer_cache,
+                        {"vectorizer_name": self.vectorizer_name, "vectorizer_params": self.vectorizer_params},
+                        X_train.fillna(""),
+                        X_test.fillna(""),
+                    )
+                else:
+                    X_train = vectorizer.fit_transform(X_train.fillna(""))  # Fit on training set
+                    X_test = vectorizer.transform(X_test.fillna(""))  # Transform on test set
 
 
             self._log_mlflow_params()
@@ -235,54 +283,36 @@ class ClassificationExperiment(Experiment):
             splitter = KFold(n_splits=self.cv_folds, shuffle=self.cv_shuffle, random_state=self.cv_random_state)
 
         fold_metrics = {metric: [] for metric in self.metrics}
-        fold_index = 1
         X = X.to_numpy() if hasattr(X, "to_numpy") else X
         y = y.to_numpy() if hasattr(y, "to_numpy") else y
 
-        for train_idx, val_idx in splitter.split(X, y):
-            self.logger.info(f"Fold {fold_index}/{self.cv_folds}")
-
-            X_train_fold, X_val_fold = X[train_idx], X[val_idx]
-            y_train_fold, y_val_fold = y[train_idx], y[val_idx]
-
-            # --- Apply sampler inside fold ---
-            if self.sampler is not None:
-                self.logger.info(f"Applying sampler '{self.sampler_name}' to training fold")
-                X_train_fold, y_train_fold = self.sampler.fit_resample(X_train_fold, y_train_fold)
-
-            # Recreate a fresh model each fold
-            model = ModelFactory.get_model(self.model_name, **self.model_params)
-
-            # refactor this later to make it safer - we should check if the model supports sample weights using hasattr or similar
-            # Compute sample weights for this fold
-            if self.calculate_sample_weights:
-                fold_weights = self._compute_sample_weights(y_train_fold)
-                fit_kwargs = {}
-                if fold_weights is not None:
-                    fit_kwargs['sample_weight'] = fold_weights
-                self.logger.info(f"Fitting model with sample weights for fold {fold_index}")
-                model.fit(X_train_fold, y_train_fold, **fit_kwargs)
-            else:
-                self.logger.info(f"Fitting model without sample weights for fold {fold_index}")
-                model.fit(X_train_fold, y_train_fold)
-
-
-
-            #model.fit(X_train_fold, y_train_fold)
-            #model.fit(X_train_fold, y_train_fold, **fit_kwargs)
-
-            y_pred = model.predict(X_val_fold)
-            current_res = self.evaluator.evaluate(y_val_fold, y_pred)
-
-            # Store metrics
+        # Fresh model per fold, built here so the workers never need the model registry.
+        # Folds are fitted on a loky process pool; X and y are shared with the workers
+        # (large arrays are memory-mapped by joblib) and each worker slices its own fold.
+        folds = list(splitter.split(X, y))
+        jobs = (
+            delayed(_fit_fold)(
+                ModelFactory.get_model(self.model_name, **self.model_params),
+                self.sampler,
+                self.evaluator,
+                self.calculate_sample_weights,
+                X, y, train_idx, val_idx,
+            )
+            for train_idx, val_idx in folds
+        )
+        self.logger.info(f"Fitting {len(folds)} folds with cv_n_jobs={self.cv_n_jobs}")
+        fold_results = Parallel(n_jobs=self.cv_n_jobs, backend="loky")(jobs)
+
+        # MLflow logging and visualisations stay in the parent, where the active run lives
+        for fold_index, (current_res, y_val_fold, y_pred) in enumerate(fold_results, start=1):
+            self.logger.info(f"Fold {fold_index}/{self.cv_folds}: {current_res}")
             for m in self.metrics:
                 fold_metrics[m].append(current_res[m])
                 mlflow.log_metric(f"fold_{fold_index}_{m}", current_res[m])
 
-            fold_index += 1
-            # Generate and log visualisations
-            self.logger.info(f"Generating visualisations for fold {fold_index - 1}")
-            self._generate_visualisations(y_val_fold, y_pred, fold=fold_index - 1)
+        for fold_index, (_, y_val_fold, y_pred) in enumerate(fold_results, start=1):
+            self.logger.info(f"Generating visualisations for fold {fold_index}")
+            self._generate_visualisations(y_val_fold, y_pred, fold=fold_index)
 
         # Compute average CV metrics
         averaged_metrics = {m: float(sum(vals) / len(vals)) for m, vals in fold_metrics.items()}
@@ -386,6 +416,7 @@ class ClassificationExperiment(Experiment):
         mlflow.log_param("cv_stratified", self.cv_stratified)
         mlflow.log_param("cv_shuffle", self.cv_shuffle)
         mlflow.log_param("cv_random_state", self.cv_random_state)
+        mlflow.log_param("cv_n_jobs", self.cv_n_jobs)
 
 
 
@@ -493,17 +524,4 @@ class ClassificationExperiment(Experiment):
         self.logger.info(f"Updated sampler strategy: {numeric_strategy}")
 
     def _compute_sample_weights(self, y):
-        counter = Counter(y)
-        classes = list(counter.keys())
-        counts = np.array(list(counter.values()))
-
-        total_samples = len(y)
-        num_classes = len(classes)
-
-        class_weights = {
-            c: total_samples / (num_classes * count)
-            for c, count in counter.items()
-        }
-
-        sample_weights = np.array([class_weights[label] for label in y])
-        return sample_weights
\ No newline at end of file
+        return _class_balanced_weights(y)
@@ -1,10 +1,7 @@
-import time
 from typing import List, Dict, Optional, Iterable
-import requests
 from logs.logger import get_logger
 from .base import Fetcher
 
-REQUEST_DELAY = 1.0
 BASE_URL = "https://www.boards.ie/api/v2/comments"
 
 
@@ -42,21 +39,15 @@ class BoardsCommentsFetcher(Fetcher):
             elif date_start:
                 params["dateInserted"] = f"[{date_start},{date_start}]"
 
-            resp = requests.get(
+            resp = self.context.client.get(
                 BASE_URL,
                 params=params,
                 timeout=self.context.timeout,
                 headers=self.context.headers,
             )
 
-            if resp.status_code == 429:
-                self.logger.warning("Rate limited – backing off")
-                time.sleep(10)
-                continue
-
             resp.raise_for_status()
             batch = resp.json()
-            time.sleep(REQUEST_DELAY)
 
             if not batch:
                 break
@@ -1,11 +1,27 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import time
-from typing import List, Dict, Optional
-import requests
+from typing import Iterator, List, Dict, Optional, Tuple
 from logs.logger import get_logger
 from .base import Fetcher
-REQUEST_DELAY = 1.0  # seconds
 BASE_URL = "https://www.boards.ie/api/v2/discussions"
+QUEUE_BATCHES_PER_WORKER = 4  # fetched pages buffered per worker before workers wait for the consumer
+_DONE = object()
+
+
+def date_range(start_date: Optional[str], end_date: Optional[str] = None) -> List[Optional[str]]:
+    """ISO dates from start_date to end_date inclusive; [start_date] without an end, [None] without a start."""
+    if start_date and end_date:
+        start = datetime.fromisoformat(start_date)
+        end = datetime.fromisoformat(end_date)
+        return [
+            (start + timedelta(days=i)).date().isoformat()
+            for i in range((end - start).days + 1)
+        ]
+    if start_date:
+        return [start_date]
+    return [None]
 
 
 class BoardsFetcher(Fetcher):
@@ -21,57 +37,121 @@ class BoardsFetcher(Fetcher):
         limit: int = 50,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        concurrency: Optional[int] = None,
     ):
-        """Generator yielding batches of discussions from the API."""
-        if start_date and end_date:
-            start = datetime.fromisoformat(start_date)
-            end = datetime.fromisoformat(end_date)
-            dates = [
-                (start + timedelta(days=i)).date().isoformat()
-                for i in range((end - start).days + 1)
-            ]
-        elif start_date:
-            dates = [start_date]
-        else:
-            dates = [None]
+        """Generator yielding batches of discussions from the API.
+
+        With `concurrency` (or `context.concurrency`) above 1 and more than one day in the
+        range, days are crawled by a pool of that many workers and batches are yielded as
+        they arrive (so not in date order) through a bounded queue: the consumer saves while
+        the workers keep fetching. Request pacing is left to the context's HttpClient.
+        """
+        dates = date_range(start_date, end_date)
+        for _, batch in self.fetch_days(category_id, limit, dates, concurrency):
+            if batch is not None:
+                yield batch
+
+    def fetch_days(
+        self,
+        category_id: int,
+        limit: int,
+        dates: List[Optional[str]],
+        concurrency: Optional[int] = None,
+    ) -> Iterator[Tuple[Optional[str], Optional[List[Dict]]]]:
+        """Generator of `(day, batch)` pairs, then `(day, None)` once every page of `day` was yielded.
+
+        The end-of-day marker lets a caller checkpoint each day as soon as its last batch is
+        saved, also when days are crawled concurrently and their batches interleave.
+        """
+        concurrency = concurrency or self.context.concurrency
+        if concurrency > 1 and len(dates) > 1:
+            yield from self._crawl_days(category_id, limit, dates, concurrency)
+            return
 
         for date in dates:
-            page = 1
-            self.logger.info(f"Fetching discussions for dateLastComment={date}")
-
-            while True:
-                params = {
-                    "CategoryID": category_id,
-                    "limit": limit,
-                    "page": page,
-                }
-                if date:
-                    params["dateLastComment"] = date
-
-                resp = requests.get(
-                    BASE_URL,
-                    params=params,
-                    timeout=self.context.timeout,
-                    headers=self.context.headers,
-                )
-
-                if resp.status_code == 429:
-                    self.logger.warning("Rate limited – backing off")
-                    time.sleep(10)
-                    continue
+            for batch in self._day_batches(category_id, limit, date):
+                yield date, batch
+            yield date, None
 
-                resp.raise_for_status()
-                batch = resp.json()
-                time.sleep(REQUEST_DELAY)
+    def _day_batches(self, category_id: int, limit: int, date: Optional[str]) -> Iterator[List[Dict]]:
+        """Pages of discussions whose last comment falls on `date`, fetched one after another."""
+        page = 1
+        self.logger.info(f"Fetching discussions for dateLastComment={date}")
 
-                if not batch:
-                    break
+        while True:
+            params = {
+                "CategoryID": category_id,
+                "limit": limit,
+                "page": page,
+            }
+            if date:
+                params["dateLastComment"] = date
 
-                yield batch
+            resp = self.context.client.get(
+                BASE_URL,
+                params=params,
+                timeout=self.context.timeout,
+                headers=self.context.headers,
+            )
+
+            resp.raise_for_status()
+            batch = resp.json()
+
+            if not batch:
+                break
+
+            yield batch
+
+            if len(batch) < limit:
+                break
+            page += 1
+
+    def _crawl_days(
+        self, category_id: int, limit: int, dates: List[str], concurrency: int
+    ) -> Iterator[Tuple[str, Optional[List[Dict]]]]:
+        workers = min(concurrency, len(dates))
+        self.logger.info(f"Crawling {len(dates)} days with {workers} workers")
+        batches: queue.Queue = queue.Queue(maxsize=workers * QUEUE_BATCHES_PER_WORKER)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            # wait for room, but give up once the consumer has gone away
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def crawl(date: str) -> None:
+            try:
+                for batch in self._day_batches(category_id, limit, date):
+                    if not put((date, batch)):
+                        return
+                put((date, None))
+            except Exception as e:
+                put(e)
+            finally:
+                put(_DONE)
 
-                if len(batch) < limit:
-                    break
-                page += 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for date in dates:
+                executor.submit(crawl, date)
+            try:
+                remaining = len(dates)
+                while remaining:
+                    item = batches.get()
+                    if item is _DONE:
+                        remaining -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                # on an error or an abandoned generator, let queued days exit without fetching
+                stop.set()
+                executor.shutdown(wait=True, cancel_futures=True)
 
     def fetch(
         self,
@@ -1,10 +1,11 @@
 #fetchers/context.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
+from utils.http_client import HttpClient
 
 @dataclass
 class FetcherContext:
-    """Context for fetchers, holding common parameters."""
+    """Context for fetchers, holding common parameters and the shared HTTP client."""
     api_key: Optional[str] = None
     timeout: int = 10  # Default timeout for HTTP requests in seconds
     retries: int = 3  # Default number of retries for HTTP requests
@@ -13,3 +14,18 @@ class FetcherContext:
     user_agent: Optional[str] = "DataFetcher/1.0"  # Default User-Agent header
     proxy: Optional[str] = None  # Proxy URL if needed
     headers: Optional[dict] = None  # Additional headers for requests
+    concurrency: int = 1  # Max concurrent page requests for fetchers that paginate by skip offset
+    rate_limits: Optional[dict] = None  # Per-host (calls, period_seconds) overrides; defaults in utils.http_client
+    adaptive_rate_limits: Optional[dict] = None  # Per-host ceilings (requests/s) for adaptive rates; defaults in utils.http_client
+    client: Optional[HttpClient] = field(default=None, repr=False)  # Shared pooled client; built from the fields above if not given
+
+    def __post_init__(self):
+        if self.client is None:
+            self.client = HttpClient(
+                rate_limits=self.rate_limits,
+                default_rate_limit=self.rate_limit,
+                retries=self.retries,
+                pool_maxsize=max(10, self.concurrency),
+                proxy=self.proxy,
+                adaptive_rate_limits=self.adaptive_rate_limits,
+            )
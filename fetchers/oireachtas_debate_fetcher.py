@@ -1,18 +1,30 @@
 # fetchers/oireachtas_debate_fetcher.py
 import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
 from logs.logger import get_logger
 from .base import Fetcher
+from .pagination import fetch_offsets_concurrently, remaining_offsets
 
 BASE_URL = "https://api.oireachtas.ie/v1/debates"
 
 
 class OireachtasDebateFetcher(Fetcher):
+    MAX_RETRIES = 5
+
     def __init__(self, context):
         super().__init__(context)
         self.logger = get_logger(self.__class__.__name__)
+        # skip offsets of the last fetch whose page was not retrieved; non-empty means partial
+        self.last_dropped_offsets: List[int] = []
+
+    def fetch(self, date: str, limit: int = 50, concurrency: Optional[int] = None) -> List[Dict]:
+        """Fetch all debate records for a date.
 
-    def fetch(self, date: str, limit: int = 50) -> List[Dict]:
+        With `concurrency` (or `context.concurrency`) above 1, the remaining skip offsets after
+        the first page are fetched on a bounded thread pool and reassembled in order.
+        """
+        concurrency = concurrency or self.context.concurrency
+        self.last_dropped_offsets = []
         results = []
         skip = 0
         total_expected = None
@@ -24,15 +36,11 @@ class OireachtasDebateFetcher(Fetcher):
                 "skip": skip,
             }
 
-            resp = requests.get(
-                BASE_URL,
-                params=params,
-                timeout=self.context.timeout,
-                headers=self.context.headers,
-            )
+            resp = self._get(params)
 
             if resp.status_code == 500:
                 self.logger.warning(f"500 error at skip={skip}, stopping debates fetch")
+                self.last_dropped_offsets.append(skip)
                 break
 
             resp.raise_for_status()
@@ -65,6 +73,16 @@ class OireachtasDebateFetcher(Fetcher):
             results.extend(batch)
             skip += limit
 
+            if concurrency > 1 and skip < total_expected:
+                offsets = remaining_offsets(total_expected, limit)
+                self.logger.info(f"Fetching {len(offsets)} remaining pages with concurrency={concurrency}")
+                results.extend(fetch_offsets_concurrently(
+                    lambda offset: self._fetch_page({**params, "skip": offset}),
+                    offsets,
+                    concurrency,
+                ))
+                break
+
             # --- authoritative stop condition ---
             if skip >= total_expected:
                 self.logger.info(
@@ -83,3 +101,22 @@ class OireachtasDebateFetcher(Fetcher):
             )
 
         return results
+
+    def _get(self, params: Dict) -> requests.Response:
+        return self.context.client.get(
+            BASE_URL,
+            params=params,
+            timeout=self.context.timeout,
+            headers=self.context.headers,
+            retries=self.MAX_RETRIES,
+        )
+
+    def _fetch_page(self, params: Dict) -> Optional[List[Dict]]:
+        """Fetch a single skip offset for the concurrent path."""
+        resp = self._get(params)
+        if resp.status_code == 500:
+            self.logger.warning(f"500 error at skip={params['skip']}, page skipped")
+            self.last_dropped_offsets.append(params["skip"])
+            return None
+        resp.raise_for_status()
+        return resp.json().get("results", [])
@@ -1,5 +1,4 @@
 # fetchers/oireachtas_party_fetcher.py
-import requests
 import time
 from typing import List, Dict, Generator
 from logs.logger import get_logger
@@ -10,7 +9,6 @@ class OireachtasPartyFetcher(Fetcher):
     BASE_URL = "https://api.oireachtas.ie/v1/parties"
     MAX_SKIP = 200000
     MAX_RETRIES = 5
-    RETRY_SLEEP = 2  # seconds
 
     def __init__(self, context):
         super().__init__(context)
@@ -42,24 +40,13 @@ class OireachtasPartyFetcher(Fetcher):
                 "skip": skip,
             }
 
-            # perform request with retry logic
-            resp = None
-            for attempt in range(1, self.MAX_RETRIES + 1):
-                try:
-                    resp = requests.get(
-                        self.BASE_URL,
-                        params=params,
-                        timeout=self.context.timeout,
-                        headers=self.context.headers,
-                    )
-                    break
-                except requests.exceptions.RequestException as e:
-                    self.logger.warning(
-                        f"Request failed (attempt {attempt}/{self.MAX_RETRIES}): {e}"
-                    )
-                    if attempt == self.MAX_RETRIES:
-                        raise
-                    time.sleep(self.RETRY_SLEEP)
+            resp = self.context.client.get(
+                self.BASE_URL,
+                params=params,
+                timeout=self.context.timeout,
+                headers=self.context.headers,
+                retries=self.MAX_RETRIES,
+            )
 
             if resp is None:
                 # Shouldn't happen, but guard for static analysis and safety
@@ -1,9 +1,9 @@
 # fetchers/oireachtas_question_fetcher.py
 import requests
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional
 from logs.logger import get_logger
 from .base import Fetcher
-import time
+from .pagination import iter_offsets_concurrently, remaining_offsets
 
 
 
@@ -11,11 +11,14 @@ class OireachtasQuestionFetcher(Fetcher):
     BASE_URL = "https://api.oireachtas.ie/v1/questions"
     MAX_SKIP = 20000
     MAX_RETRIES = 5
-    RETRY_SLEEP = 2  # seconds
 
     def __init__(self, context):
         super().__init__(context)
         self.last_expected_count = None
+        # skip offsets of the last fetch whose page was not retrieved (500s, skip cap);
+        # non-empty means the result is partial. A serial fetch stops at its first 500,
+        # so only that offset is listed.
+        self.last_dropped_offsets: List[int] = []
         self.logger = get_logger(self.__class__.__name__)
 
     def fetch(
@@ -25,14 +28,44 @@ class OireachtasQuestionFetcher(Fetcher):
         qtypes: str = "oral,written",
         limit: int = 1000,
         probe_only: bool = False,
+        concurrency: Optional[int] = None,
     ) -> List[Dict]:
+        """Fetch all questions in the date range.
+
+        With `concurrency` (or `context.concurrency`) above 1, the first page is fetched to read
+        `resultCount` and the remaining skip offsets are fetched on a bounded thread pool.
+        """
+        all_results = []
+        for page in self.fetch_pages(date_start, date_end, qtypes, limit, probe_only, concurrency):
+            all_results.extend(page)
+
+        self.logger.info(f"Fetched total {len(all_results)} records")
+        return all_results
+
+    def fetch_pages(
+        self,
+        date_start: str,
+        date_end: str,
+        qtypes: str = "oral,written",
+        limit: int = 1000,
+        probe_only: bool = False,
+        concurrency: Optional[int] = None,
+    ) -> Iterator[List[Dict]]:
+        """Generator of result pages in skip order; `fetch` collects them.
+
+        Pages are yielded as they arrive, so a consumer can start on the first page while
+        later ones are still in flight (at most `concurrency` at a time). With `probe_only`
+        only `last_expected_count` is set and nothing is yielded.
+        """
+        concurrency = concurrency or self.context.concurrency
+        self.last_dropped_offsets = []
 
         # self.logger.info(
         #     f"Fetching questions from {date_start} to {date_end} "
         #     f"of types {qtypes} with limit {limit}"
         # )
 
-        all_results = []
+        fetched = 0
         skip = 0
         total_expected = None
 
@@ -54,31 +87,11 @@ class OireachtasQuestionFetcher(Fetcher):
             #     headers=self.context.headers,
             # )
 
-            for attempt in range(1, self.MAX_RETRIES + 1):
-                try:
-                    response = requests.get(
-                        self.BASE_URL,
-                        params=params,
-                        timeout=self.context.timeout,
-                        headers=self.context.headers,
-                    )
-                    # self.logger.info(
-                    #     f"Fetched {len(response.content)} bytes "
-                    #     f"for skip={skip} (attempt {attempt})"
-                    # )
-                    break
-                except requests.exceptions.RequestException as e:
-                    self.logger.warning(
-                        f"Request failed (attempt {attempt}/{self.MAX_RETRIES}): {e}"
-                    )
-                    if attempt == self.MAX_RETRIES:
-                        raise
-                    self.logger.info(f"Retrying in {self.RETRY_SLEEP} seconds...")
-                    time.sleep(self.RETRY_SLEEP)
-                    self.logger.info("Retrying now...")
+            response = self._get(params)
 
             if response.status_code == 500:
                 self.logger.warning(f"500 error at skip={skip}, stopping")
+                self.last_dropped_offsets.append(skip)
                 break
 
             response.raise_for_status()
@@ -94,6 +107,7 @@ class OireachtasQuestionFetcher(Fetcher):
 
                 if probe_only:
                     #self.logger.info("Probe only mode: fetching single page to estimate total count")
+                    self.last_expected_count = total_expected
                     break
 
             self.last_expected_count = total_expected
@@ -102,16 +116,47 @@ class OireachtasQuestionFetcher(Fetcher):
             if not results:
                 break
 
-            all_results.extend(results)
+            yield results
+            fetched += len(results)
             skip += limit
 
-            if total_expected and len(all_results) >= total_expected:
+            if concurrency > 1 and total_expected and skip < total_expected:
+                offsets = remaining_offsets(total_expected, limit, self.MAX_SKIP)
+                if offsets and offsets[-1] + limit < total_expected:
+                    self.logger.error("Skip cap exceeded")
+                    self.last_dropped_offsets.extend(range(offsets[-1] + limit, total_expected, limit))
+                self.logger.info(f"Fetching {len(offsets)} remaining pages with concurrency={concurrency}")
+                yield from iter_offsets_concurrently(
+                    lambda offset: self._fetch_page({**params, "skip": offset}),
+                    offsets,
+                    concurrency,
+                )
+                break
+
+            if total_expected and fetched >= total_expected:
                 self.logger.info("Fetched all expected results")
                 break
 
             if skip > self.MAX_SKIP:
                 self.logger.error("Skip cap exceeded")
+                self.last_dropped_offsets.append(skip)
                 break
 
-        self.logger.info(f"Fetched total {len(all_results)} records")
-        return all_results
+    def _get(self, params: Dict) -> requests.Response:
+        return self.context.client.get(
+            self.BASE_URL,
+            params=params,
+            timeout=self.context.timeout,
+            headers=self.context.headers,
+            retries=self.MAX_RETRIES,
+        )
+
+    def _fetch_page(self, params: Dict) -> Optional[List[Dict]]:
+        """Fetch a single skip offset for the concurrent path."""
+        response = self._get(params)
+        if response.status_code == 500:
+            self.logger.warning(f"500 error at skip={params['skip']}, page skipped")
+            self.last_dropped_offsets.append(params["skip"])
+            return None
+        response.raise_for_status()
+        return response.json().get("results", [])
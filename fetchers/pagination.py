@@ -0,0 +1,69 @@
+# fetchers/pagination.py
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+
+def remaining_offsets(total: int, limit: int, max_skip: Optional[int] = None) -> List[int]:
+    """Skip offsets still to fetch once the first page (skip=0) is in hand."""
+    offsets = list(range(limit, total, limit))
+    if max_skip is not None:
+        offsets = [o for o in offsets if o <= max_skip]
+    return offsets
+
+
+def fetch_offsets_concurrently(
+    fetch_page: Callable[[int], Optional[List[Dict]]],
+    offsets: Sequence[int],
+    concurrency: int,
+) -> List[Dict]:
+    """Fetch skip/limit pages on a bounded thread pool and reassemble them in offset order.
+
+    `fetch_page(skip)` returns the page's results (or None for a page that could not be
+    fetched); retries are the caller's responsibility. Pages come back in the order of
+    `offsets` regardless of which request finished first.
+    """
+    if not offsets:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(offsets)))) as executor:
+        pages = list(executor.map(fetch_page, offsets))
+
+    results: List[Dict] = []
+    for page in pages:
+        if page:
+            results.extend(page)
+    return results
+
+
+def iter_offsets_concurrently(
+    fetch_page: Callable[[int], Optional[List[Dict]]],
+    offsets: Sequence[int],
+    concurrency: int,
+) -> Iterator[List[Dict]]:
+    """Like `fetch_offsets_concurrently`, but yields each page in offset order as soon as it
+    and the pages before it are in, with at most `concurrency` requests in flight. A slow
+    consumer therefore holds back the requests instead of letting pages pile up. Pages that
+    could not be fetched (None) and empty pages are skipped.
+    """
+    if not offsets:
+        return
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(offsets)))) as executor:
+        pending = deque()
+        remaining = iter(offsets)
+        for offset in remaining:
+            pending.append(executor.submit(fetch_page, offset))
+            if len(pending) >= concurrency:
+                break
+        try:
+            while pending:
+                page = pending.popleft().result()
+                next_offset = next(remaining, None)
+                if next_offset is not None:
+                    pending.append(executor.submit(fetch_page, next_offset))
+                if page:
+                    yield page
+        finally:
+            for future in pending:
+                future.cancel()
@@ -20,7 +20,7 @@ class SteamAppListFetcher(Fetcher):
             "max_results": 50000
         }
 
-        response = steam_get(url, params, timeout=self.context.timeout)
+        response = steam_get(url, params, timeout=self.context.timeout, client=self.context.client)
         apps = response.json().get("response", {}).get("apps", [])
 
         self.logger.info(f"Retrieved {len(apps)} Steam apps")
@@ -14,41 +14,40 @@ class SteamCurrentUserFetcher(Fetcher):
         self.logger.info("Initialized SteamCurrentUserFetcher")
 
     def fetch(self, app_ids: List[int] ) -> list:
+        return [self.fetch_one(app_id) for app_id in app_ids]
 
+    def fetch_one(self, app_id: int) -> dict:
+        """Current player count for one app; the count and timestamp are None on failure."""
         url = f"https://api.steampowered.com/ISteamUserStats/GetNumberOfCurrentPlayers/v1"
 
-        results = []
-
-        for app_id in app_ids:
-            self.logger.info(f"Fetching player counts for AppID {app_id}")
-            try:
-                response = steam_get(
-                    url,
-                    params={"appid": app_id},
-                    timeout=self.context.timeout
-                )
-
-                payload = response.json()
-                player_count = payload.get("response", {}).get("player_count")
-
-                self.logger.info(
-                    f"Current players for AppID {app_id}: {player_count}"
-                )
-
-                results.append({
-                    "AppID": app_id,
-                    "current_players": player_count,
-                    "current_players_fetched_at": datetime.now(timezone.utc)
-                })
-
-            except Exception as e:
-                self.logger.warning(
-                    f"Failed to fetch player count for AppID {app_id}: {e}"
-                )
-                results.append({
-                    "AppID": app_id,
-                    "current_players": None,
-                    "current_players_fetched_at": None
-                })
-
-        return results
\ No newline at end of file
+        self.logger.info(f"Fetching player counts for AppID {app_id}")
+        try:
+            response = steam_get(
+                url,
+                params={"appid": app_id},
+                timeout=self.context.timeout,
+                client=self.context.client,
+            )
+
+            payload = response.json()
+            player_count = payload.get("response", {}).get("player_count")
+
+            self.logger.info(
+                f"Current players for AppID {app_id}: {player_count}"
+            )
+
+            return {
+                "AppID": app_id,
+                "current_players": player_count,
+                "current_players_fetched_at": datetime.now(timezone.utc)
+            }
+
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to fetch player count for AppID {app_id}: {e}"
+            )
+            return {
+                "AppID": app_id,
+                "current_players": None,
+                "current_players_fetched_at": None
+            }
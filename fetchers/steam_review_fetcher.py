@@ -1,10 +1,10 @@
 # fetchers/steam_review_fetcher.py
 from .base import Fetcher
-from typing import List
+from typing import List, Optional
 from logs.logger import get_logger
 import os
 import json
-from utils.steam_http import steam_get
+from utils.steam_http import steam_get, FailedApps
 
 
 class SteamReviewFetcher(Fetcher):
@@ -12,51 +12,63 @@ class SteamReviewFetcher(Fetcher):
     def __init__(self, context):
         super().__init__(context)
         self.logger = get_logger(self.__class__.__name__)
+        self.failures = FailedApps()
         self.logger.info("Initialized SteamReviewFetcher")
 
     def fetch(self, app_ids: List[int], cc="ie", language="english") -> list:
         results = []
 
         for i, app_id in enumerate(app_ids):
-            self.logger.info(f"Fetching review summary for AppID {app_id}")
-            url = f"https://store.steampowered.com/appreviews/{app_id}"
-            params = {
-                "json": 1,
-                "language": language,
-                "purchase_type": "all",
-                "num_per_page": 1
-            }
-
-            try:
-                response = steam_get(url, params=params, timeout=self.context.timeout)
-
-                if response is None:
-                    self.logger.warning(f"Failed to fetch reviews for AppID {app_id}")
-                    continue
-                payload = response.json()
-            except Exception as e:
-                self.logger.warning(f"Exception fetching reviews for AppID {app_id}: {e}")
-                continue
-
-
-            summary = payload.get("query_summary")
-            if not summary:
-                continue
-
-            if i == 0:
-                os.makedirs("debug", exist_ok=True)
-                with open("debug/steam_review_payload_example.json", "w", encoding="utf-8") as f:
-                    json.dump(payload, f, indent=2, ensure_ascii=False)
-
-
-            results.append({
-                "AppID": app_id,
-                "review_score": summary.get("review_score"),
-                "review_score_desc": summary.get("review_score_desc"),
-                "total_reviews": summary.get("total_reviews"),
-                "total_positive": summary.get("total_positive"),
-                "total_negative": summary.get("total_negative"),
-            })
+            summary = self.fetch_one(app_id, language=language, dump_debug=(i == 0))
+            if summary is not None:
+                results.append(summary)
 
         self.logger.info(f"Fetched review summaries for {len(results)} apps")
         return results
+
+    def fetch_one(self, app_id: int, language="english", dump_debug: bool = False) -> Optional[dict]:
+        """Review summary for one app, or None if it could not be fetched or has no summary.
+
+        Apps whose request failed are also recorded in `failures`.
+        """
+        self.logger.info(f"Fetching review summary for AppID {app_id}")
+        url = f"https://store.steampowered.com/appreviews/{app_id}"
+        params = {
+            "json": 1,
+            "language": language,
+            "purchase_type": "all",
+            "num_per_page": 1
+        }
+
+        try:
+            response = steam_get(url, params=params, timeout=self.context.timeout, client=self.context.client)
+
+            if response is None:
+                self.logger.warning(f"Failed to fetch reviews for AppID {app_id}")
+                self.failures.add(app_id)
+                return None
+            payload = response.json()
+        except Exception as e:
+            self.logger.warning(f"Exception fetching reviews for AppID {app_id}: {e}")
+            self.failures.add(app_id)
+            return None
+
+
+        summary = payload.get("query_summary")
+        if not summary:
+            return None
+
+        if dump_debug:
+            os.makedirs("debug", exist_ok=True)
+            with open("debug/steam_review_payload_example.json", "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2, ensure_ascii=False)
+
+
+        return {
+            "AppID": app_id,
+            "review_score": summary.get("review_score"),
+            "review_score_desc": summary.get("review_score_desc"),
+            "total_reviews": summary.get("total_reviews"),
+            "total_positive": summary.get("total_positive"),
+            "total_negative": summary.get("total_negative"),
+        }
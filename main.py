@@ -1,4 +1,5 @@
 # main.py
+import yaml
 from dotenv import load_dotenv
 from orchestrator.pipeline_orchestrator import PipelineOrchestrator
 from pipelines.factory import PipelineFactory
@@ -8,7 +9,11 @@ load_dotenv()
 
 def main():
     yaml_path = "config/pipelines.yaml"
-    pipelines = PipelineFactory.build_pipelines_from_yaml(yaml_path)
+    stages = PipelineFactory.build_stages_from_yaml(yaml_path)
+    pipelines = [stage.pipeline for stage in stages]
+
+    with open(yaml_path, "r") as f:
+        orchestrator_cfg = (yaml.safe_load(f) or {}).get("orchestrator", {})
 
     logger = get_logger("Main")
     logger.info(f"Loaded {len(pipelines)} pipelines from {yaml_path}")
@@ -20,7 +25,13 @@ def main():
         logger.info(f"  {i+1}. {pipeline.__class__.__name__}")
 
 
-    orchestrator = PipelineOrchestrator(pipelines=pipelines, parallel=False, max_retries=3)
+    orchestrator = PipelineOrchestrator(
+        pipelines=pipelines,
+        stages=stages,
+        parallel=orchestrator_cfg.get("parallel", False),
+        max_workers=orchestrator_cfg.get("max_workers", 4),
+        max_retries=3,
+    )
 
     data = None  # If your first pipeline extracts data, this can be None
 
@@ -1,10 +1,13 @@
 # orchestrator/pipeline_orchestrator.py
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from typing import List, Optional, Dict
 from logs.logger import get_logger
 import pandas as pd
 
 from pipelines import TargetFeaturePipeline, DataSplitterPipeline, FeatureEncoderPipeline, FilterPipeline, \
     ExperimentPipeline, DataExtractorPipeline, OireachtasDataPipeline
+from pipelines.base import PipelineStage
 
 
 # from pipelines.experiment_pipeline import ExperimentPipeline
@@ -15,16 +18,41 @@ from pipelines import TargetFeaturePipeline, DataSplitterPipeline, FeatureEncode
 
 
 class PipelineOrchestrator:
-    def __init__(self, pipelines: List, max_retries: int = 3, parallel: bool = False):
+    # These stages need the train/test hand-off of the sequential run() and cannot be scheduled as graph nodes
+    _SEQUENTIAL_ONLY = (DataSplitterPipeline, TargetFeaturePipeline, ExperimentPipeline)
+
+    def __init__(
+        self,
+        pipelines: List,
+        max_retries: int = 3,
+        parallel: bool = False,
+        stages: Optional[List[PipelineStage]] = None,
+        max_workers: int = 4,
+    ):
         self.logger = get_logger(self.__class__.__name__)
         self.pipelines = pipelines
         self.max_retries = max_retries
         self.parallel = parallel
+        self.max_workers = max_workers
+        # Without explicit stages, chain every pipeline to the previous one so the graph matches list order
+        self.stages = stages or [
+            PipelineStage(
+                name=f"{i + 1}_{p.__class__.__name__}",
+                pipeline=p,
+                depends_on=[f"{i}_{pipelines[i - 1].__class__.__name__}"] if i > 0 else [],
+            )
+            for i, p in enumerate(pipelines)
+        ]
+        self.stage_timings: Dict[str, float] = {}
+
 
 
+    def run_pipeline(self, pipeline, data: Optional[pd.DataFrame] = None, extra: Optional[Dict] = None,
+                     raise_on_failure: bool = False):
+        """Run a single pipeline with retry logic.
 
-    def run_pipeline(self, pipeline, data: Optional[pd.DataFrame] = None, extra: Optional[Dict] = None):
-        """Run a single pipeline with retry logic."""
+        Returns None once retries are exhausted, or raises RuntimeError if `raise_on_failure` is set.
+        """
         attempt = 0
         while attempt < self.max_retries:
             try:
@@ -47,7 +75,9 @@ class PipelineOrchestrator:
                         **extra
                     )
                 else:
-                    self.logger.info(f"Executing general pipeline: {pipeline.__class__.__name__} with data shape: {data.shape if data is not None else 'N/A'}")
+                    # upstream stages in a graph may hand over dicts, strings or None, not only DataFrames
+                    data_desc = f"shape: {data.shape}" if isinstance(data, pd.DataFrame) else f"type: {type(data).__name__}"
+                    self.logger.info(f"Executing general pipeline: {pipeline.__class__.__name__} with data {data_desc}")
                     result = pipeline.execute(data)
                     self.logger.info(f"Pipeline {pipeline.__class__.__name__} output shape: {result.shape if isinstance(result, pd.DataFrame) else 'N/A'}")
                     self.logger.info(f"Result type: {type(result)}")
@@ -63,10 +93,16 @@ class PipelineOrchestrator:
                 self.logger.error(f"Pipeline {pipeline.__class__.__name__} failed on attempt {attempt}: {e}")
 
         self.logger.error(f"Pipeline {pipeline.__class__.__name__} failed after {self.max_retries} attempts")
+        if raise_on_failure:
+            raise RuntimeError(f"Pipeline {pipeline.__class__.__name__} failed after {self.max_retries} attempts")
         return None
 
     def run(self, data: Optional[pd.DataFrame] = None, target_column: str = None):
-        """Run all pipelines sequentially."""
+        """Run all pipelines sequentially, or as a dependency graph when `parallel` is set."""
+
+        if self.parallel:
+            self.run_graph(data=data)
+            return None, None, None, None
 
         self.logger.info("Starting orchestrator run")
         X_train = X_test = y_train = y_test = None
@@ -130,3 +166,101 @@ class PipelineOrchestrator:
 
         self.logger.info("Pipeline orchestration complete")
         return X_train, X_test, y_train, y_test
+
+    def run_graph(self, data: Optional[pd.DataFrame] = None) -> Dict[str, object]:
+        """Run stages as a dependency graph, overlapping independent branches on a thread pool.
+
+        A stage starts as soon as everything in its `depends_on` list has finished. It receives the
+        output of its dependency when it has exactly one, otherwise the `data` passed in here.
+        Stages downstream of a failed stage are skipped. Returns the stage outputs keyed by name.
+        """
+        self._validate_graph()
+        self.logger.info(f"Starting orchestrator graph run: {len(self.stages)} stages, max_workers={self.max_workers}")
+
+        stages = {stage.name: stage for stage in self.stages}
+        remaining = {name: set(stage.depends_on) for name, stage in stages.items()}
+        results: Dict[str, object] = {}
+        failed = set()
+        self.stage_timings = {}
+        run_start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while remaining or running:
+                # Skip anything downstream of a failure, then submit every stage whose dependencies are done
+                for name in [n for n, deps in remaining.items() if deps & failed]:
+                    self.logger.error(f"Skipping stage '{name}': dependency failed ({sorted(remaining[name] & failed)})")
+                    failed.add(name)
+                    del remaining[name]
+
+                for name in [n for n, deps in remaining.items() if not deps]:
+                    stage = stages[name]
+                    stage_data = results.get(stage.depends_on[0]) if len(stage.depends_on) == 1 else data
+                    self.logger.info(f"Submitting stage '{name}' ({stage.pipeline.__class__.__name__})")
+                    running[executor.submit(self._run_stage, stage, stage_data)] = name
+                    del remaining[name]
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Stage '{name}' failed: {e}")
+                        failed.add(name)
+                        continue
+                    for deps in remaining.values():
+                        deps.discard(name)
+
+        wall_clock = time.perf_counter() - run_start
+        serial = sum(self.stage_timings.values())
+        self.logger.info(
+            f"Pipeline graph complete in {wall_clock:.2f}s "
+            f"(sum of stage times {serial:.2f}s, {len(failed)} failed/skipped)"
+        )
+        for name, seconds in sorted(self.stage_timings.items(), key=lambda kv: -kv[1]):
+            self.logger.info(f"  {name}: {seconds:.2f}s")
+        return results
+
+    def _run_stage(self, stage: PipelineStage, data):
+        start = time.perf_counter()
+        try:
+            return self.run_pipeline(stage.pipeline, data=data, raise_on_failure=True)
+        finally:
+            self.stage_timings[stage.name] = time.perf_counter() - start
+            self.logger.info(f"Stage '{stage.name}' finished in {self.stage_timings[stage.name]:.2f}s")
+
+    def _validate_graph(self):
+        """Reject duplicate names, unknown dependencies, cycles and stages that need the sequential run."""
+        names = [stage.name for stage in self.stages]
+        duplicates = sorted({n for n in names if names.count(n) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate stage names in pipeline graph: {duplicates}")
+
+        for stage in self.stages:
+            unknown = [d for d in stage.depends_on if d not in names]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {unknown}")
+            if isinstance(stage.pipeline, self._SEQUENTIAL_ONLY):
+                raise ValueError(
+                    f"Stage '{stage.name}' ({stage.pipeline.__class__.__name__}) is only supported by the sequential run"
+                )
+
+        # Kahn's algorithm: anything left unvisited sits on a cycle
+        indegree = {stage.name: len(set(stage.depends_on)) for stage in self.stages}
+        ready = [n for n, d in indegree.items() if d == 0]
+        visited = 0
+        while ready:
+            current = ready.pop()
+            visited += 1
+            for stage in self.stages:
+                if current in stage.depends_on:
+                    indegree[stage.name] -= 1
+                    if indegree[stage.name] == 0:
+                        ready.append(stage.name)
+        if visited != len(self.stages):
+            cyclic = sorted(n for n, d in indegree.items() if d > 0)
+            raise ValueError(f"Pipeline graph has a dependency cycle involving: {cyclic}")
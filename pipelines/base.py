@@ -1,6 +1,7 @@
 # pipelines/base.py
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
 import pandas as pd
 
 
@@ -31,4 +32,17 @@ class Pipeline(ABC):
         Any
             Output of the pipeline stage (e.g., DataFrame, tuple of splits, model, etc.)
         """
-        pass
\ No newline at end of file
+        pass
+
+
+@dataclass
+class PipelineStage:
+    """A named pipeline plus the names of the stages it depends on.
+
+    Built by `PipelineFactory.build_stages_from_yaml` from the `name` and
+    `depends_on` keys of each YAML entry, and consumed by the DAG mode of
+    `PipelineOrchestrator`.
+    """
+    name: str
+    pipeline: Any
+    depends_on: List[str] = field(default_factory=list)
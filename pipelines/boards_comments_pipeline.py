@@ -3,12 +3,31 @@ from fetchers.factory import FetcherFactory
 from data.data_source.factory import DiscussionSourceFactory
 from data.sqlalchemy_connector import SQLAlchemyConnector
 from data.extractors.boards_comments_extractor import BoardsCommentsExtractor
+from data.extractors.boards_comment_watermark_extractor import BoardsCommentWatermarkExtractor, IN_CLAUSE_CHUNK
 from data.models.boards_comment import BoardsComment
 from logs.logger import get_logger
-from typing import Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, timedelta
+import time
+from typing import Dict, List, Optional, Set
+
+IN_FLIGHT_PER_WORKER = 4  # discussions queued per fetch worker, bounding memory held in results
 
 class BoardsCommentsPipeline:
-    """Pipeline to fetch Boards.ie comments for discussions and save to DB."""
+    """Pipeline to fetch Boards.ie comments for discussions and save to DB.
+
+    With `incremental: true` each discussion keeps a high-water mark (latest dateInserted and
+    commentID saved) in dbo.boards_comment_watermarks. Fetches then start from the watermark
+    date and only comments newer than the watermark are saved, so refreshes scale with new
+    comments rather than thread size. Discussions without a watermark are fetched in full.
+
+    With `fetch_concurrency` above 1, a pool of that many workers harvests discussions
+    concurrently (all sharing the context's boards.ie rate budget) while the calling thread
+    is the single writer: new comments from many discussions are buffered and upserted
+    together once `write_batch_size` rows are pending, followed by one watermark upsert for
+    the discussions in that commit. Progress and throughput are logged every
+    `progress_interval` seconds.
+    """
 
     def __init__(
         self,
@@ -19,26 +38,38 @@ class BoardsCommentsPipeline:
         connector: Optional[SQLAlchemyConnector] = None,
         chunk_size: int = 500,
         fetcher_name: str = "boards_comments",
+        upsert_batch_size: int = 1000,
+        incremental: bool = False,
+        fetch_concurrency: int = 1,
+        write_batch_size: int = 5000,
+        progress_interval: float = 60.0,
     ):
         self.logger = get_logger(self.__class__.__name__)
         self.limit = limit
         self.date_start = date_start
         self.date_end = date_end
         self.chunk_size = chunk_size
+        self.incremental = incremental
+        self.fetch_concurrency = max(1, int(fetch_concurrency))
+        self.write_batch_size = write_batch_size
+        self.progress_interval = progress_interval
 
         self.connector = connector or SQLAlchemyConnector()
         self.connector.create_tables(base=BoardsComment.__base__)
 
         # Create discussion source (db or api) to obtain discussion ids
         # create a discussion fetcher (boards) and pass it into the discussion source factory
+        # Both fetchers share one context so they share its pooled client and boards.ie rate budget
         from fetchers.context import FetcherContext
-        discussion_fetcher = FetcherFactory.create("boards", context=FetcherContext())
+        self.context = FetcherContext(concurrency=self.fetch_concurrency)
+        discussion_fetcher = FetcherFactory.create("boards", context=self.context)
         self.discussion_source = DiscussionSourceFactory.create(discussion_source_cfg, connector=self.connector, fetcher=discussion_fetcher)
 
         # Fetcher for comments
-        self.fetcher = FetcherFactory.create(fetcher_name, context=FetcherContext())
+        self.fetcher = FetcherFactory.create(fetcher_name, context=self.context)
 
-        self.extractor = BoardsCommentsExtractor(connector=self.connector, chunk_size=chunk_size)
+        self.extractor = BoardsCommentsExtractor(connector=self.connector, chunk_size=chunk_size, upsert_batch_size=upsert_batch_size)
+        self.watermarks = BoardsCommentWatermarkExtractor(connector=self.connector)
 
     @classmethod
     def from_config(cls, cfg: dict):
@@ -54,34 +85,151 @@ class BoardsCommentsPipeline:
 
         discussion_ids = df["DiscussionId"].astype(int).tolist()
 
-        for discussion_id in discussion_ids:
-            self.logger.info(f"Fetching comments for discussion {discussion_id}")
+        # one bulk lookup up front instead of a query per discussion; known ids are only
+        # needed for discussions that have no watermark yet
+        watermarks = self.watermarks.load(discussion_ids) if self.incremental else {}
+        existing_by_discussion = self._load_existing_ids([d for d in discussion_ids if d not in watermarks])
 
-            # get existing commentIDs to avoid duplicates
-            session = self.connector.get_session()
-            try:
-                existing = {row[0] for row in session.query(BoardsComment.commentID).filter_by(discussionID=discussion_id).all()}
-            finally:
-                session.close()
+        if self.fetch_concurrency > 1:
+            self._harvest_concurrently(discussion_ids, watermarks, existing_by_discussion)
+        else:
+            for discussion_id in discussion_ids:
+                watermark = watermarks.get(discussion_id)
+                all_comments, new_records = self._harvest(discussion_id, watermark, existing_by_discussion)
+                if not all_comments:
+                    continue
 
-            # fetch all comments for this discussion (fetcher.fetch returns list)
-            all_comments = self.fetcher.fetch(discussion_id, limit=self.limit, date_start=self.date_start, date_end=self.date_end)
-            if not all_comments:
-                self.logger.info("No comments returned for discussion %s", discussion_id)
-                continue
+                # save in chunks via extractor
+                for i in range(0, len(new_records), self.extractor.chunk_size):
+                    chunk = new_records[i:i + self.extractor.chunk_size]
+                    self.extractor.save_data(chunk)
+                    self.logger.info(f"Saved chunk of {len(chunk)} comments for discussion {discussion_id}")
 
-            # filter out already existing comments
-            new_records = [r for r in all_comments if r.get("commentID") not in existing]
-            if not new_records:
-                self.logger.info("No new comments for discussion %s", discussion_id)
-                continue
-
-            # save in chunks via extractor
-            for i in range(0, len(new_records), self.extractor.chunk_size):
-                chunk = new_records[i:i + self.extractor.chunk_size]
-                self.extractor.save_data(chunk)
-                self.logger.info(f"Saved chunk of {len(chunk)} comments for discussion {discussion_id}")
-                for r in chunk:
-                    existing.add(r.get("commentID"))
+                # every fetched comment is now stored, so the watermark can move past all of them
+                if self.incremental:
+                    self.watermarks.save_data(discussion_id, all_comments, previous=watermark)
 
+        self.logger.info(f"HTTP client stats: {self.context.client.stats()}")
         return df
+
+    def _harvest(self, discussion_id: int, watermark: Optional[Dict], existing_by_discussion: Dict[int, Set[int]]):
+        """Fetch one discussion's comments; returns (all fetched comments, the ones not yet saved)."""
+        date_start, date_end = self._fetch_window(watermark)
+        self.logger.info(f"Fetching comments for discussion {discussion_id} from {date_start}")
+
+        # fetch all comments for this discussion (fetcher.fetch returns list)
+        all_comments = self.fetcher.fetch(discussion_id, limit=self.limit, date_start=date_start, date_end=date_end)
+        if not all_comments:
+            self.logger.info("No comments returned for discussion %s", discussion_id)
+            return [], []
+
+        # filter out already saved comments: by watermark when incremental, else by known ids
+        if watermark and watermark.get("MaxCommentId") is not None:
+            new_records = [r for r in all_comments if (r.get("commentID") or 0) > watermark["MaxCommentId"]]
+        else:
+            existing = existing_by_discussion.get(discussion_id, set())
+            new_records = [r for r in all_comments if r.get("commentID") not in existing]
+        if not new_records:
+            self.logger.info("No new comments for discussion %s", discussion_id)
+        return all_comments, new_records
+
+    def _harvest_concurrently(self, discussion_ids: List[int], watermarks: Dict[int, Dict],
+                              existing_by_discussion: Dict[int, Set[int]]) -> None:
+        pending_rows: List[Dict] = []
+        pending_watermarks = []
+        progress = {"done": 0, "fetched": 0, "saved": 0}
+        started = last_report = time.monotonic()
+
+        def flush():
+            # take the pending state before writing, so a failed write is not retried by a later flush
+            rows, marks = pending_rows[:], pending_watermarks[:]
+            pending_rows.clear()
+            pending_watermarks.clear()
+            if rows:
+                self.extractor.save_data(rows)
+                progress["saved"] += len(rows)
+            # watermarks only move once their comments are committed
+            if self.incremental and marks:
+                self.watermarks.save_many(marks)
+
+        def report():
+            elapsed = max(time.monotonic() - started, 1e-6)
+            stats = self.context.client.stats()
+            self.logger.info(
+                f"Harvested {progress['done']}/{len(discussion_ids)} discussions in {elapsed:.0f}s "
+                f"({progress['done'] / elapsed:.2f} discussions/s, {progress['fetched'] / elapsed:.1f} comments/s); "
+                f"{progress['saved']} comments saved; {stats['requests']} requests, "
+                f"{stats['throttled']} throttled"
+            )
+
+        self.logger.info(f"Harvesting {len(discussion_ids)} discussions with {self.fetch_concurrency} workers")
+        ids = iter(discussion_ids)
+        with ThreadPoolExecutor(max_workers=self.fetch_concurrency) as executor:
+            in_flight = {}
+
+            def submit_more():
+                while len(in_flight) < self.fetch_concurrency * IN_FLIGHT_PER_WORKER:
+                    discussion_id = next(ids, None)
+                    if discussion_id is None:
+                        return
+                    future = executor.submit(
+                        self._harvest, discussion_id, watermarks.get(discussion_id), existing_by_discussion
+                    )
+                    in_flight[future] = discussion_id
+
+            try:
+                submit_more()
+                while in_flight:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        discussion_id = in_flight.pop(future)
+                        all_comments, new_records = future.result()
+                        progress["done"] += 1
+                        progress["fetched"] += len(all_comments)
+                        if all_comments:
+                            pending_rows.extend(new_records)
+                            pending_watermarks.append((discussion_id, all_comments, watermarks.get(discussion_id)))
+                    submit_more()
+
+                    if len(pending_rows) >= self.write_batch_size:
+                        flush()
+                    if time.monotonic() - last_report >= self.progress_interval:
+                        report()
+                        last_report = time.monotonic()
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                # keep whatever finished before a failure; its watermarks stay consistent
+                try:
+                    flush()
+                except Exception as e:
+                    self.logger.error(f"Could not save comments harvested before the failure: {e}")
+                raise
+            flush()
+        report()
+
+    def _fetch_window(self, watermark: Optional[Dict]):
+        """Date range for the comments API: the configured range, moved up to the watermark date."""
+        if not watermark or watermark.get("MaxDateInserted") is None:
+            return self.date_start, self.date_end
+
+        watermark_date = watermark["MaxDateInserted"].date().isoformat()
+        date_start = max(self.date_start, watermark_date) if self.date_start else watermark_date
+        # the API treats a lone start date as a single day, so always give an end
+        date_end = self.date_end or (date.today() + timedelta(days=1)).isoformat()
+        return date_start, date_end
+
+    def _load_existing_ids(self, discussion_ids: List[int]) -> Dict[int, Set[int]]:
+        existing: Dict[int, Set[int]] = {}
+        session = self.connector.get_session()
+        try:
+            for i in range(0, len(discussion_ids), IN_CLAUSE_CHUNK):
+                rows = session.query(BoardsComment.discussionID, BoardsComment.commentID).filter(
+                    BoardsComment.discussionID.in_(discussion_ids[i:i + IN_CLAUSE_CHUNK])
+                ).all()
+                for discussion_id, comment_id in rows:
+                    existing.setdefault(discussion_id, set()).add(comment_id)
+        finally:
+            session.close()
+        self.logger.info(f"Loaded {sum(len(v) for v in existing.values())} existing comment ids")
+        return existing
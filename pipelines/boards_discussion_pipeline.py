@@ -4,8 +4,11 @@ from fetchers.context import FetcherContext
 from data.sqlalchemy_connector import SQLAlchemyConnector
 from data.extractors.boards_discussion_extractor import BoardsDiscussionExtractor
 from data.models.boards_discussion import BoardsDiscussion
+from fetchers.boards_fetcher import date_range
+from utils.checkpoint_store import CheckpointStore
 from logs.logger import get_logger
-from typing import Optional
+from collections import defaultdict
+from typing import Any, Optional
 
 
 class BoardsDataPipeline:
@@ -20,6 +23,9 @@ class BoardsDataPipeline:
         date_end: Optional[str] = None,
         connector: Optional[SQLAlchemyConnector] = None,
         chunk_size: int = 500,
+        upsert_batch_size: int = 1000,
+        checkpoint: Any = None,
+        fetch_concurrency: int = 1,
     ):
         self.logger = get_logger(self.__class__.__name__)
         self.category_id = category_id
@@ -31,12 +37,15 @@ class BoardsDataPipeline:
         # Ensure tables exist
         self.connector.create_tables(base=BoardsDiscussion.__base__)
 
-        # Fetcher for API
-        self.context = FetcherContext(api_key=api_key)
+        # Fetcher for API; fetch_concurrency > 1 crawls the days of the range in parallel
+        self.context = FetcherContext(api_key=api_key, concurrency=fetch_concurrency)
         self.fetcher = FetcherFactory.create("boards", context=self.context)
 
         # Extractor for DB
-        self.extractor = BoardsDiscussionExtractor(connector=self.connector, chunk_size=chunk_size)
+        self.extractor = BoardsDiscussionExtractor(connector=self.connector, chunk_size=chunk_size, upsert_batch_size=upsert_batch_size)
+
+        # checkpoint: true | {path: ...} saves and records one day at a time so a restart resumes
+        self.checkpoint = CheckpointStore.from_config(checkpoint)
 
     @classmethod
     def from_config(cls, cfg: dict):
@@ -49,6 +58,12 @@ class BoardsDataPipeline:
 
         self.logger.info(f"Starting Boards snapshot pipeline for category {self.category_id}")
 
+        if self.checkpoint is not None and self.date_start:
+            self._execute_by_day()
+            self.logger.info(f"HTTP client stats: {self.context.client.stats()}")
+            self.logger.info("Boards snapshot pipeline completed.")
+            return
+
         # --- Fetch and save in batches ---
         batch_number = 0
         for batch in self.fetch_batches():
@@ -56,19 +71,48 @@ class BoardsDataPipeline:
             self.logger.info(f"Processing batch #{batch_number} ({len(batch)} discussions)")
             self.extractor.save_data(batch)
 
+        self.logger.info(f"HTTP client stats: {self.context.client.stats()}")
         self.logger.info("Boards snapshot pipeline completed.")
 
     def fetch_batches(self):
-        """Generator to fetch batches from the API per page/day."""
-        records = self.fetcher.fetch(
+        """Generator of chunk_size batches, filled as pages arrive so saving overlaps fetching."""
+        buffer = []
+        for page in self.fetcher.fetch_batches(
             category_id=self.category_id,
             limit=self.limit,
             start_date=self.date_start,
             end_date=self.date_end,
-        )
-        if not records:
-            return []
+        ):
+            buffer.extend(page)
+            while len(buffer) >= self.extractor.chunk_size:
+                yield buffer[:self.extractor.chunk_size]
+                buffer = buffer[self.extractor.chunk_size:]
+        if buffer:
+            yield buffer
+
+    def _execute_by_day(self):
+        """Fetch, save and checkpoint one dateLastComment day at a time, skipping saved days.
+
+        With fetch_concurrency above 1 the pending days are crawled in parallel; each day is
+        checkpointed once its last page has been saved.
+        """
+        job = f"boards_discussions:{self.category_id}"
+        done = self.checkpoint.completed(job)
+        days = []
+        for day in date_range(self.date_start, self.date_end):
+            if day in done:
+                self.logger.info(f"Skipping {day}: already ingested")
+            else:
+                days.append(day)
 
-        # Yield batches for chunked DB inserts
-        for i in range(0, len(records), self.extractor.chunk_size):
-            yield records[i:i + self.extractor.chunk_size]
+        saved = defaultdict(int)
+        for day, page in self.fetcher.fetch_days(self.category_id, self.limit, days):
+            if page is None:
+                count = saved.pop(day, 0)
+                self.checkpoint.mark_done(job, day, records=count)
+                self.logger.info(f"Saved {count} discussions for {day}")
+                continue
+            for i in range(0, len(page), self.extractor.chunk_size):
+                chunk = page[i:i + self.extractor.chunk_size]
+                self.extractor.save_data(chunk)
+                saved[day] += len(chunk)
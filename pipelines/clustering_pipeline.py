@@ -1,6 +1,7 @@
 #pipelines/clustering_pipeline.py
 import numpy as np
 import os
+from scipy import sparse
 from visualisations import VisualisationFactory
 from .base import Pipeline
 from logs.logger import get_logger
@@ -11,7 +12,9 @@ from collections import Counter
 #from reducers.umap_reducer import UMAPReducer
 #from visualisations.cluster_plotter import ClusterPlotter
 
-from vectorizers import VectorizerFactory
+from vectorizers import VectorizerFactory, fit_transform_cached
+from utils.stage_cache import StageCache
+from utils.cluster_keywords import cluster_keywords
 from models import ModelFactory
 from reducers import ReducerFactory
 from evaluators import EvaluatorFactory
@@ -38,6 +41,13 @@ class ClusteringPipeline(Pipeline):
         self.logger.info(f"Setting up vectorizer '{vectorizer_name}' for field '{vectorizer_field}' with params {vectorizer_params}")
         vectorizer_params['column'] = vectorizer_field
         self.vectorizer = VectorizerFactory.get_vectorizer(vectorizer_name, **vectorizer_params)
+        # optional on-disk cache of the vectorized matrix, keyed by the text column and vectorizer config
+        self.vectorizer_config = {"vectorizer_name": vectorizer_name, "vectorizer_params": vectorizer_params}
+        self.vectorizer_cache = StageCache.from_config(vectorizer_cfg.get("cache"))
+        # cluster keywords from the vectorized matrix: {top_n: 10, scoring: mean | ctfidf}
+        keywords_cfg = params.get("keywords", {}) or {}
+        self.keywords_top_n = int(keywords_cfg.get("top_n", 10))
+        self.keywords_scoring = keywords_cfg.get("scoring", "mean")
 
         #Clusterer
         clusterer_cfg = params.get("clusterer", {})
@@ -108,16 +118,27 @@ class ClusteringPipeline(Pipeline):
         # Vectorize
         if self.vectorizer is not None:
             self.logger.info(f"Vectorizing texts using {self.vectorizer.name}")
-            X_cluster = self.vectorizer.fit_transform(df_for_clustering)
+            if self.vectorizer_cache is not None:
+                self.vectorizer, (X_cluster,) = fit_transform_cached(
+                    self.vectorizer, self.vectorizer_cache, self.vectorizer_config, df_for_clustering
+                )
+            else:
+                X_cluster = self.vectorizer.fit_transform(df_for_clustering)
             self.logger.info(f"Vectorized shape: {df.shape}")
+            # document-term matrix kept for cluster keywords
+            X_vectorized = X_cluster
         else:
             self.logger.info("No vectorizer configured, using original dataframe for clustering")
             X_cluster = df_for_clustering.copy()
 
         # Reduce
-        X_cluster.columns = X_cluster.columns.astype(str) # ensure columns are str for reducers
+        if hasattr(X_cluster, "columns"):
+            X_cluster.columns = X_cluster.columns.astype(str) # ensure columns are str for reducers
         #if not already numpy array, convert to numpy
-        if not isinstance(X_cluster, np.ndarray):
+        if sparse.issparse(X_cluster):
+            # reducers and clusterers expect dense arrays; X_vectorized stays sparse for the keywords
+            X_cluster_values = X_cluster.astype(np.float32).toarray()
+        elif not isinstance(X_cluster, np.ndarray):
             X_cluster_values = X_cluster.to_numpy(dtype=np.float32, copy=False)
         else:
             X_cluster_values = X_cluster
@@ -212,7 +233,7 @@ class ClusteringPipeline(Pipeline):
 
         if self.vectorizer is not None:
         # Optional: extract cluster keywords
-            cluster_keywords = self._extract_cluster_keywords(df, labels)
+            cluster_keywords = self._extract_cluster_keywords(X_vectorized, labels)
             # Log cluster keywords
             label_counts = Counter(labels)
             for cluster_id, keywords in cluster_keywords.items():
@@ -239,18 +260,12 @@ class ClusteringPipeline(Pipeline):
         except Exception as e:
             self.logger.error(f"Error saving cluster keywords to {filepath}: {e}")
 
-    def _extract_cluster_keywords(self, X, labels, top_n=10):
-        terms = self.vectorizer.get_feature_names()
-        result = {}
-
-        for cluster_id in set(labels):
-            if cluster_id == -1:
-                continue
-
-            idx = np.where(labels == cluster_id)[0]
-            centroid = X[idx].mean(axis=0).A1
-            top_idx = centroid.argsort()[-top_n:]
-
-            result[cluster_id] = [terms[i] for i in top_idx]
-
-        return result
+    def _extract_cluster_keywords(self, X, labels, top_n=None):
+        # all clusters in one sparse pass; noise (-1) is left out
+        return cluster_keywords(
+            X,
+            labels,
+            self.vectorizer.get_feature_names(),
+            top_n=top_n or self.keywords_top_n,
+            scoring=self.keywords_scoring,
+        )
@@ -1,5 +1,6 @@
 # pipelines/data_extractor_pipeline.py
 from typing import Optional
+import json
 import os
 import pandas as pd
 
@@ -15,11 +16,25 @@ class DataExtractorPipeline(Pipeline):
     Inherits from the base Pipeline class.
     """
 
-    def __init__(self, extractor: DataExtractor, output_csv: Optional[str] = None):
+    # parsed to datetimes by transform()
+    DATE_COLUMNS = ("Date", "Date_Created", "Last_Updated", "Release_Date")
+
+    def __init__(
+        self,
+        extractor: DataExtractor,
+        output_csv: Optional[str] = None,
+        output_parquet: Optional[str] = None,
+        stream: bool = False,
+        batch_size: int = 50_000,
+    ):
         self.extractor = extractor
         self.logger = get_logger(self.__class__.__name__)
         self.df: Optional[pd.DataFrame] = None
         self.output_csv = output_csv or os.getenv("OUTPUT_CSV", "output.csv")
+        self.output_parquet = output_parquet
+        # stream=True extracts, transforms and writes one batch at a time so memory stays bounded
+        self.stream = stream
+        self.batch_size = batch_size
 
     @classmethod
     def from_config(cls, cfg: dict):
@@ -29,8 +44,12 @@ class DataExtractorPipeline(Pipeline):
           extractor_type: "roblox"
           params:
             output_csv: "output.csv"
+            output_parquet: "output.parquet"   # optional; written instead of the CSV
+            stream: true                       # optional; batch-at-a-time extract and load
+            batch_size: 50000
             extractor_params:
               sample_size: 100
+              columns: [Id, Title]             # optional; table extractors only
         """
 
         params = cfg.get("params", {}).copy()
@@ -62,28 +81,119 @@ class DataExtractorPipeline(Pipeline):
     def transform(self) -> None:
         """Perform any data transformations."""
         self.logger.info("Starting transformation")
+        self.df = self._transform_frame(self.df)
+        self.logger.info("Transformation complete")
 
+    @classmethod
+    def _transform_frame(cls, df: pd.DataFrame) -> pd.DataFrame:
         # Example: parse datetime columns if present
-        for col in ("Date", "Date_Created", "Last_Updated", "Release_Date"):
-            if col in self.df.columns:
-                self.df[col] = pd.to_datetime(self.df[col], errors="coerce")
-        self.logger.info("Transformation complete")
+        for col in cls.DATE_COLUMNS:
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], errors="coerce")
+        return df
 
     def load(self) -> None:
-        """Save transformed data to CSV."""
+        """Save transformed data to Parquet (if configured) or CSV."""
         if self.df is not None:
-            output_dir = os.path.dirname(self.output_csv)
-            if output_dir and not os.path.exists(output_dir):
-                os.makedirs(output_dir, exist_ok=True)
-            self.logger.info(f"Saving data to {self.output_csv}")
-            self.df.to_csv(self.output_csv, index=False)
+            output_path = self._prepare_output_path()
+            self.logger.info(f"Saving data to {output_path}")
+            if self.output_parquet:
+                self.df.to_parquet(output_path, index=False)
+            else:
+                self.df.to_csv(output_path, index=False)
             self.logger.info("Data saved successfully")
 
+    def _prepare_output_path(self) -> str:
+        output_path = self.output_parquet or self.output_csv
+        output_dir = os.path.dirname(output_path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+        return output_path
+
+    def execute_streaming(self) -> None:
+        """Extract, transform and write the table batch by batch.
+
+        Peak memory is one batch regardless of table size. CSV batches are appended after the
+        first (which writes the header); Parquet batches go to one row group each, all written
+        with the extractor's `arrow_schema()` (the model's column types) when it has one.
+        JSON/ARRAY values (dicts and lists) are written as JSON text.
+        """
+        fetch_batches = getattr(self.extractor, "fetch_batches", None)
+        if not callable(fetch_batches):
+            raise ValueError(f"{self.extractor.__class__.__name__} does not support streaming extraction")
+
+        output_path = self._prepare_output_path()
+        self.logger.info(f"Streaming extraction to {output_path} in batches of {self.batch_size}")
+        writer = None
+        schema = None
+        rows = 0
+        try:
+            for i, batch in enumerate(fetch_batches(batch_size=self.batch_size)):
+                batch = self._transform_frame(batch)
+                if self.output_parquet:
+                    import pyarrow as pa
+                    import pyarrow.parquet as pq
+
+                    table = pa.Table.from_pandas(self._json_encode_nested(batch), preserve_index=False)
+                    if writer is None:
+                        schema = self._parquet_schema(table.schema)
+                        writer = pq.ParquetWriter(output_path, schema)
+                    writer.write_table(table.cast(schema))
+                else:
+                    batch.to_csv(output_path, index=False, mode="w" if i == 0 else "a", header=i == 0)
+                rows += len(batch)
+                self.logger.info(f"Wrote batch {i + 1} ({len(batch)} rows, {rows} total)")
+        finally:
+            if writer is not None:
+                writer.close()
+        self.logger.info(f"Streamed {rows} rows to {output_path}")
+
+    @staticmethod
+    def _json_encode_nested(batch: pd.DataFrame) -> pd.DataFrame:
+        """Serialise dict/list cells (JSON and ARRAY columns) to JSON strings.
+
+        Arrow would otherwise infer a struct or list type per batch, which neither casts to
+        the string type those columns get in the schema nor stays stable across batches.
+        """
+        nested = [
+            col for col in batch.columns
+            if batch[col].dtype == object and batch[col].map(lambda v: isinstance(v, (dict, list))).any()
+        ]
+        if not nested:
+            return batch
+        batch = batch.copy()
+        for col in nested:
+            batch[col] = batch[col].map(
+                lambda v: json.dumps(v, default=str) if isinstance(v, (dict, list)) else v
+            )
+        return batch
+
+    def _parquet_schema(self, inferred):
+        """Schema for every Parquet batch: the model's column types, else the first batch's inferred one."""
+        import pyarrow as pa
+
+        arrow_schema = getattr(self.extractor, "arrow_schema", None)
+        if callable(arrow_schema):
+            schema = arrow_schema()
+        else:
+            # without model types, all-null columns in the first batch would pin the type to null
+            schema = pa.schema([f.with_type(pa.string()) if pa.types.is_null(f.type) else f for f in inferred])
+        # transform() turns these into datetimes whatever the column's stored type
+        return pa.schema([
+            f.with_type(pa.timestamp("ns")) if f.name in self.DATE_COLUMNS else f for f in schema
+        ])
+
     def execute(self, data: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Execute the full ETL process and return the resulting DataFrame.
         `data` parameter is ignored here, since extraction starts from scratch.
+        In streaming mode the data only goes to the output file and None is returned.
         """
+        if self.stream:
+            self.execute_streaming()
+            self.logger.info("Pipeline execution complete (streamed to file)")
+            return None
+
         self.extract()
         self.transform()
         self.load()
@@ -3,7 +3,7 @@ from typing import List, Type, Dict, Any
 from logs.logger import get_logger
 import yaml
 import importlib
-from pipelines.base import Pipeline
+from pipelines.base import Pipeline, PipelineStage
 logger = get_logger("PipelineFactory")
 
 class PipelineFactory:
@@ -29,10 +29,19 @@ class PipelineFactory:
     @classmethod
     def build_pipelines_from_yaml(cls, yaml_path: str) -> List[Pipeline]:
         """Build pipelines dynamically from YAML config."""
+        return [stage.pipeline for stage in cls.build_stages_from_yaml(yaml_path)]
+
+    @classmethod
+    def build_stages_from_yaml(cls, yaml_path: str) -> List[PipelineStage]:
+        """Build pipelines from YAML config, keeping each entry's name and `depends_on` list.
+
+        `depends_on` may be a single stage name or a list of names; it is only
+        used by the orchestrator's DAG mode and is ignored by sequential runs.
+        """
         with open(yaml_path, "r") as f:
             config = yaml.safe_load(f)
 
-        pipelines: List[Pipeline] = []
+        stages: List[PipelineStage] = []
 
         for entry in config.get("pipelines", []):
             if not entry.get("enabled", True):
@@ -77,11 +86,18 @@ class PipelineFactory:
 
                     logger.info(f"Used __init__() to create pipeline '{entry.get('name')}'")
 
-                pipelines.append(pipeline_instance)
+                depends_on = entry.get("depends_on") or []
+                if isinstance(depends_on, str):
+                    depends_on = [depends_on]
+                stages.append(PipelineStage(
+                    name=entry.get("name") or class_name,
+                    pipeline=pipeline_instance,
+                    depends_on=list(depends_on),
+                ))
                 cls.register_pipeline(entry.get("name"), pipeline_instance)
                 logger.info(f"Pipeline '{entry.get('name')}' ({pipeline_type}) created successfully")
 
             except Exception as e:
                 logger.error(f"Failed to create pipeline '{entry.get('name')}': {e}")
 
-        return pipelines
\ No newline at end of file
+        return stages
\ No newline at end of file
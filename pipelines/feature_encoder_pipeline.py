@@ -1,6 +1,7 @@
 # pipelines/feature_encoder_pipeline.py
 from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
+from scipy import sparse
 from logs.logger import get_logger
 from pipelines.base import Pipeline
 from encoders.factory import EncoderFactory
@@ -92,6 +93,14 @@ class FeatureEncoderPipeline(Pipeline):
                     self.logger.info(f"Replaced column '{col}' with {transformed.shape[1]} encoded columns from {encoder.__class__.__name__}")
                 elif isinstance(transformed, pd.Series):
                     out[col] = transformed
+                elif sparse.issparse(transformed):
+                    # e.g. multihot with output: csr; keep it sparse rather than densifying
+                    names = getattr(encoder, "categories_", None) or range(transformed.shape[1])
+                    df_new = pd.DataFrame.sparse.from_spmatrix(
+                        transformed, index=out.index, columns=[f"{col}__{c}" for c in names]
+                    )
+                    out = pd.concat([out.drop(columns=[col]), df_new], axis=1)
+                    self.logger.info(f"Replaced column '{col}' with {df_new.shape[1]} sparse encoded columns from {encoder.__class__.__name__}")
                 else:
                     # numpy array or other iterable
                     import numpy as _np
@@ -79,5 +79,6 @@ class OireachtasMembersPipeline:
             # Save normalized data (extractor handles normalization)
             self.extractor.save_data(batch)
 
+        self.logger.info(f"HTTP client stats: {self.context.client.stats()}")
         self.logger.info("Oireachtas members pipeline completed")
 
@@ -71,6 +71,7 @@ class OireachtasPartiesPipeline:
             cleaned = [self._map_record(r) for r in batch]
             self.extractor.save_data(cleaned)
 
+        self.logger.info(f"HTTP client stats: {self.context.client.stats()}")
         self.logger.info("Oireachtas parties pipeline completed")
 
     @staticmethod
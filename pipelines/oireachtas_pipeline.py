@@ -5,6 +5,7 @@ from data.sqlalchemy_connector import SQLAlchemyConnector
 from data.extractors import (OireachtasQuestionExtractor, OireachtasDebateExtractor)
 from data.services.oireachtas_question_service import OireachtasQuestionIngestionService
 from data.models import OireachtasQuestion
+from utils.checkpoint_store import CheckpointStore
 from logs.logger import get_logger
 import pandas as pd
 
@@ -12,12 +13,15 @@ import pandas as pd
 class OireachtasDataPipeline:
 
     def __init__(self, connector=None,  api_key=None, chunk_size=100,
-        date_start = None,  date_end = None ):
+        date_start = None,  date_end = None, fetch_concurrency: int = 1,
+        upsert_batch_size: int = 1000, checkpoint=None, answer_workers: int = 8,
+        write_workers: int = 1, queue_size: int = 2000):
         self.logger = get_logger(self.__class__.__name__)
         self.connector = connector or SQLAlchemyConnector()
         self.connector.create_tables(base=OireachtasQuestion.__base__)
 
-        self.context = FetcherContext(api_key=api_key)
+        # fetch_concurrency > 1 fetches the remaining skip pages of each range concurrently
+        self.context = FetcherContext(api_key=api_key, concurrency=fetch_concurrency)
         self.date_start = date_start
         self.date_end = date_end
 
@@ -28,12 +32,20 @@ class OireachtasDataPipeline:
 
         self.question_extractor = OireachtasQuestionExtractor(
             connector=self.connector,
-            chunk_size=chunk_size,
+            upsert_batch_size=upsert_batch_size,
         )
+        # checkpoint: true | {path: ...} records each saved month/day so a restart resumes
+        self.checkpoint = CheckpointStore.from_config(checkpoint)
         self.question_ingestion_service = OireachtasQuestionIngestionService(
             fetcher=self.question_fetcher,
             extractor=self.question_extractor,
             chunk_size=chunk_size,
+            checkpoint=self.checkpoint,
+            # fetch_concurrency pages → answer_workers XML fetch/parse → write_workers DB writes,
+            # connected by queues of at most queue_size records
+            answer_workers=answer_workers,
+            write_workers=write_workers,
+            queue_size=queue_size,
         )
 
         self.debate_fetcher = FetcherFactory.create(
@@ -43,7 +55,7 @@ class OireachtasDataPipeline:
 
         self.debate_extractor = OireachtasDebateExtractor(
             connector=self.connector,
-            chunk_size=chunk_size,
+            upsert_batch_size=upsert_batch_size,
         )
 
 
@@ -78,6 +90,7 @@ class OireachtasDataPipeline:
         # else:
         #     self.logger.info("No questions fetched")
 
+        self.logger.info(f"HTTP client stats: {self.context.client.stats()}")
         self.logger.info("Oireachtas pipeline completed")
 
         return None
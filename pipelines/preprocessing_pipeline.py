@@ -1,10 +1,17 @@
 # pipelines/preprocessing_pipeline.py
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
 from pipelines.base import Pipeline
+from preprocessing.base import Preprocessor
 from preprocessing.factory import PreprocessorFactory
+from preprocessing.fused import FusedTextPreprocessor
+from preprocessing.sharded import ShardedExecutor
+from utils.stage_cache import StageCache
 from logs.logger import get_logger
 
+# (name, preprocessor, configs it was built from)
+TextStep = Tuple[str, Preprocessor, List[Dict[str, Any]]]
+
 
 class PreprocessingPipeline(Pipeline):
     """Pipeline that applies a sequence of text and/or data preprocessors to a dataset.
@@ -43,8 +50,31 @@ class PreprocessingPipeline(Pipeline):
             days_since: true
             prefix: 'release'
 
+    Optional stage cache (see utils.stage_cache.StageCache): when set, the output is stored
+    on disk keyed by the input DataFrame's content and the preprocessor config, and an
+    unchanged re-run returns it without rebuilding or re-running any preprocessor.
+    params:
+      cache:
+        dir: cache/stages
+        max_size_mb: 2048
+
+    Consecutive stateless string preprocessors (lowercase, remove_urls, emoji_remover,
+    remove_punctuation_noise, remove_repeated_characters, remove_whitespace, stopword_remover)
+    are fused into one per-document pass over the texts, with identical output.
+    Set `fuse_text: false` to run them one by one.
+
+    Optional multiprocessing: with `n_jobs` other than 1 (-1 = all cores), the stateless text
+    steps above, and data preprocessors that work row by row (mask_genre_words,
+    remove_html_tags), run over row chunks on a process pool, with output in the original
+    order. Only inputs with at least `shard_min_rows` rows are sharded.
+    params:
+      n_jobs: -1
+      shard_size: 20000        # rows per chunk (default: about 4 chunks per process)
+      shard_min_rows: 10000
+
     Notes:
     - 'applies_to' defaults to 'text' so existing configs are unaffected.
+    - The cache key does not cover preprocessor code; clear the cache dir after changing it.
     - Preprocessors with 'both' will be attempted on the DataFrame first, and
       then (if a text_field is set) against the list of texts. Failures for one
       target won't prevent attempting the other; errors are logged.
@@ -56,6 +86,11 @@ class PreprocessingPipeline(Pipeline):
         text_field: Optional[str] = None,
         data_preprocessors: Optional[List[Dict[str, Any]]] = None,
         name: Optional[str] = None,
+        cache: Optional[Any] = None,
+        fuse_text: bool = True,
+        n_jobs: Optional[int] = 1,
+        shard_size: Optional[int] = None,
+        shard_min_rows: int = 10_000,
     ):
         # Ensure base initializer runs
         super().__init__(name=name)
@@ -71,6 +106,10 @@ class PreprocessingPipeline(Pipeline):
         self.legacy_data_preprocessors = data_preprocessors or []
         self.text_field = text_field
         self.logger.info(f"Text field: {self.text_field}")
+        self.cache = StageCache.from_config(cache)
+        self.fuse_text = fuse_text
+        self.executor = ShardedExecutor(n_jobs, chunk_size=shard_size, min_rows=shard_min_rows)
+        self.logger.info(f"Sharding over {self.executor.n_jobs} process(es)")
 
         # Split into three internal lists according to 'applies_to'
         (
@@ -102,6 +141,11 @@ class PreprocessingPipeline(Pipeline):
             text_field=text_field,
             data_preprocessors=data_preprocessors,
             name=name,
+            cache=params.get("cache"),
+            fuse_text=params.get("fuse_text", True),
+            n_jobs=params.get("n_jobs", 1),
+            shard_size=params.get("shard_size"),
+            shard_min_rows=params.get("shard_min_rows", 10_000),
         )
 
     def _split_preprocessors(self, preprocessors: List[Dict[str, Any]], legacy_data: List[Dict[str, Any]]):
@@ -154,6 +198,30 @@ class PreprocessingPipeline(Pipeline):
         if data is None or not isinstance(data, pd.DataFrame):
             raise ValueError("Input must be a pandas DataFrame for PreprocessingPipeline")
 
+        cache_key = None
+        if self.cache is not None:
+            cache_key = StageCache.make_key(
+                "preprocessing",
+                {
+                    "text_field": self.text_field,
+                    "preprocessors": self.raw_preprocessors,
+                    "data_preprocessors": self.legacy_data_preprocessors,
+                },
+                StageCache.fingerprint(data),
+            )
+            cached = self.cache.get_frame(cache_key)
+            if cached is not None:
+                self.logger.info("PreprocessingPipeline completed (from stage cache)")
+                return cached
+
+        df = self._run_preprocessors(data)
+        if cache_key is not None:
+            self.cache.put_frame(cache_key, df)
+
+        self.logger.info("PreprocessingPipeline completed")
+        return df
+
+    def _run_preprocessors(self, data: pd.DataFrame) -> pd.DataFrame:
         df = data.copy()
         # Apply data-level preprocessors (each receives/returns DataFrame)
         for pre_cfg in self.data_preprocessors:
@@ -166,8 +234,7 @@ class PreprocessingPipeline(Pipeline):
                 self.logger.warning(f"Could not construct data preprocessor {name}: {e}")
                 continue
             try:
-                pre.fit(df)
-                df = pre.transform(df)
+                df = self._apply_to_frame(pre, pre_cfg, df)
             except Exception as e:
                 self.logger.exception(f"Data preprocessor {name} failed: {e}")
 
@@ -182,8 +249,7 @@ class PreprocessingPipeline(Pipeline):
                 self.logger.warning(f"Could not construct 'both' preprocessor {name} for DataFrame application: {e}")
                 continue
             try:
-                pre.fit(df)
-                df = pre.transform(df)
+                df = self._apply_to_frame(pre, pre_cfg, df)
             except Exception as e:
                 self.logger.warning(f"Applying preprocessor {name} to DataFrame failed or is unsupported: {e}")
 
@@ -191,40 +257,82 @@ class PreprocessingPipeline(Pipeline):
         if self.text_field:
             texts = df[self.text_field].fillna("").tolist()
 
-            for pre_cfg in self.text_preprocessors:
-                name = pre_cfg.get("name")
-                params = pre_cfg.get("params", {})
-                self.logger.info(f"Applying text preprocessor: {name} with params: {params}")
+            # text preprocessors, then 'both' preprocessors applied to the text list
+            steps = []
+            for label, cfgs in (("text", self.text_preprocessors), ("'both'", self.both_preprocessors)):
+                for pre_cfg in cfgs:
+                    name = pre_cfg.get("name")
+                    params = pre_cfg.get("params", {})
+                    self.logger.info(f"Applying {label} preprocessor to texts: {name} with params: {params}")
+                    try:
+                        steps.append((name, PreprocessorFactory.create(name, **params), [pre_cfg]))
+                    except Exception as e:
+                        self.logger.warning(f"Could not construct {label} preprocessor {name} for text application: {e}")
+
+            for name, pre, step_cfgs in self._fuse_text_steps(steps):
                 try:
-                    pre = PreprocessorFactory.create(name, **params)
+                    texts = self._apply_to_texts(pre, step_cfgs, texts)
                 except Exception as e:
-                    self.logger.warning(f"Could not construct text preprocessor {name}: {e}")
-                    continue
-                try:
-                    texts = pre.fit_transform(texts)
-                except Exception as e:
-                    self.logger.exception(f"Text preprocessor {name} failed: {e}")
-
-            # Apply 'both' preprocessors to the text list (if any)
-            for pre_cfg in self.both_preprocessors:
-                name = pre_cfg.get("name")
-                params = pre_cfg.get("params", {})
-                self.logger.info(f"Applying 'both' preprocessor to texts: {name} with params: {params}")
-                try:
-                    pre = PreprocessorFactory.create(name, **params)
-                except Exception as e:
-                    self.logger.warning(f"Could not construct 'both' preprocessor {name} for text application: {e}")
-                    continue
-                try:
-                    texts = pre.fit_transform(texts)
-                except Exception as e:
-                    self.logger.warning(f"Applying preprocessor {name} to texts failed or is unsupported: {e}")
+                    if not isinstance(pre, FusedTextPreprocessor):
+                        self.logger.exception(f"Text preprocessor {name} failed: {e}")
+                        continue
+                    # rerun the fused steps one by one so only the failing step is skipped
+                    self.logger.warning(f"Fused text preprocessors {name} failed ({e}); running them one at a time")
+                    for step_cfg, step in zip(step_cfgs, pre.steps):
+                        try:
+                            texts = self._apply_to_texts(step, [step_cfg], texts)
+                        except Exception as step_error:
+                            self.logger.exception(f"Text preprocessor {step_cfg.get('name')} failed: {step_error}")
 
             df = df.copy()
             df[self.text_field] = texts
 
-        self.logger.info("PreprocessingPipeline completed")
         return df
 
+    def _apply_to_frame(self, pre: Preprocessor, pre_cfg: Dict[str, Any], df: pd.DataFrame) -> pd.DataFrame:
+        if pre.row_independent and self.executor.should_shard(len(df)):
+            return self.executor.map_frame(pre_cfg, df)
+        pre.fit(df)
+        return pre.transform(df)
+
+    def _apply_to_texts(self, pre: Preprocessor, step_cfgs: List[Dict[str, Any]], texts: List[Any]) -> List[Any]:
+        if FusedTextPreprocessor.can_fuse(pre) and self.executor.should_shard(len(texts)):
+            return self.executor.map_texts(step_cfgs, texts)
+        return pre.fit_transform(texts)
+
+    def _fuse_text_steps(self, steps: List[TextStep]) -> List[TextStep]:
+        """Merge each run of consecutive stateless string preprocessors into one FusedTextPreprocessor.
+
+        The fused run makes a single pass over the texts and returns exactly what the steps
+        would have produced one after another; other steps keep their place in the sequence.
+        If the fused pass raises, its steps are rerun one at a time and only the failing one is skipped.
+        Each entry carries the configs it was built from, so it can be rebuilt in worker processes.
+        """
+        if not self.fuse_text:
+            return steps
+
+        fused: List[TextStep] = []
+        run: List[TextStep] = []
+
+        def flush():
+            if len(run) > 1:
+                fused.append((
+                    "+".join(n for n, _, _ in run),
+                    FusedTextPreprocessor([p for _, p, _ in run]),
+                    [c for _, _, cfgs in run for c in cfgs],
+                ))
+            else:
+                fused.extend(run)
+            run.clear()
+
+        for step in steps:
+            if FusedTextPreprocessor.can_fuse(step[1]):
+                run.append(step)
+            else:
+                flush()
+                fused.append(step)
+        flush()
+        return fused
+
 
 # Note: we intentionally kept execute signature compatible with Pipeline.execute (data optional)
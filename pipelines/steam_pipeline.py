@@ -4,12 +4,29 @@ from data.models import SteamGame
 from fetchers.factory import FetcherFactory
 from data.factory import ExtractorFactory
 from data.sqlalchemy_connector import SQLAlchemyConnector
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 from logs.logger import get_logger
 from fetchers.context import FetcherContext
+from utils.checkpoint_store import CheckpointStore
 BATCH_SIZE = 100  # store fetch batch size
+PREFETCH_BATCHES = 2  # batches in flight ahead of the one being persisted (concurrent mode)
+CHECKPOINT_JOB = "steam_apps"
 class SteamDataPipeline:
-    """End-to-end pipeline for fetching and saving Steam API data."""
+    """End-to-end pipeline for fetching and saving Steam API data.
+
+    With `concurrency` above 1 the store, review and player-count requests of every app run
+    together on a thread pool of that size. All of them go through the context's shared
+    HttpClient, so the single steampowered.com token bucket (200 calls per 5 minutes) still
+    paces the whole run. Up to PREFETCH_BATCHES batches are fetched ahead while a single
+    writer thread maps and saves finished batches in order.
+
+    With a `checkpoint` (CheckpointStore, `True` or `{"path": ...}`) the apps of a saved batch
+    are recorded, and apps already recorded are skipped on the next run. Apps whose store
+    request failed are left out so the next run retries them; apps Steam answered with
+    `success: false`, and apps saved without their reviews, are recorded.
+    """
 
 
     def __init__(
@@ -18,7 +35,9 @@ class SteamDataPipeline:
         chunk_size: int = 100,
         limit_apps: Optional[int] = None,
         api_key: Optional[str] = None,
-        offset_apps: int = 0
+        offset_apps: int = 0,
+        concurrency: int = 1,
+        checkpoint=None
     ):
         self.logger = get_logger(self.__class__.__name__)
         self.logger.info("Initializing SteamDataPipeline")
@@ -26,11 +45,13 @@ class SteamDataPipeline:
         self.chunk_size = chunk_size
         self.limit_apps = limit_apps
         self.offset_apps = offset_apps
+        self.concurrency = max(1, int(concurrency))
+        self.checkpoint = CheckpointStore.from_config(checkpoint)
         self.connector.create_tables(base=SteamGame.__base__)
 
 
         # Create shared context
-        self.fetcher_context = FetcherContext(api_key=api_key)
+        self.fetcher_context = FetcherContext(api_key=api_key, concurrency=self.concurrency)
 
         # Create fetchers
         self.logger.info("Creating steam app list fetcher")
@@ -60,29 +81,102 @@ class SteamDataPipeline:
         if self.limit_apps:
             app_ids = app_ids[:self.limit_apps]
 
-        for i in range(0, len(app_ids), BATCH_SIZE):
-            batch = app_ids[i:i + BATCH_SIZE]
-            self.logger.info(f"Processing apps {i}–{i + len(batch)}")
-
-            store_data = self.store_fetcher.fetch(batch)
-            review_data = self.review_fetcher.fetch(batch)
-            current_user_data = self.current_user_fetcher.fetch(batch)
+        if self.checkpoint is not None:
+            done = self.checkpoint.completed(CHECKPOINT_JOB)
+            remaining = [a for a in app_ids if str(a) not in done]
+            self.logger.info(f"Skipping {len(app_ids) - len(remaining)} checkpointed apps, {len(remaining)} remaining")
+            app_ids = remaining
 
-            review_lookup = {r["AppID"]: r for r in review_data}
-            current_user_lookup = {u["AppID"]: u for u in current_user_data}
+        if self.concurrency > 1:
+            self._run_concurrent(app_ids)
+        else:
+            for i in range(0, len(app_ids), BATCH_SIZE):
+                batch = app_ids[i:i + BATCH_SIZE]
+                self.logger.info(f"Processing apps {i}–{i + len(batch)}")
 
-            mapped = []
+                store_data = self.store_fetcher.fetch(batch)
+                review_data = self.review_fetcher.fetch(batch)
+                current_user_data = self.current_user_fetcher.fetch(batch)
 
-            for app in store_data:
-                app_id = app.get("steam_appid")
-                if app_id in review_lookup:
-                    app.update(review_lookup[app_id])
-                if app_id in current_user_lookup:
-                    app.update(current_user_lookup[app_id])
-
-                mapped.append(map_payload_to_steamgame(app))
-
-            self.steam_extractor.save_data(mapped)
-            self.logger.info(f"Saved {len(mapped)} apps to database")
+                self._save_batch(batch, store_data, review_data, current_user_data)
 
+        self.logger.info(f"HTTP client stats: {self.fetcher_context.client.stats()}")
         self.logger.info("Steam data pipeline completed successfully")
+
+    def _run_concurrent(self, app_ids: List[int]) -> None:
+        """Fetch batches on a thread pool while the previous batch is being persisted."""
+        self.logger.info(f"Fetching {len(app_ids)} apps with concurrency={self.concurrency}")
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool, \
+                ThreadPoolExecutor(max_workers=1) as writer:
+            in_flight = deque()
+            pending_save = None
+            starts = iter(range(0, len(app_ids), BATCH_SIZE))
+
+            def submit_next() -> None:
+                i = next(starts, None)
+                if i is not None:
+                    batch = app_ids[i:i + BATCH_SIZE]
+                    in_flight.append((i, batch, self._submit_batch(pool, batch, first=(i == 0))))
+
+            for _ in range(PREFETCH_BATCHES):
+                submit_next()
+
+            while in_flight:
+                i, batch, (store, reviews, users) = in_flight.popleft()
+                submit_next()
+
+                store_data = [d for d in (f.result() for f in store) if d is not None]
+                review_data = [r for r in (f.result() for f in reviews) if r is not None]
+                current_user_data = [f.result() for f in users]
+                self.logger.info(f"Fetched apps {i}–{i + len(batch)}")
+
+                # one save at a time, in batch order; surfaces the previous save's errors
+                if pending_save is not None:
+                    pending_save.result()
+                pending_save = writer.submit(self._save_batch, batch, store_data, review_data, current_user_data)
+
+            if pending_save is not None:
+                pending_save.result()
+
+    def _submit_batch(self, pool: ThreadPoolExecutor, batch: List[int], first: bool = False):
+        """Queue the three per-app requests of every app in `batch`; futures keep app order."""
+        store = [
+            pool.submit(self.store_fetcher.fetch_one, app_id, dump_debug=(first and j == 0))
+            for j, app_id in enumerate(batch)
+        ]
+        reviews = [
+            pool.submit(self.review_fetcher.fetch_one, app_id, dump_debug=(first and j == 0))
+            for j, app_id in enumerate(batch)
+        ]
+        users = [pool.submit(self.current_user_fetcher.fetch_one, app_id) for app_id in batch]
+        return store, reviews, users
+
+    def _save_batch(self, batch: List[int], store_data: list, review_data: list, current_user_data: list) -> None:
+        review_lookup = {r["AppID"]: r for r in review_data}
+        current_user_lookup = {u["AppID"]: u for u in current_user_data}
+
+        mapped = []
+
+        for app in store_data:
+            app_id = app.get("steam_appid")
+            if app_id in review_lookup:
+                app.update(review_lookup[app_id])
+            if app_id in current_user_lookup:
+                app.update(current_user_lookup[app_id])
+
+            mapped.append(map_payload_to_steamgame(app))
+
+        self.steam_extractor.save_data(mapped)
+        self.logger.info(f"Saved {len(mapped)} apps to database")
+        # drain the failures even without a checkpoint so they do not pile up over a long run.
+        # Only a failed store request keeps an app out of the save; an app whose reviews failed
+        # was saved without them, and retrying it would insert a second row (AppID is not unique).
+        failed = self.store_fetcher.failures.pop(batch)
+        review_failed = self.review_fetcher.failures.pop(batch)
+        if review_failed:
+            self.logger.warning(f"{len(review_failed)} apps were saved without review data")
+        if self.checkpoint is not None:
+            done = [app_id for app_id in batch if app_id not in failed]
+            self.checkpoint.mark_many(CHECKPOINT_JOB, done)
+            if failed:
+                self.logger.warning(f"{len(failed)} apps failed to fetch and will be retried on the next run")
@@ -23,6 +23,7 @@ from .count_features import CountFeatures
 from .catalog_count import CatalogCount
 from .normalise_feature import NormaliseFeature
 from .cyclic_encode import CyclicEncode
+from .fused import FusedTextPreprocessor
 import nltk
 
 # Register built-in preprocessors
@@ -84,4 +85,5 @@ __all__ = ["Preprocessor", "PreprocessorFactory", "Stemmer", "Lemmatizer",
            "Lowercase", "StopwordRemover", "EmojiRemover", "FilterRows", "MaskGenreWords",
            "RemoveDuplicates", "RemoveURLs", "RemoveRepeatedCharacters", "RemovePunctuationNoise",
            "RemoveWhitespace", "MergeFeatures", "CountFeatures", "ExplodeColumns", "RemoveHTMLTags",
-           "LogTransform", "TemporalFeatures", "CatalogCount", "NormaliseFeature", "CyclicEncode"]
+           "LogTransform", "TemporalFeatures", "CatalogCount", "NormaliseFeature", "CyclicEncode",
+           "FusedTextPreprocessor"]
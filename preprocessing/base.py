@@ -1,6 +1,6 @@
 # preprocessing/base.py
 from abc import ABC, abstractmethod
-from typing import Iterable, List
+from typing import Any, Callable, Iterable, List, Optional
 
 
 class Preprocessor(ABC):
@@ -12,6 +12,10 @@ class Preprocessor(ABC):
     - fit_transform: convenience
     """
 
+    # True when transforming a DataFrame row slice gives the same rows as transforming the
+    # whole frame (no fitted state, no cross-row logic); such steps may be sharded by rows
+    row_independent = False
+
     @abstractmethod
     def fit(self, X: Iterable[str]):
         """Learn any state from X if required. Return self."""
@@ -24,3 +28,11 @@ class Preprocessor(ABC):
         self.fit(X)
         return self.transform(X)
 
+    def text_function(self) -> Optional[Callable[[Any], Any]]:
+        """Per-document function equivalent to `transform` on a list of texts, or None.
+
+        Stateless string preprocessors return one so FusedTextPreprocessor can run several
+        of them in a single pass over the texts.
+        """
+        return None
+
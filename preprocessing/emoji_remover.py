@@ -1,5 +1,5 @@
 # preprocessing/emoji_remover.py
-from typing import Iterable, List, Optional, Pattern
+from typing import FrozenSet, Iterable, List, Optional, Pattern
 from .base import Preprocessor
 from logs.logger import get_logger
 import re
@@ -34,6 +34,7 @@ class EmojiRemover(Preprocessor):
         self.logger.info(f"Initializing EmojiRemover use_emoji_lib={use_emoji_lib} regexes={bool(regexes)}")
         self.use_emoji_lib = bool(use_emoji_lib)
         self._emoji_mod = _emoji_mod if self.use_emoji_lib else None
+        self._emoji_chars = self._build_emoji_chars(self._emoji_mod)
 
         # compile a combined regex if regexes provided
         self._compiled: Optional[Pattern] = None
@@ -46,6 +47,24 @@ class EmojiRemover(Preprocessor):
                 self.logger.warning(f"Failed to compile provided regexes: {e}; ignoring regexes")
                 self._compiled = None
 
+    @staticmethod
+    def _build_emoji_chars(emoji_mod) -> Optional[FrozenSet[str]]:
+        """Every non-ASCII character that occurs in an emoji sequence.
+
+        Every emoji sequence contains at least one of these, so a text without any of them
+        has nothing for the (slow, pure-Python) emoji library to replace.
+        """
+        emoji_data = getattr(emoji_mod, "EMOJI_DATA", None)
+        if not isinstance(emoji_data, dict):
+            return None
+        chars = frozenset(c for key in emoji_data for c in key if not c.isascii())
+        return chars or None
+
+    def _may_contain_emoji(self, s: str) -> bool:
+        if self._emoji_chars is None:
+            return True
+        return not s.isascii() and not self._emoji_chars.isdisjoint(s)
+
     def fit(self, X: Iterable[str]):
         # stateless
         return self
@@ -55,40 +74,7 @@ class EmojiRemover(Preprocessor):
         out: List[str] = []
 
         for i, doc in enumerate(X):
-            s = "" if doc is None else str(doc)
-
-            # apply user-provided regex removals first
-            if self._compiled is not None:
-                try:
-                    s = self._compiled.sub("", s)
-                except Exception as e:
-                    self.logger.warning(f"Regex-based emoji removal failed on index {i}: {e}")
-
-            # then try emoji library if available
-            if self._emoji_mod is not None:
-                try:
-                    # newer emoji package provides replace_emoji
-                    if hasattr(self._emoji_mod, "replace_emoji"):
-                        s = self._emoji_mod.replace_emoji(s, replace="")
-                    # fallback to get_emoji_regexp if available
-                    elif hasattr(self._emoji_mod, "get_emoji_regexp"):
-                        regexp = self._emoji_mod.get_emoji_regexp()
-                        s = regexp.sub("", s)
-                    else:
-                        # last resort: attempt to remove characters in emoji.EMOJI_DATA (if present)
-                        emoji_data = getattr(self._emoji_mod, "EMOJI_DATA", None)
-                        if emoji_data is not None and isinstance(emoji_data, dict):
-                            # build char class from keys (may be large) -- guard with try
-                            try:
-                                chars = "".join(re.escape(c) for c in emoji_data.keys())
-                                fallback_re = re.compile(f"[{chars}]")
-                                s = fallback_re.sub("", s)
-                            except Exception:
-                                # give up silently
-                                pass
-                except Exception as e:
-                    self.logger.warning(f"Emoji library based removal failed on index {i}: {e}")
-
+            s = self._remove(doc)
             out.append(s)
 
             if i < 3:
@@ -101,6 +87,50 @@ class EmojiRemover(Preprocessor):
         self.logger.info("Completed EmojiRemover transformation")
         return out
 
+    def _remove(self, doc) -> str:
+        s = "" if doc is None else str(doc)
+
+        # apply user-provided regex removals first
+        if self._compiled is not None:
+            try:
+                s = self._compiled.sub("", s)
+            except Exception as e:
+                self.logger.warning(f"Regex-based emoji removal failed on {doc!r}: {e}")
+
+        # then try emoji library if available (skipped when no emoji character is present)
+        if self._emoji_mod is not None and self._may_contain_emoji(s):
+            try:
+                # newer emoji package provides replace_emoji
+                if hasattr(self._emoji_mod, "replace_emoji"):
+                    # no emoji sequence contains a space, so only the words holding an
+                    # emoji character go through the library's per-character tokenizer
+                    s = " ".join(
+                        self._emoji_mod.replace_emoji(word, replace="") if self._may_contain_emoji(word) else word
+                        for word in s.split(" ")
+                    )
+                # fallback to get_emoji_regexp if available
+                elif hasattr(self._emoji_mod, "get_emoji_regexp"):
+                    regexp = self._emoji_mod.get_emoji_regexp()
+                    s = regexp.sub("", s)
+                else:
+                    # last resort: attempt to remove characters in emoji.EMOJI_DATA (if present)
+                    emoji_data = getattr(self._emoji_mod, "EMOJI_DATA", None)
+                    if emoji_data is not None and isinstance(emoji_data, dict):
+                        # build char class from keys (may be large) -- guard with try
+                        try:
+                            chars = "".join(re.escape(c) for c in emoji_data.keys())
+                            fallback_re = re.compile(f"[{chars}]")
+                            s = fallback_re.sub("", s)
+                        except Exception:
+                            # give up silently
+                            pass
+            except Exception as e:
+                self.logger.warning(f"Emoji library based removal failed on {doc!r}: {e}")
+        return s
+
+    def text_function(self):
+        return self._remove
+
     def get_params(self) -> dict:
         return {"use_emoji_lib": self.use_emoji_lib, "has_regex": self._compiled is not None}
 
@@ -0,0 +1,64 @@
+# preprocessing/fused.py
+from typing import Any, Callable, Iterable, List, Sequence
+from .base import Preprocessor
+from logs.logger import get_logger
+
+_MISSING = object()
+
+
+class FusedTextPreprocessor(Preprocessor):
+    """Runs several stateless string preprocessors in one pass over the texts.
+
+    Each step contributes its `text_function()` (the same per-document function its own
+    `transform` maps over a list), and every document goes through the whole chain before
+    the next one is touched: one loop and one output list instead of one per step, and each
+    distinct string is processed once. The output is identical to calling the steps'
+    `fit_transform` one after another on a list.
+    """
+
+    def __init__(self, steps: Sequence[Preprocessor]):
+        self.logger = get_logger(self.__class__.__name__)
+        self.steps = list(steps)
+        self._functions: List[Callable[[Any], Any]] = []
+        for step in self.steps:
+            fn = step.text_function()
+            if fn is None:
+                raise ValueError(f"{step.__class__.__name__} has no text_function and cannot be fused")
+            self._functions.append(fn)
+        self.logger.info(f"Fused text steps: {[s.__class__.__name__ for s in self.steps]}")
+
+    @staticmethod
+    def can_fuse(step: Preprocessor) -> bool:
+        return step.text_function() is not None
+
+    def fit(self, X: Iterable[Any]):
+        # fusable steps are stateless
+        return self
+
+    def transform(self, X: Iterable[Any]) -> List[Any]:
+        chain = self.text_function()
+        # the chain is a pure function of the document, so repeated texts (boilerplate
+        # replies, standard question wording) are normalised once
+        seen = {}
+        out = []
+        append = out.append
+        for doc in X:
+            if doc.__class__ is str:
+                result = seen.get(doc, _MISSING)
+                if result is _MISSING:
+                    result = seen[doc] = chain(doc)
+                append(result)
+            else:
+                append(chain(doc))
+        self.logger.info(f"Fused pass over {len(out)} texts ({len(seen)} distinct strings)")
+        return out
+
+    def text_function(self):
+        functions = self._functions
+
+        def chain(doc):
+            for fn in functions:
+                doc = fn(doc)
+            return doc
+
+        return chain
@@ -0,0 +1,60 @@
+# preprocessing/lemma_cache.py
+import hashlib
+import os
+import re
+import sqlite3
+from typing import Dict, Iterable, List, Tuple
+
+from logs.logger import get_logger
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class LemmaCache:
+    """Persistent text -> lemmatised text cache for one spaCy model, in a SQLite file.
+
+    Entries are per document rather than per token: spaCy's lemmas depend on the part-of-speech
+    tag the tagger assigns in context, so only a whole-document hit is guaranteed to match what
+    the pipeline would have produced. The file name includes the model name and version, so a
+    model upgrade starts a fresh cache.
+    """
+
+    def __init__(self, cache_dir: str, model: str, model_version: str = ""):
+        self.logger = get_logger(self.__class__.__name__)
+        os.makedirs(cache_dir, exist_ok=True)
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{model}-{model_version}" if model_version else model)
+        self.path = os.path.join(cache_dir, f"lemmas-{slug}.sqlite")
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS lemmas (digest BLOB PRIMARY KEY, lemmas TEXT NOT NULL)")
+        self._conn.commit()
+        self.logger.info(f"Opened lemma cache {self.path} with {len(self)} documents")
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM lemmas").fetchone()[0]
+
+    def get_many(self, texts: Iterable[str]) -> Dict[str, str]:
+        """Return {text: lemmas} for the texts already in the cache."""
+        by_digest = {_digest(t): t for t in texts}
+        found: Dict[str, str] = {}
+        digests = list(by_digest)
+        # stay under SQLite's bound-parameter limit
+        for i in range(0, len(digests), 900):
+            chunk = digests[i:i + 900]
+            rows = self._conn.execute(
+                f"SELECT digest, lemmas FROM lemmas WHERE digest IN ({','.join('?' * len(chunk))})", chunk
+            )
+            for digest, lemmas in rows:
+                found[by_digest[digest]] = lemmas
+        return found
+
+    def put_many(self, pairs: List[Tuple[str, str]]) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO lemmas (digest, lemmas) VALUES (?, ?)",
+                ((_digest(t), lemmas) for t, lemmas in pairs),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
@@ -1,6 +1,8 @@
 # preprocessing/lemmatizer.py
-from typing import Iterable, List
+import time
+from typing import Iterable, List, Optional
 from .base import Preprocessor
+from .lemma_cache import LemmaCache
 from logs.logger import get_logger
 
 # dynamic import of spaCy to avoid hard dependency at import time
@@ -11,47 +13,94 @@ except Exception:
     spacy = None
 
 
+# components lemmatisation does not need; the rule lemmatizer only uses the tagger's POS tags
+_DISABLED = ("ner", "parser")
+
+# one loaded pipeline per model per process, shared by every Lemmatizer instance
+_MODELS = {}
+
+
+def _load_model(model: str):
+    if model not in _MODELS:
+        _MODELS[model] = spacy.load(model, disable=list(_DISABLED))
+    return _MODELS[model]
+
+
 class Lemmatizer(Preprocessor):
     """Lemmatizer that uses spaCy if available; otherwise no-op.
 
     Note: spaCy models are not included by default. This class will log a warning
     and behave as identity transform when spaCy or models are missing.
+
+    Options:
+    - n_process / batch_size: passed to `nlp.pipe`; n_process > 1 lemmatises in spaCy's
+      worker processes
+    - cache_dir: persistent lemma cache (see LemmaCache). Documents lemmatised in an earlier
+      run are read back instead of going through spaCy again.
+
+    The model is loaded once per process and reused across instances, and each distinct
+    text is lemmatised once per call.
     """
 
-    def __init__(self, model: str = "en_core_web_sm"):
+    def __init__(
+        self,
+        model: str = "en_core_web_sm",
+        n_process: int = 1,
+        batch_size: int = 1000,
+        cache_dir: Optional[str] = None,
+    ):
         self.logger = get_logger(self.__class__.__name__)
         self.logger.info(f"Initializing Lemmatizer with model='{model}'")
         self.model = model
+        self.n_process = n_process
+        self.batch_size = batch_size
+        self.cache_dir = cache_dir
+        self.cache = None
         self.nlp = None
         if spacy is None:
             self.logger.warning("spaCy not available; Lemmatizer will be a no-op")
         else:
             try:
-                self.nlp = spacy.load(model)
+                self.nlp = _load_model(model)
             except Exception:
                 self.logger.warning(f"spaCy model '{model}' not available; Lemmatizer will be a no-op")
                 self.nlp = None
+        if self.nlp is not None and cache_dir:
+            self.cache = LemmaCache(cache_dir, model, self.nlp.meta.get("version", ""))
 
     def fit(self, X: Iterable[str]):
         return self
 
     def transform(self, X: Iterable[str]) -> List[str]:
         self.logger.info("Starting Lemmatizer transformation")
+        texts = list(X)
+        if self.nlp is None:
+            return texts
 
-        #log sample before transformation
-        # sample_before = list(X)[:2]
-        # self.logger.info(f"Sample before lemmatization: {sample_before}")
+        unique = list(dict.fromkeys(texts))
+        lemmas = self.cache.get_many(unique) if self.cache is not None else {}
+        todo = [t for t in unique if t not in lemmas]
 
-        if self.nlp is None:
-            return list(X)
-        out = []
-        for doc in self.nlp.pipe(X, disable=["ner", "parser"]):
-            out.append(" ".join(tok.lemma_ for tok in doc))
-        self.logger.info("Completed Lemmatizer transformation")
+        start = time.perf_counter()
+        done = []
+        for text, doc in zip(todo, self.nlp.pipe(todo, batch_size=self.batch_size, n_process=self.n_process)):
+            lemmas[text] = " ".join(tok.lemma_ for tok in doc)
+            done.append((text, lemmas[text]))
+        elapsed = time.perf_counter() - start
 
-        # sample_after = out[:2]
-        # self.logger.info(f"Sample after lemmatization: {sample_after}")
-        return out
+        if self.cache is not None and done:
+            self.cache.put_many(done)
+        self.logger.info(
+            f"Completed Lemmatizer transformation: {len(texts)} texts, {len(unique)} distinct, "
+            f"{len(unique) - len(todo)} from cache, {len(todo)} lemmatised in {elapsed:.1f}s "
+            f"({len(todo) / elapsed if elapsed else 0.0:.1f} docs/s, n_process={self.n_process})"
+        )
+        return [lemmas[t] for t in texts]
 
     def get_params(self) -> dict:
-        return {"model": self.model}
\ No newline at end of file
+        return {
+            "model": self.model,
+            "n_process": self.n_process,
+            "batch_size": self.batch_size,
+            "cache_dir": self.cache_dir,
+        }
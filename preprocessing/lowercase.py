@@ -23,16 +23,20 @@ class Lowercase(Preprocessor):
 
     def transform(self, X: Iterable[str]) -> List[str]:
         self.logger.info("Starting Lowercase transformation")
-        out: List[str] = []
-        for i, v in enumerate(X):
-            try:
-                s = "" if v is None else str(v)
-                out.append(s.lower())
-            except Exception as e:
-                self.logger.warning(f"Lowercase transform failed for index {i}: {e}; using original value")
-                out.append(str(v))
+        out: List[str] = [self._lower(v) for v in X]
         self.logger.info("Completed Lowercase transformation")
         return out
 
+    def _lower(self, v) -> str:
+        try:
+            s = "" if v is None else str(v)
+            return s.lower()
+        except Exception as e:
+            self.logger.warning(f"Lowercase transform failed for value {v!r}: {e}; using original value")
+            return str(v)
+
+    def text_function(self):
+        return self._lower
+
     def get_params(self) -> dict:
         return {'lower_case': self.lower_case}
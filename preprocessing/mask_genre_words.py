@@ -1,5 +1,5 @@
 # preprocessing/mask_genre_words.py
-from typing import Iterable, List, Any, Optional
+from typing import Iterable, List, Any, Optional, Pattern
 from .base import Preprocessor
 from logs.logger import get_logger
 import re
@@ -22,6 +22,8 @@ class MaskGenreWords(Preprocessor):
       with `mask_token`.
     - Matching is done on word boundaries (default) and is case-insensitive
       by default.
+    - All tokens of a genre are matched by one compiled alternation, cached per distinct
+      genre value, so each description is scanned once.
 
     Parameters
     ----------
@@ -38,6 +40,8 @@ class MaskGenreWords(Preprocessor):
         default splits on common delimiters and whitespace.
     """
 
+    row_independent = True
+
     def __init__(
         self,
         genre_field: str = "Genre",
@@ -48,11 +52,15 @@ class MaskGenreWords(Preprocessor):
         split_pattern: Optional[str] = r"[,/;&|\-]\s*",
     ):
         self.logger = get_logger(self.__class__.__name__)
+        self.genre_field = genre_field
         self.description_field = description_field
         self.mask_token = mask_token
         self.case_sensitive = bool(case_sensitive)
         self.split_pattern = split_pattern
         self.genre_words = genre_words or []
+        # token tuple -> compiled pattern, and genre cell value -> compiled pattern
+        self._patterns = {}
+        self._genre_patterns = {}
 
         self.logger.info(
             f"Initialized MaskGenreWords(description_field={self.description_field}, mask_token={self.mask_token}, case_sensitive={self.case_sensitive})"
@@ -82,37 +90,69 @@ class MaskGenreWords(Preprocessor):
                 out.append(t)
         return out
 
+    def _pattern_for(self, tokens: List[str]) -> Optional[Pattern]:
+        """One compiled alternation per distinct token set, cached for the instance's lifetime.
+
+        Alternatives are ordered longest first, so at any position the longest token wins,
+        as it did when each token was substituted separately in length order.
+        """
+        key = tuple(tokens)
+        if key not in self._patterns:
+            unique = sorted({t for t in tokens if t}, key=lambda x: (-len(x), x))
+            flags = 0 if self.case_sensitive else re.IGNORECASE
+            # whole words starting with a token; escape tokens
+            self._patterns[key] = re.compile(
+                r"\b(?:" + "|".join(re.escape(t) for t in unique) + r")\w*\b", flags
+            ) if unique else None
+        return self._patterns[key]
+
+    def _pattern_for_genre(self, genre_value: Any) -> Optional[Pattern]:
+        if self.genre_words:
+            return self._pattern_for(self.genre_words)
+        # a missing genre masks nothing (str(NaN) would otherwise mask words starting "nan")
+        if genre_value is None or (
+            pd is not None and pd.api.types.is_scalar(genre_value) and pd.isna(genre_value)
+        ):
+            return None
+        key = genre_value if isinstance(genre_value, str) else str(genre_value)
+        if key not in self._genre_patterns:
+            self._genre_patterns[key] = self._pattern_for(self._tokens_from_genre(key))
+        return self._genre_patterns[key]
+
     def _mask_description(self, description: str, tokens: List[str]) -> str:
         if not description or not tokens:
             return description
-        out = description
-        flags = 0
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-        # sort tokens by length desc to avoid partial masking of longer tokens
-        tokens_sorted = sorted(tokens, key=lambda x: -len(x))
-        for tok in tokens_sorted:
-            if not tok:
-                continue
-            try:
-                # use word boundary to match whole words; escape token
-                #pattern = r"\b" + re.escape(tok) + r"\b"
-                pattern = r"\b" + re.escape(tok) + r"\w*\b"
-                out = re.sub(pattern, self.mask_token, out, flags=flags)
-            except re.error:
-                # fallback: simple replace
-                if self.case_sensitive:
-                    out = out.replace(tok, self.mask_token)
-                else:
-                    # case-insensitive replace via regex
-                    out = re.sub(re.escape(tok), self.mask_token, out, flags=re.IGNORECASE)
+        pattern = self._pattern_for(tokens)
+        return pattern.sub(self.mask_token, description) if pattern is not None else description
 
+    def mask_column(self, genres: Iterable[Any], descriptions: Iterable[Any]) -> List[Any]:
+        """Mask each description against its row's genre in one scan per description.
+
+        Columnar: takes the two columns as plain sequences, so no per-row Series is built;
+        patterns come from the per-genre cache. Non-string and empty descriptions pass through.
+        """
+        mask_token = self.mask_token
+        out = []
+        for genre, description in zip(genres, descriptions):
+            if description.__class__ is not str or not description:
+                out.append(description)
+                continue
+            pattern = self._pattern_for_genre(genre)
+            out.append(pattern.sub(mask_token, description) if pattern is not None else description)
         return out
 
     def fit(self, X: Iterable[Any]):
         # stateless
         return self
 
+    def text_function(self):
+        # plain texts can only be masked against the hardcoded genre_words
+        pattern = self._pattern_for(self.genre_words) if self.genre_words else None
+        if pattern is None:
+            return None
+        mask_token = self.mask_token
+        return lambda text: pattern.sub(mask_token, text) if isinstance(text, str) and text else text
+
     def transform(self, X: Iterable[Any]) -> List[Any]:
         """Transform data.
 
@@ -133,16 +173,10 @@ class MaskGenreWords(Preprocessor):
                 self.logger.warning(f"Description field '{self.description_field}' not in DataFrame; returning original DataFrame")
                 return df
 
-            def _mask_row(row):
-                self.logger.info(f"Masking row with genre: {row[self.genre_field]}")
-                try:
-                    tokens = self._tokens_from_genre(row[self.genre_field])
-                    return self._mask_description(row[self.description_field], tokens)
-                except Exception as e:
-                    self.logger.warning(f"Masking failed for row: {e}")
-                    return row[self.description_field]
-
-            df[self.description_field] = df.apply(_mask_row, axis=1)
+            df[self.description_field] = self.mask_column(
+                df[self.genre_field].tolist(), df[self.description_field].tolist()
+            )
+            self.logger.info(f"Masked {len(df)} rows using {len(self._genre_patterns) or 1} genre pattern(s)")
 
             self.logger.info(f"Example masked descriptions: {df[self.description_field].head().tolist()}")
             return df
@@ -19,6 +19,8 @@ class RemoveHTMLTags(Preprocessor):
     - strip: bool strip whitespace around results (default True)
     """
 
+    row_independent = True
+
     def __init__(self, columns: Optional[List[str]] = None, br_replace: str = ', ', strip: bool = True):
         self.columns = columns or []
         self.br_replace = br_replace
@@ -56,9 +56,13 @@ class RemovePunctuationNoise(Preprocessor):
     def fit_transform(self, X):
         return self.transform(X)
 
+    def text_function(self):
+        return self._clean_value
+
     # -------------------------------------------------------------------------
     def _clean_value(self, val):
-        if pd.isna(val):
+        # strings are never NA; skip the comparatively slow scalar pd.isna for them
+        if val.__class__ is not str and pd.isna(val):
             return val
         try:
             return self._pattern.sub(self.replace_with, str(val))
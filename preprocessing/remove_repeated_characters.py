@@ -70,16 +70,20 @@ class RemoveRepeatedCharacters(Preprocessor):
                 "RemoveRepeatedCharacters.transform expects a pandas.DataFrame, pandas.Series or iterable of strings"
             )
 
-        def _clean_val(val):
-            if pd.isna(val):
-                return val
-            try:
-                return self._pattern.sub(self.replace_with, str(val))
-            except Exception:
-                return val
-
         self.logger.info("Transforming iterable data with RemoveRepeatedCharacters")
-        return [_clean_val(v) for v in iterable]
+        return [self._clean_val(v) for v in iterable]
+
+    def _clean_val(self, val):
+        # strings are never NA; skip the comparatively slow scalar pd.isna for them
+        if val.__class__ is not str and pd.isna(val):
+            return val
+        try:
+            return self._pattern.sub(self.replace_with, str(val))
+        except Exception:
+            return val
+
+    def text_function(self):
+        return self._clean_val
 
     def fit_transform(self, X):
         self.fit(X)
@@ -1,5 +1,5 @@
 # preprocessing/remove_urls.py
-from typing import Iterable, List, Any, Optional
+from typing import Iterable, Any, Optional
 from .base import Preprocessor
 from logs.logger import get_logger
 import re
@@ -83,27 +83,30 @@ class RemoveURLs(Preprocessor):
             return df
 
         # Iterable/dict-like path
-        out: List[Any] = []
-        for item in X:
-            try:
-                if isinstance(item, dict) and self.field in item:
-                    copy = dict(item)
-                    copy[self.field] = self._remove_from_text(copy.get(self.field, ""))
-                    out.append(copy)
-                elif hasattr(item, 'get') and self.field in item:
-                    # pandas.Series-like
-                    try:
-                        new_item = dict(item)
-                        new_item[self.field] = self._remove_from_text(item.get(self.field, ""))
-                        out.append(new_item)
-                    except Exception:
-                        out.append(item)
-                else:
-                    # can't find field => leave unchanged
-                    out.append(item)
-            except Exception:
-                out.append(item)
-        return out
+        return [self._transform_item(item) for item in X]
+
+    def _transform_item(self, item: Any) -> Any:
+        try:
+            if isinstance(item, dict) and self.field in item:
+                copy = dict(item)
+                copy[self.field] = self._remove_from_text(copy.get(self.field, ""))
+                return copy
+            elif hasattr(item, 'get') and self.field in item:
+                # pandas.Series-like
+                try:
+                    new_item = dict(item)
+                    new_item[self.field] = self._remove_from_text(item.get(self.field, ""))
+                    return new_item
+                except Exception:
+                    return item
+            # can't find field => leave unchanged
+            return item
+        except Exception:
+            return item
+
+    def text_function(self):
+        # mirrors the iterable path exactly: plain strings have no field and pass through
+        return self._transform_item
 
     def get_params(self) -> dict:
         return {"field": self.field, "pattern": self.pattern, "replace_with": self.replace_with}
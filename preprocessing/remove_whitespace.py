@@ -56,15 +56,7 @@ class RemoveWhitespace(Preprocessor):
                 "RemoveWhitespace.transform expects a pandas.DataFrame, pandas.Series or an iterable of strings"
             )
 
-        def _clean(val):
-            if pd.isna(val):
-                return val
-            try:
-                return self._pattern.sub(self.replace_with, str(val)).strip()
-            except Exception:
-                return val
-
-        cleaned = [_clean(v) for v in iterable]
+        cleaned = [self._clean_val(v) for v in iterable]
 
         # log a small sample for visibility (sanitise to avoid encoding errors)
         try:
@@ -83,6 +75,18 @@ class RemoveWhitespace(Preprocessor):
         self.fit(X)
         return self.transform(X)
 
+    def _clean_val(self, val):
+        # strings are never NA; skip the comparatively slow scalar pd.isna for them
+        if val.__class__ is not str and pd.isna(val):
+            return val
+        try:
+            return self._pattern.sub(self.replace_with, str(val)).strip()
+        except Exception:
+            return val
+
+    def text_function(self):
+        return self._clean_val
+
     # DataFrame-oriented API used by pipelines -------------------------------------------
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
         if self.field not in df.columns:
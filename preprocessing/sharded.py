@@ -0,0 +1,89 @@
+# preprocessing/sharded.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+from logs.logger import get_logger
+
+# built once per worker process by _init_worker, then reused for every chunk
+_worker_step = None
+
+
+def _init_worker(step_cfgs: List[Dict[str, Any]], fuse: bool) -> None:
+    """Construct the steps once per worker (stopword sets, compiled regexes, emoji tables)."""
+    global _worker_step
+    # importing the package registers the built-in preprocessors
+    from preprocessing import PreprocessorFactory
+    from preprocessing.fused import FusedTextPreprocessor
+
+    steps = [PreprocessorFactory.create(cfg.get("name"), **cfg.get("params", {})) for cfg in step_cfgs]
+    _worker_step = FusedTextPreprocessor(steps) if fuse else steps[0]
+
+
+def _run_chunk(chunk: Any) -> Any:
+    if isinstance(chunk, pd.DataFrame):
+        _worker_step.fit(chunk)
+        return _worker_step.transform(chunk)
+    return _worker_step.fit_transform(chunk)
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """`n_jobs` as in sklearn: None/1 = serial, -1 = all cores, -2 = all but one, ..."""
+    cpus = os.cpu_count() or 1
+    if not n_jobs:
+        return 1
+    if n_jobs < 0:
+        return max(1, cpus + 1 + n_jobs)
+    return min(n_jobs, cpus)
+
+
+class ShardedExecutor:
+    """Runs preprocessors over chunks of the data on a process pool, reassembling in order.
+
+    - `map_texts`: stateless string steps (those with a `text_function`) over a list of texts;
+      the steps are fused per worker so each document is handled in one pass.
+    - `map_frame`: one row-independent DataFrame preprocessor over row slices.
+
+    Workers receive the step configs, not the step objects, and build the steps once in the
+    pool initializer. Inputs shorter than `min_rows` run in-process, since pool start-up and
+    pickling would cost more than they save.
+    """
+
+    def __init__(self, n_jobs: int = -1, chunk_size: Optional[int] = None, min_rows: int = 10_000):
+        self.n_jobs = resolve_n_jobs(n_jobs)
+        self.chunk_size = chunk_size
+        self.min_rows = min_rows
+        self.logger = get_logger(self.__class__.__name__)
+
+    def should_shard(self, n_rows: int) -> bool:
+        return self.n_jobs > 1 and n_rows >= self.min_rows
+
+    def _chunk_size(self, n_rows: int) -> int:
+        # a few chunks per worker keeps the pool busy when chunks take uneven time
+        return self.chunk_size or max(1, -(-n_rows // (self.n_jobs * 4)))
+
+    def map_texts(self, step_cfgs: List[Dict[str, Any]], texts: List[Any]) -> List[Any]:
+        size = self._chunk_size(len(texts))
+        chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+        self.logger.info(
+            f"Sharding {len(texts)} texts into {len(chunks)} chunks over {self.n_jobs} processes "
+            f"for {[c.get('name') for c in step_cfgs]}"
+        )
+        out: List[Any] = []
+        for part in self._map(step_cfgs, chunks, fuse=True):
+            out.extend(part)
+        return out
+
+    def map_frame(self, step_cfg: Dict[str, Any], df: pd.DataFrame) -> pd.DataFrame:
+        size = self._chunk_size(len(df))
+        chunks = [df.iloc[i:i + size] for i in range(0, len(df), size)]
+        self.logger.info(
+            f"Sharding {len(df)} rows into {len(chunks)} chunks over {self.n_jobs} processes for {step_cfg.get('name')}"
+        )
+        return pd.concat(list(self._map([step_cfg], chunks, fuse=False)))
+
+    def _map(self, step_cfgs: List[Dict[str, Any]], chunks: List[Any], fuse: bool):
+        with ProcessPoolExecutor(max_workers=self.n_jobs, initializer=_init_worker, initargs=(step_cfgs, fuse)) as pool:
+            # map yields results in submission order
+            yield from pool.map(_run_chunk, chunks)
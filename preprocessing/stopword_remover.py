@@ -97,6 +97,7 @@ class StopwordRemover(Preprocessor):
 
         # choose tokenizer
         self._tokenize = _word_tokenize if _word_tokenize is not None else None
+        self._punctuation_table = str.maketrans("", "", string.punctuation)
 
         self.logger.info(f"Stopwords: {sorted(list(self.stopwords))}")
         self.logger.info(
@@ -142,7 +143,7 @@ class StopwordRemover(Preprocessor):
             s = s.lower()
 
         # Remove punctuation
-        s = s.translate(str.maketrans("", "", string.punctuation))
+        s = s.translate(self._punctuation_table)
 
         # Tokenize (simple whitespace split is enough after punctuation removed)
         tokens = s.split()
@@ -176,6 +177,9 @@ class StopwordRemover(Preprocessor):
         self.logger.info("Completed StopwordRemover on iterable")
         return out
 
+    def text_function(self):
+        return self._clean_text
+
     def get_params(self) -> dict:
         return {
             "field": self.field,
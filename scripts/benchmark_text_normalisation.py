@@ -0,0 +1,79 @@
+"""Benchmark the fused text-normalisation pass against the step-by-step path.
+
+Usage: python scripts/benchmark_text_normalisation.py [n_docs] [duplicate_share]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is on sys.path
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from preprocessing import PreprocessorFactory
+from preprocessing.fused import FusedTextPreprocessor
+
+STEPS = [
+    ("lowercase", {}),
+    ("remove_urls", {"field": "body"}),
+    ("emoji_remover", {}),
+    ("remove_punctuation_noise", {"field": "body"}),
+    ("remove_repeated_characters", {"field": "body"}),
+    ("remove_whitespace", {"field": "body"}),
+    ("stopword_remover", {"field": "body"}),
+]
+
+FRAGMENTS = [
+    "Sooooo", "the", "Dáil", "debate", "was", "GREAT!!!", "what??", "https://www.boards.ie/discussion/1",
+    "www.oireachtas.ie", "and", "   ", "minister...", "housing", "crisis,,", "\t", "TD", "\U0001F600",
+]
+# emoji are rare in boards comments and parliamentary text
+WEIGHTS = [10] * (len(FRAGMENTS) - 1) + [1]
+
+
+def make_corpus(n_docs: int, duplicate_share: float = 0.0, seed: int = 0):
+    """Random documents; `duplicate_share` of them repeat one of 50 boilerplate texts."""
+    rng = random.Random(seed)
+    boilerplate = [" ".join(rng.choices(FRAGMENTS, WEIGHTS, k=rng.randint(5, 60))) for _ in range(50)]
+    return [
+        rng.choice(boilerplate) if rng.random() < duplicate_share
+        else " ".join(rng.choices(FRAGMENTS, WEIGHTS, k=rng.randint(5, 60)))
+        for _ in range(n_docs)
+    ]
+
+
+def run(texts, steps):
+    start = time.perf_counter()
+    sequential = texts
+    for step in steps:
+        sequential = step.fit_transform(sequential)
+    sequential_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fused = FusedTextPreprocessor(steps).fit_transform(texts)
+    fused_s = time.perf_counter() - start
+    return sequential, sequential_s, fused, fused_s
+
+
+def main():
+    n_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    shares = [float(sys.argv[2])] if len(sys.argv) > 2 else [0.0, 0.3]
+    steps = [PreprocessorFactory.create(name, **params) for name, params in STEPS]
+
+    identical = True
+    for share in shares:
+        texts = make_corpus(n_docs, duplicate_share=share)
+        sequential, sequential_s, fused, fused_s = run(texts, steps)
+        identical &= fused == sequential
+        print(f"docs={n_docs} steps={len(steps)} duplicate_share={share:.0%}")
+        print(f"  sequential: {sequential_s:.2f}s ({n_docs / sequential_s:,.0f} docs/s)")
+        print(f"  fused:      {fused_s:.2f}s ({n_docs / fused_s:,.0f} docs/s)  speed-up x{sequential_s / fused_s:.2f}")
+        print(f"  identical output: {fused == sequential}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import logging
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from pipelines.boards_comments_pipeline import BoardsCommentsPipeline
+
+
+def _comments(discussion_id, n=5):
+    return [
+        {"commentID": discussion_id * 100 + i, "discussionID": discussion_id,
+         "dateInserted": f"2024-05-{i + 1:02d}T10:00:00+00:00"}
+        for i in range(n)
+    ]
+
+
+class _FakeFetcher:
+    def __init__(self, failing_id=None):
+        self.failing_id = failing_id
+        self.calls = []
+
+    def fetch(self, discussion_id, limit=500, date_start=None, date_end=None):
+        self.calls.append((discussion_id, date_start, date_end))
+        if discussion_id == self.failing_id:
+            time.sleep(0.2)  # lets the discussions before it be handled first
+            raise ConnectionError("boards.ie unavailable")
+        return _comments(discussion_id)
+
+
+class _FakeExtractor:
+    chunk_size = 500
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batches = []
+
+    def save_data(self, rows):
+        self.batches.append(list(rows))
+        if self.fail:
+            raise RuntimeError("database went away")
+
+
+class _FakeWatermarks:
+    def __init__(self):
+        self.saved = []
+
+    def save_many(self, items):
+        self.saved.extend(discussion_id for discussion_id, _, _ in items)
+
+
+class _FakeClient:
+    def stats(self):
+        return {"requests": 0, "throttled": 0}
+
+
+class _FakeContext:
+    client = _FakeClient()
+
+
+def _pipeline(fetcher=None, extractor=None, concurrency=4, write_batch_size=12, date_start=None, date_end=None):
+    pipeline = BoardsCommentsPipeline.__new__(BoardsCommentsPipeline)
+    pipeline.logger = logging.getLogger("test_boards_comments")
+    pipeline.limit = 500
+    pipeline.date_start = date_start
+    pipeline.date_end = date_end
+    pipeline.incremental = True
+    pipeline.fetch_concurrency = concurrency
+    pipeline.write_batch_size = write_batch_size
+    pipeline.progress_interval = 60.0
+    pipeline.context = _FakeContext()
+    pipeline.fetcher = fetcher or _FakeFetcher()
+    pipeline.extractor = extractor or _FakeExtractor()
+    pipeline.watermarks = _FakeWatermarks()
+    return pipeline
+
+
+def test_concurrent_harvest_saves_new_comments_once_with_their_watermarks():
+    pipeline = _pipeline()
+    ids = list(range(1, 21))
+    # discussion 3 was harvested up to its third comment before
+    watermarks = {3: {"MaxDateInserted": datetime(2024, 5, 3, 10), "MaxCommentId": 302}}
+
+    pipeline._harvest_concurrently(ids, watermarks, {})
+
+    saved = [r["commentID"] for batch in pipeline.extractor.batches for r in batch]
+    expected = [c["commentID"] for d in ids for c in _comments(d) if not (d == 3 and c["commentID"] <= 302)]
+    assert sorted(saved) == sorted(expected)
+    assert len(saved) == len(set(saved))
+    assert len(pipeline.extractor.batches) > 1  # written in several write_batch_size commits
+    assert sorted(pipeline.watermarks.saved) == ids
+
+
+def test_failed_flush_is_not_retried_and_its_error_surfaces():
+    pipeline = _pipeline(extractor=_FakeExtractor(fail=True))
+
+    with pytest.raises(RuntimeError, match="database went away"):
+        pipeline._harvest_concurrently(list(range(1, 21)), {}, {})
+
+    # the failed batch is written once, and no watermark moves past unsaved comments
+    assert len(pipeline.extractor.batches) == 1
+    assert pipeline.watermarks.saved == []
+
+
+def test_fetch_failure_keeps_finished_discussions():
+    pipeline = _pipeline(fetcher=_FakeFetcher(failing_id=5), concurrency=1, write_batch_size=1000)
+
+    with pytest.raises(ConnectionError):
+        pipeline._harvest_concurrently(list(range(1, 21)), {}, {})
+
+    # discussions handled before the failure is seen are saved whole, each with its watermark
+    saved = [r["commentID"] for batch in pipeline.extractor.batches for r in batch]
+    assert {1, 2, 3, 4} <= set(pipeline.watermarks.saved)
+    assert 5 not in pipeline.watermarks.saved
+    assert sorted(saved) == sorted(c["commentID"] for d in pipeline.watermarks.saved for c in _comments(d))
+
+
+def test_harvest_filters_by_watermark_else_by_known_ids():
+    pipeline = _pipeline()
+
+    _, new = pipeline._harvest(7, {"MaxDateInserted": datetime(2024, 5, 2), "MaxCommentId": 702}, {7: {700}})
+    assert [r["commentID"] for r in new] == [703, 704]
+
+    _, new = pipeline._harvest(7, None, {7: {700, 703}})
+    assert [r["commentID"] for r in new] == [701, 702, 704]
+
+    # a watermark without a comment id falls back to the known ids
+    _, new = pipeline._harvest(7, {"MaxDateInserted": datetime(2024, 5, 2), "MaxCommentId": None}, {7: {700}})
+    assert [r["commentID"] for r in new] == [701, 702, 703, 704]
+
+
+def test_fetch_window():
+    tomorrow = (date.today() + timedelta(days=1)).isoformat()
+    watermark = {"MaxDateInserted": datetime(2024, 5, 3, 22, 15), "MaxCommentId": 1}
+
+    assert _pipeline(date_start="2024-01-01", date_end="2024-12-31")._fetch_window(None) == ("2024-01-01", "2024-12-31")
+    assert _pipeline()._fetch_window({"MaxDateInserted": None, "MaxCommentId": 1}) == (None, None)
+    # the watermark date moves the start up, and an open range gets an explicit end
+    assert _pipeline(date_start="2024-01-01")._fetch_window(watermark) == ("2024-05-03", tomorrow)
+    assert _pipeline()._fetch_window(watermark) == ("2024-05-03", tomorrow)
+    # a configured start after the watermark wins
+    assert _pipeline(date_start="2024-06-01", date_end="2024-06-30")._fetch_window(watermark) == ("2024-06-01", "2024-06-30")
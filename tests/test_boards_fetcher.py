@@ -0,0 +1,143 @@
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from fetchers.boards_fetcher import BoardsFetcher, date_range
+from pipelines.boards_discussion_pipeline import BoardsDataPipeline
+from utils.checkpoint_store import CheckpointStore
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class _FakeClient:
+    """Three pages a day (two full, one short); a failing day raises on its first page."""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        day, page = params["dateLastComment"], params["page"]
+        if day == self.fail_on:
+            raise RuntimeError(f"boom on {day}")
+        size = params["limit"] if page < 3 else 1
+        return _FakeResponse([{"DiscussionID": f"{day}/{page}/{i}"} for i in range(size)])
+
+    def stats(self):
+        return {"requests": 0, "throttled": 0}
+
+
+class _Context:
+    timeout = 10
+    headers = None
+
+    def __init__(self, client, concurrency):
+        self.client = client
+        self.concurrency = concurrency
+
+
+def _ids(fetcher, **kwargs):
+    return sorted(
+        d["DiscussionID"]
+        for batch in fetcher.fetch_batches(1728, limit=2, start_date="2025-01-01", end_date="2025-01-08", **kwargs)
+        for d in batch
+    )
+
+
+def test_concurrent_crawl_returns_the_same_discussions_as_serial():
+    serial = _ids(BoardsFetcher(_Context(_FakeClient(), concurrency=1)))
+    client = _FakeClient()
+    concurrent = _ids(BoardsFetcher(_Context(client, concurrency=4)))
+
+    assert concurrent == serial
+    assert len(serial) == 8 * 5
+    assert client.max_active > 1
+
+
+def test_worker_errors_reach_the_consumer():
+    fetcher = BoardsFetcher(_Context(_FakeClient(fail_on="2025-01-05"), concurrency=4))
+    with pytest.raises(RuntimeError, match="2025-01-05"):
+        _ids(fetcher)
+
+
+class _FakeExtractor:
+    chunk_size = 2
+
+    def __init__(self):
+        self.ids = []
+
+    def save_data(self, rows):
+        self.ids.extend(d["DiscussionID"] for d in rows)
+
+
+class _CheckingCheckpoint(CheckpointStore):
+    """Records, at mark time, whether every discussion of the day had been saved."""
+
+    def __init__(self, path, extractor):
+        super().__init__(path)
+        self.extractor = extractor
+        self.complete_when_marked = {}
+
+    def mark_done(self, job, unit, **meta):
+        saved = [i for i in self.extractor.ids if i.startswith(f"{unit}/")]
+        self.complete_when_marked[unit] = len(saved) == 5 == meta["records"]
+        super().mark_done(job, unit, **meta)
+
+
+def _by_day_pipeline(client, checkpoint_path, concurrency=4):
+    pipeline = BoardsDataPipeline.__new__(BoardsDataPipeline)
+    pipeline.logger = logging.getLogger("test_boards_discussion_pipeline")
+    pipeline.category_id = 1728
+    pipeline.limit = 2
+    pipeline.date_start, pipeline.date_end = "2025-01-01", "2025-01-08"
+    pipeline.context = _Context(client, concurrency)
+    pipeline.fetcher = BoardsFetcher(pipeline.context)
+    pipeline.extractor = _FakeExtractor()
+    pipeline.checkpoint = _CheckingCheckpoint(checkpoint_path, pipeline.extractor)
+    return pipeline
+
+
+def test_checkpointed_days_are_crawled_concurrently_and_marked_once_saved(tmp_path):
+    path = str(tmp_path / "checkpoints.sqlite")
+    job = "boards_discussions:1728"
+    days = date_range("2025-01-01", "2025-01-08")
+
+    failing_client = _FakeClient(fail_on="2025-01-05")
+    failing = _by_day_pipeline(failing_client, path)
+    with pytest.raises(RuntimeError, match="2025-01-05"):
+        failing.execute()
+    finished = failing.checkpoint.completed(job)
+    assert "2025-01-05" not in finished
+    assert all(failing.checkpoint.complete_when_marked.values())
+    assert failing_client.max_active > 1
+
+    pipeline = _by_day_pipeline(_FakeClient(), path)
+    pipeline.execute()
+
+    assert pipeline.checkpoint.completed(job) == set(days)
+    assert all(pipeline.checkpoint.complete_when_marked.values())
+    # only the days the failed run did not finish are fetched again
+    assert set(pipeline.checkpoint.complete_when_marked) == set(days) - finished
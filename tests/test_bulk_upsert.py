@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, select
+
+from data.extractors.bulk_upsert import BulkUpserter
+from data.models import Base, BoardsComment
+
+
+class _EngineConnector:
+    def __init__(self, engine):
+        self._engine = engine
+
+    def get_engine(self):
+        return self._engine
+
+
+def _connector():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    # SQLite does not support the 'dbo' schema used for SQL Server
+    for tbl in list(Base.metadata.tables.values()):
+        tbl.schema = None
+    Base.metadata.create_all(engine)
+    return _EngineConnector(engine)
+
+
+def _row(comment_id, score):
+    # SQLite only autoincrements INTEGER PRIMARY KEY, not the BIGINT identity used on SQL Server
+    return {"Id": comment_id, "commentID": comment_id, "discussionID": 1, "score": score}
+
+
+def _comments(connector):
+    with connector.get_engine().connect() as conn:
+        return {r.commentID: r.score for r in conn.execute(select(BoardsComment.commentID, BoardsComment.score))}
+
+
+def test_upsert_inserts_then_updates_on_key():
+    connector = _connector()
+    upserter = BulkUpserter(connector, BoardsComment, key_columns=["commentID"], batch_size=2)
+
+    upserter.upsert([_row(i, 0) for i in range(5)])
+    upserter.upsert([_row(3, 7), _row(9, 1)])
+
+    assert _comments(connector) == {0: 0, 1: 0, 2: 0, 3: 7, 4: 0, 9: 1}
+
+
+def test_ignore_keeps_stored_row_and_duplicates_in_batch_collapse():
+    connector = _connector()
+    upserter = BulkUpserter(connector, BoardsComment, key_columns=["commentID"], on_conflict="ignore")
+
+    upserter.upsert([_row(1, 1)])
+    written = upserter.upsert([_row(1, 5), _row(2, 2), _row(2, 3)])
+
+    assert written == 2
+    assert _comments(connector) == {1: 1, 2: 3}
@@ -0,0 +1,42 @@
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.checkpoint_store import CheckpointStore
+
+
+def test_units_survive_reopen_and_are_namespaced_by_job(tmp_path):
+    path = str(tmp_path / "state" / "checkpoints.sqlite")
+    store = CheckpointStore(path)
+    store.mark_done("oireachtas_questions", "2024-01-01..2024-01-31", records=812)
+    store.mark_many("steam_apps", [10, 20, 30])
+    store.close()
+
+    reopened = CheckpointStore(path)
+    assert reopened.completed("steam_apps") == {"10", "20", "30"}
+    assert reopened.is_done("oireachtas_questions", "2024-01-01..2024-01-31")
+    assert not reopened.is_done("oireachtas_questions", "2024-02-01..2024-02-29")
+
+    reopened.reset("steam_apps")
+    assert reopened.completed("steam_apps") == set()
+    assert reopened.completed("oireachtas_questions") == {"2024-01-01..2024-01-31"}
+
+
+def test_marking_from_several_threads(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints.sqlite"))
+    threads = [
+        threading.Thread(target=store.mark_many, args=("steam_apps", range(i * 100, (i + 1) * 100)))
+        for i in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(store.completed("steam_apps")) == 400
+
+
+def test_from_config():
+    assert CheckpointStore.from_config(None) is None
+    assert CheckpointStore.from_config(False) is None
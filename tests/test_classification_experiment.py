@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import mlflow
+import numpy as np
+import pandas as pd
+import pytest
+
+from experiments.classification_experiment import ClassificationExperiment
+
+METRICS = ["accuracy", "f1_score"]
+
+
+@pytest.fixture
+def mlflow_tmp(tmp_path, monkeypatch):
+    # newer MLflow releases refuse a file store unless it is explicitly allowed
+    monkeypatch.setenv("MLFLOW_ALLOW_FILE_STORE", "true")
+    previous = mlflow.get_tracking_uri()
+    mlflow.set_tracking_uri((tmp_path / "mlruns").as_uri())
+    mlflow.set_experiment("cv_n_jobs_test")
+    yield
+    mlflow.set_tracking_uri(previous)
+
+
+def _cross_validate(cv_n_jobs, X, y):
+    experiment = ClassificationExperiment(
+        name=f"cv_{cv_n_jobs}",
+        model_name="random_forest",
+        evaluator_name="classification",
+        metrics=METRICS,
+        model_params={"n_estimators": 20, "random_state": 0},
+        evaluator_params={"metrics": METRICS},
+        cv_enabled=True,
+        cv_folds=4,
+        cv_n_jobs=cv_n_jobs,
+    )
+    with mlflow.start_run(run_name=experiment.name) as run:
+        results = experiment._run_cross_validation(X, y)
+    logged = mlflow.get_run(run.info.run_id).data.metrics
+    return results, logged
+
+
+def test_parallel_folds_match_serial_folds(mlflow_tmp):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(120, 5)), columns=[f"f{i}" for i in range(5)])
+    y = pd.Series((X["f0"] + 0.5 * rng.normal(size=120) > 0).astype(int))
+
+    serial_results, serial_logged = _cross_validate(1, X, y)
+    parallel_results, parallel_logged = _cross_validate(2, X, y)
+
+    assert parallel_results == serial_results
+    assert set(serial_logged) == {f"fold_{i}_{m}" for i in range(1, 5) for m in METRICS} | {
+        f"cv_mean_{m}" for m in METRICS} | {f"cv_{m}_std" for m in METRICS}
+    assert parallel_logged == serial_logged
@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+from utils.cluster_keywords import cluster_keywords
+
+TERMS = ["housing", "rent", "the", "health", "hospital", "budget"]
+# documents x terms
+X = sparse.csr_matrix(np.array([
+    [3, 2, 5, 0, 0, 0],
+    [2, 1, 4, 0, 0, 0],
+    [0, 0, 5, 3, 2, 0],
+    [0, 0, 4, 2, 1, 0],
+    [0, 0, 1, 0, 0, 9],
+], dtype=float))
+LABELS = np.array([0, 0, 1, 1, -1])
+
+
+def test_mean_scoring_orders_by_centroid_weight_and_skips_noise():
+    assert cluster_keywords(X, LABELS, TERMS, top_n=2) == {0: ["the", "housing"], 1: ["the", "health"]}
+
+
+def test_ctfidf_downweights_terms_common_to_all_clusters():
+    keywords = cluster_keywords(X, LABELS, TERMS, top_n=2, scoring="ctfidf")
+    assert keywords == {0: ["housing", "rent"], 1: ["health", "hospital"]}
+
+
+def test_dense_input_and_unknown_scoring():
+    assert cluster_keywords(X.toarray(), LABELS, TERMS, top_n=1) == {0: ["the"], 1: ["the"]}
+    with pytest.raises(ValueError):
+        cluster_keywords(X, LABELS, TERMS, scoring="bm25")
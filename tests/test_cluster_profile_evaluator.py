@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evaluators.clustering_profile_evaluator import ClusterProfileEvaluator
+
+LABELS = np.array([0, 0, 1, 1, 1, -1])
+DF = pd.DataFrame({
+    "Total_Reviews": [10, 200, 5, 0, 50, 7],
+    "Review_Score": [0.9, 0.5, 0.7, np.nan, 0.2, 0.4],
+    "Genre": ["RPG", "RPG", "Action", "RPG", "Action", None],
+    # multi-hot indicators with both fill values MultiHotEncoder can produce
+    "tag__zero": pd.arrays.SparseArray([1, 0, 0, 1, 1, 0], fill_value=0),
+    "tag__nan": pd.arrays.SparseArray([1.0, np.nan, 1.0, np.nan, np.nan, 1.0]),
+})
+
+
+def test_sparse_summary_matches_dense_groupby_without_plots(tmp_path):
+    results = ClusterProfileEvaluator(output_dir=str(tmp_path)).evaluate(DF, LABELS, params={"plots": False})
+
+    for col in ("tag__zero", "tag__nan"):
+        dense = DF[col].sparse.to_dense().groupby(LABELS).mean().to_dict()
+        assert results["binary_sparse_summary"][col] == pytest.approx(dense, nan_ok=True)
+
+    expected = (np.log1p(DF["Total_Reviews"]) * DF["Review_Score"]).groupby(LABELS).median().to_dict()
+    assert results["success_summary"]["median"] == pytest.approx(expected, nan_ok=True)
+    assert results["categorical_summary"]["Genre"]["RPG"] == {0: 2, 1: 1}
+    assert not list(tmp_path.glob("*.png"))
+    assert (tmp_path / "cluster_profile_cluster_success_ranking.csv").exists()
+
+
+def test_boxplots_rendered_inline(tmp_path):
+    ClusterProfileEvaluator(output_dir=str(tmp_path)).evaluate(DF, LABELS)
+    assert (tmp_path / "cluster_profile_success_index_boxplot.png").exists()
+
+
+def test_inline_plots_render_each_boxplot_once_and_keep_the_backend(tmp_path, monkeypatch):
+    import matplotlib
+    import evaluators.clustering_profile_evaluator as module
+
+    rendered, backends = [], []
+    monkeypatch.setattr(module, "_render_boxplot", lambda path, *args: rendered.append(path))
+    monkeypatch.setattr(matplotlib, "use", lambda backend, *args, **kwargs: backends.append(backend))
+
+    ClusterProfileEvaluator(output_dir=str(tmp_path)).evaluate(DF, LABELS)
+
+    assert len(rendered) == len(set(rendered))
+    assert sorted(Path(p).name for p in rendered) == [
+        "cluster_profile_Review_Score_boxplot.png",
+        "cluster_profile_Total_Reviews_boxplot.png",
+        "cluster_profile_success_index_boxplot.png",
+    ]
+    assert backends == []
@@ -0,0 +1,55 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import pandas as pd
+import pytest
+
+from pipelines.clustering_pipeline import ClusteringPipeline
+from reducers import PCA_Reducer, ReducerFactory
+
+TOPICS = {
+    "housing": "housing rent landlord tenancy eviction deposit",
+    "health": "hospital waiting list nurse trolley emergency consultant",
+}
+
+
+@pytest.fixture
+def pca_for_plots(monkeypatch):
+    # the 2D plot projection is UMAP in production; PCA keeps this test fast and deterministic
+    monkeypatch.setattr(ReducerFactory, "create_reducer", classmethod(lambda cls, name, **kw: PCA_Reducer("pca", **kw)))
+
+
+def test_clustering_pipeline_with_tfidf_vectorizer(tmp_path, pca_for_plots):
+    words = {topic: text.split() for topic, text in TOPICS.items()}
+    df = pd.DataFrame({
+        "Id": range(40),
+        "Text": [" ".join(words[topic][j % 6] for j in range(i % 3, i % 3 + 4))
+                 for i, topic in enumerate(["housing", "health"] * 20)],
+    })
+    pipeline = ClusteringPipeline(
+        name="tfidf_test",
+        vectorizer={"vectorizer_name": "tfidf", "vectorizer_field": "Text", "vectorizer_params": {}},
+        clusterer={"name": "kmeans", "params": {"n_clusters": 2, "n_init": 10, "random_state": 0}},
+        visualisations={"name": "cluster_plot", "params": {"output_dir": str(tmp_path), "dimensions": 2}},
+        keywords={"top_n": 3},
+    )
+
+    pipeline.execute(df)
+
+    clustered = pd.read_csv(tmp_path / "tfidf_test_clustered_data.csv")
+    # the TF-IDF matrix is sparse; both topics end up in separate clusters
+    assert clustered.groupby(clustered["Id"] % 2)["cluster"].nunique().tolist() == [1, 1]
+    assert clustered["cluster"].nunique() == 2
+
+    keywords = (tmp_path / "tfidf_test_cluster_keywords.txt").read_text().splitlines()
+    assert len(keywords) == 2
+    for line in keywords:
+        terms = line.split(": ", 1)[1].split(", ")
+        assert len(terms) == 3
+        assert set(terms) <= set(words["housing"]) or set(terms) <= set(words["health"])
@@ -0,0 +1,97 @@
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import JSON, Boolean, Column, Float, Integer, String, create_engine, insert
+from sqlalchemy.orm import Session, declarative_base
+
+from data.table_extractor import TableDataExtractor
+from pipelines.data_extractor_pipeline import DataExtractorPipeline
+
+Base = declarative_base()
+
+
+class _Game(Base):
+    __tablename__ = "streamed_games"
+    Id = Column(Integer, primary_key=True)
+    Name = Column(String(50))
+    Rating = Column(Float)
+    Players = Column(Integer)
+    Free = Column(Boolean)
+    Release_Date = Column(String(20))
+
+
+ROWS = [
+    # the first batch (3 rows) has no Rating, Players or Free at all
+    {"Id": i, "Name": f"game {i}", "Rating": None if i <= 3 else i / 2, "Players": None if i <= 3 else i * 10,
+     "Free": None if i <= 3 else i % 2 == 0, "Release_Date": f"2024-01-0{i}"}
+    for i in range(1, 8)
+]
+
+
+class _Comment(Base):
+    __tablename__ = "streamed_comments"
+    Id = Column(Integer, primary_key=True)
+    attributes = Column(JSON)
+
+
+COMMENT_ROWS = [
+    {"Id": 1, "attributes": None},
+    {"Id": 2, "attributes": {"a": 1}},
+    {"Id": 3, "attributes": {"a": 2, "tags": ["x", "y"]}},
+    {"Id": 4, "attributes": ["x"]},
+    {"Id": 5, "attributes": {"nested": {"b": None}}},
+]
+
+
+class _Connector:
+    def __init__(self):
+        self.engine = create_engine("sqlite:///:memory:", future=True)
+        Base.metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(insert(_Game), ROWS)
+            conn.execute(insert(_Comment), COMMENT_ROWS)
+
+    def get_session(self):
+        return Session(self.engine)
+
+
+def test_streamed_parquet_uses_model_column_types(tmp_path):
+    output = tmp_path / "games.parquet"
+    extractor = TableDataExtractor(_Connector(), _Game, order_by="Id")
+    pipeline = DataExtractorPipeline(extractor, output_parquet=str(output), stream=True, batch_size=3)
+
+    assert pipeline.execute() is None
+
+    parquet = pq.ParquetFile(output)
+    assert parquet.num_row_groups == 3
+    schema = parquet.schema_arrow
+    assert schema.field("Rating").type == pa.float64()
+    assert schema.field("Players").type == pa.int64()
+    assert schema.field("Free").type == pa.bool_()
+    assert schema.field("Name").type == pa.string()
+    assert pa.types.is_timestamp(schema.field("Release_Date").type)
+
+    table = parquet.read()
+    assert table.column("Id").to_pylist() == list(range(1, 8))
+    assert table.column("Players").to_pylist() == [None, None, None, 40, 50, 60, 70]
+    assert table.column("Free").to_pylist() == [None, None, None, True, False, True, False]
+    assert str(table.column("Release_Date")[6]).startswith("2024-01-07")
+
+
+def test_streamed_parquet_writes_json_columns_as_json_text(tmp_path):
+    output = tmp_path / "comments.parquet"
+    extractor = TableDataExtractor(_Connector(), _Comment, order_by="Id")
+    pipeline = DataExtractorPipeline(extractor, output_parquet=str(output), stream=True, batch_size=2)
+
+    pipeline.execute()
+
+    table = pq.read_table(output)
+    assert table.schema.field("attributes").type == pa.string()
+    values = table.column("attributes").to_pylist()
+    assert values[0] is None
+    assert [json.loads(v) for v in values[1:]] == [r["attributes"] for r in COMMENT_ROWS[1:]]
@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+from sklearn.datasets import make_blobs
+
+from evaluators.elbow import ElbowSearch, elbow_k
+from models.kmeans_clusterer import KMeansClusterer
+
+X, _ = make_blobs(n_samples=3000, n_features=8, centers=5, random_state=0)
+X = X.astype(np.float32)
+KS = list(range(2, 15))
+
+
+def _plain_sweep(clusterer):
+    inertias = []
+    for k in KS:
+        model = KMeansClusterer(name=clusterer.name, **{**clusterer.params, "n_clusters": k}).build().model
+        inertias.append(float(model.fit(X).inertia_))
+    return inertias
+
+
+def test_default_sweep_matches_plain_loop():
+    clusterer = KMeansClusterer(name="km", n_clusters=5, random_state=0, n_init=3)
+    inertias = _plain_sweep(clusterer)
+
+    result = ElbowSearch().run(clusterer, X, KS)
+
+    assert result["ks"] == KS
+    assert result["inertias"] == inertias
+    assert result["elbow_k"] == elbow_k(KS, inertias)
+    assert not result["stopped_early"]
+
+
+def test_patience_stops_early_on_the_same_elbow():
+    clusterer = KMeansClusterer(name="km", n_clusters=5, random_state=0, n_init=3)
+    expected = elbow_k(KS, _plain_sweep(clusterer))
+
+    for search in (ElbowSearch(patience=3), ElbowSearch(patience=3, warm_start=True)):
+        result = search.run(clusterer, X, KS)
+        assert result["stopped_early"]
+        assert len(result["ks"]) < len(KS)
+        assert result["elbow_k"] == expected
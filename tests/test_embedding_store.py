@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from vectorizers.embedding_store import EmbeddingStore
+
+
+class _CountingEncoder:
+    def __init__(self):
+        self.seen = []
+
+    def __call__(self, texts):
+        self.seen.append(list(texts))
+        return np.array([[len(t), t.count("a")] for t in texts], dtype=np.float32)
+
+
+def test_only_unseen_distinct_texts_are_encoded_and_reloaded_from_disk(tmp_path):
+    encoder = _CountingEncoder()
+    store = EmbeddingStore(str(tmp_path), "org/model", dtype="float16")
+
+    first = store.get_or_encode(["aaa", "b", "aaa", "ba"], encoder, batch_size=2)
+    assert first.tolist() == [[3, 3], [1, 0], [3, 3], [2, 1]]
+    # deduplicated and sorted by length before batching
+    assert encoder.seen == [["b", "ba"], ["aaa"]]
+
+    reopened = EmbeddingStore(str(tmp_path), "org/model")
+    again = reopened.get_or_encode(["ba", "cccc"], encoder, batch_size=2)
+    assert again.tolist() == [[2, 1], [4, 0]]
+    assert encoder.seen[-1] == ["cccc"]
+    assert len(reopened) == 4
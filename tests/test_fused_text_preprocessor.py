@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd
+
+from pipelines.preprocessing_pipeline import PreprocessingPipeline
+from preprocessing import PreprocessorFactory
+from preprocessing.base import Preprocessor
+from preprocessing.fused import FusedTextPreprocessor
+
+STEPS = [
+    ("lowercase", {}),
+    ("remove_urls", {"field": "body"}),
+    ("emoji_remover", {}),
+    ("remove_punctuation_noise", {"field": "body"}),
+    ("remove_repeated_characters", {"field": "body"}),
+    ("remove_whitespace", {"field": "body"}),
+    ("stopword_remover", {"field": "body"}),
+]
+
+TEXTS = [
+    "Soooo    cooool!!!!! Visit https://example.com!!!",
+    "Noooooo   way...... What??? \U0001F600\U0001F44D\U0001F3FD",
+    "   The Dáil   debate on housing   ",
+    "",
+    "Noooooo   way...... What??? \U0001F600\U0001F44D\U0001F3FD",
+    "family \U0001F468‍\U0001F469‍\U0001F467 and flag \U0001F1EE\U0001F1EA",
+]
+
+
+def test_fused_pass_matches_sequential_steps():
+    steps = [PreprocessorFactory.create(name, **params) for name, params in STEPS]
+
+    sequential = list(TEXTS)
+    for step in steps:
+        sequential = step.fit_transform(sequential)
+
+    assert FusedTextPreprocessor(steps).fit_transform(TEXTS) == sequential
+
+
+class _FailingStep(Preprocessor):
+    """Fusable step that raises on every document."""
+
+    def fit(self, X):
+        return self
+
+    def transform(self, X):
+        return [self._fail(v) for v in X]
+
+    def _fail(self, v):
+        raise ValueError("step failed")
+
+    def text_function(self):
+        return self._fail
+
+
+def test_failing_fused_run_falls_back_to_its_steps_one_at_a_time(monkeypatch):
+    monkeypatch.setitem(PreprocessorFactory._registry, "failing_step", _FailingStep)
+    steps = [("lowercase", {}), ("failing_step", {}), ("emoji_remover", {}), ("remove_whitespace", {"field": "body"})]
+    pipeline = PreprocessingPipeline(
+        preprocessors=[{"name": name, "params": params} for name, params in steps], text_field="text",
+    )
+
+    result = pipeline.execute(pd.DataFrame({"text": TEXTS}))
+
+    # every step but the failing one still ran
+    expected = list(TEXTS)
+    for name, params in steps:
+        if name != "failing_step":
+            expected = PreprocessorFactory.create(name, **params).fit_transform(expected)
+    assert result["text"].tolist() == expected
@@ -0,0 +1,73 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.http_client import AdaptiveTokenBucket, HttpClient, TokenBucket
+
+
+class _FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def test_token_bucket_paces_calls_after_burst():
+    bucket = TokenBucket(capacity=2, period=0.2)
+    start = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    # two tokens are free, the next two refill at 0.1s each
+    assert time.monotonic() - start >= 0.18
+
+
+def test_client_retries_429_honouring_retry_after_and_counts_throttles():
+    client = HttpClient(rate_limits={"example.com": (100, 1.0)}, retries=2)
+    client.session = _FakeSession([_FakeResponse(429, {"Retry-After": "0.1"}), _FakeResponse(200)])
+
+    start = time.monotonic()
+    response = client.get("https://api.example.com/items")
+
+    assert response.status_code == 200
+    assert time.monotonic() - start >= 0.1
+    stats = client.stats()
+    assert stats["requests"] == 2
+    assert stats["throttled"] == 1
+    assert stats["retries"] == 1
+
+
+def test_client_returns_last_response_when_retries_exhausted():
+    client = HttpClient(rate_limits={}, retries=1, backoff_factor=0.01)
+    client.session = _FakeSession([_FakeResponse(503), _FakeResponse(503)])
+
+    assert client.get("https://example.org").status_code == 503
+    assert client.session.calls == 2
+
+
+def test_adaptive_bucket_speeds_up_on_success_and_backs_off_on_throttle():
+    client = HttpClient(rate_limits={"example.com": (100, 1.0)}, adaptive_rate_limits={"example.com": 150.0}, retries=1)
+    client.session = _FakeSession([_FakeResponse(200)] * 3 + [_FakeResponse(429, {"Retry-After": "0"}), _FakeResponse(200)])
+    for _ in range(3):
+        client.get("https://example.com/items")
+    bucket = client._bucket_for("https://example.com/items")
+    assert isinstance(bucket, AdaptiveTokenBucket)
+    assert bucket.rate == 130.0
+
+    client.get("https://example.com/items")
+    # halved on the 429, then one step up for the successful retry
+    assert bucket.rate == 75.0
+
+    for _ in range(20):
+        bucket.on_success()
+    assert bucket.rate == 150.0
@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from preprocessing.lemma_cache import LemmaCache
+from preprocessing.lemmatizer import Lemmatizer
+
+
+class _FakeNLP:
+    """Stands in for a spaCy pipeline: lemma = lowercased token; records what it was given."""
+
+    meta = {"version": "0.0"}
+
+    def __init__(self):
+        self.seen = []
+
+    def pipe(self, texts, batch_size=1000, n_process=1):
+        for text in texts:
+            self.seen.append(text)
+            yield [SimpleNamespace(lemma_=tok.lower()) for tok in text.split()]
+
+
+def test_cache_round_trip_persists(tmp_path):
+    cache = LemmaCache(str(tmp_path), "en_core_web_sm", "3.7.1")
+    cache.put_many([("Dogs Running", "dog run"), ("", "")])
+    cache.close()
+
+    reopened = LemmaCache(str(tmp_path), "en_core_web_sm", "3.7.1")
+    assert reopened.get_many(["Dogs Running", "", "unseen"]) == {"Dogs Running": "dog run", "": ""}
+    assert len(reopened) == 2
+
+
+def test_lemmatizer_only_sends_unseen_distinct_texts_to_spacy(tmp_path):
+    lemmatizer = Lemmatizer()
+    lemmatizer.nlp = _FakeNLP()
+    lemmatizer.cache = LemmaCache(str(tmp_path), "fake")
+
+    assert lemmatizer.fit_transform(["The Cats", "Ran", "The Cats"]) == ["the cats", "ran", "the cats"]
+    assert lemmatizer.nlp.seen == ["The Cats", "Ran"]
+
+    lemmatizer.nlp.seen.clear()
+    assert lemmatizer.fit_transform(["Ran", "New Text"]) == ["ran", "new text"]
+    assert lemmatizer.nlp.seen == ["New Text"]
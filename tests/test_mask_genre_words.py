@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd
+
+from preprocessing.mask_genre_words import MaskGenreWords
+
+
+def test_masks_each_row_against_its_own_genre():
+    df = pd.DataFrame({
+        "Genre": ["Action, RPG", "Sci-Fi/Adventure", None, "Action, RPG"],
+        "Description": [
+            "Action-RPG with actions and rpgs",
+            "A sci-fi adventurer's ACTION game",
+            "nanny action unchanged",
+            float("nan"),
+        ],
+    })
+
+    masker = MaskGenreWords()
+    out = masker.transform(df)
+
+    assert out["Description"].tolist()[:3] == [
+        "<MASKED>-<MASKED> with <MASKED> and <MASKED>",
+        "A <MASKED>-<MASKED> <MASKED>'s ACTION game",
+        "nanny action unchanged",
+    ]
+    assert pd.isna(out["Description"].iloc[3])
+    # one pattern per distinct genre value
+    assert len(masker._genre_patterns) == 2
+
+
+def test_longest_token_wins_at_the_same_position():
+    masker = MaskGenreWords(genre_words=["Role", "Role-Playing"], mask_token="#")
+    assert masker.fit_transform(["role-playing and role play"]) == ["# and # play"]
@@ -0,0 +1,41 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd
+import pytest
+from scipy import sparse
+
+from encoders.multi_hot_encoder import MultiHotEncoder
+
+PLATFORMS = pd.Series(["win, mac", "linux, win, win", "mac", None, ["linux", "mac"]], name="Platforms")
+
+
+def test_csr_output_matches_sparse_frame():
+    frame = MultiHotEncoder(dtype=int).fit_transform(PLATFORMS)
+    csr = MultiHotEncoder(dtype=int, output="csr").fit_transform(PLATFORMS)
+
+    assert sparse.isspmatrix_csr(csr)
+    assert list(frame.columns) == ["Platforms__win", "Platforms__mac", "Platforms__linux"]
+    assert frame.sparse.to_dense().values.tolist() == csr.toarray().tolist() == [
+        [1, 1, 0],
+        [1, 0, 1],
+        [0, 1, 0],
+        [0, 0, 0],
+        [0, 1, 1],
+    ]
+
+
+def test_inverse_transform_of_sparse_output():
+    enc = MultiHotEncoder(output="csr")
+    assert enc.inverse_transform(enc.fit_transform(PLATFORMS)) == [
+        ["win", "mac"], ["win", "linux"], ["mac"], [], ["mac", "linux"],
+    ]
+
+
+def test_unknown_token_raises_when_requested():
+    enc = MultiHotEncoder(handle_unknown="error").fit(["win"])
+    with pytest.raises(ValueError):
+        enc.transform(["win, mac"])
+
@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from fetchers.oireachtas_debate_fetcher import OireachtasDebateFetcher
+from fetchers.oireachtas_question_fetcher import OireachtasQuestionFetcher
+
+TOTAL = 25
+
+
+class _FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class _FakeClient:
+    """Serves TOTAL records in skip/limit pages; the page at `failing_skip` returns 500."""
+
+    def __init__(self, failing_skip):
+        self.failing_skip = failing_skip
+
+    def get(self, url, params=None, **kwargs):
+        skip, limit = params["skip"], params["limit"]
+        if skip == self.failing_skip:
+            return _FakeResponse(500)
+        results = [{"id": i} for i in range(skip, min(TOTAL, skip + limit))]
+        return _FakeResponse(200, {"head": {"counts": {"resultCount": TOTAL, "debateCount": TOTAL}}, "results": results})
+
+
+class _Context:
+    timeout = 10
+    headers = None
+
+    def __init__(self, failing_skip, concurrency):
+        self.client = _FakeClient(failing_skip)
+        self.concurrency = concurrency
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_question_fetcher_records_dropped_pages(concurrency):
+    fetcher = OireachtasQuestionFetcher(_Context(failing_skip=10, concurrency=concurrency))
+
+    results = fetcher.fetch("2024-01-01", "2024-01-31", limit=5)
+
+    assert 10 not in {r["id"] for r in results}
+    assert fetcher.last_dropped_offsets == [10]
+
+    fetcher.context.client.failing_skip = None
+    assert len(fetcher.fetch("2024-01-01", "2024-01-31", limit=5)) == TOTAL
+    assert fetcher.last_dropped_offsets == []
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_debate_fetcher_records_dropped_pages(concurrency):
+    fetcher = OireachtasDebateFetcher(_Context(failing_skip=15, concurrency=concurrency))
+
+    results = fetcher.fetch("2024-01-10", limit=5)
+
+    assert len(results) < TOTAL
+    assert fetcher.last_dropped_offsets == [15]
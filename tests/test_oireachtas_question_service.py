@@ -0,0 +1,199 @@
+import logging
+import sys
+import threading
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from data.services.oireachtas_question_service import CHECKPOINT_JOB, OireachtasQuestionIngestionService
+from utils.checkpoint_store import CheckpointStore
+
+PAGE = 10
+
+
+class _FakeFetcher:
+    """Serves `totals["start..end"]` records in pages of PAGE; skips listed in `drop["start..end"]` are lost."""
+
+    def __init__(self, totals, drop=None):
+        self.totals = totals
+        self.drop = drop or {}
+        self.logger = logging.getLogger("fake_fetcher")
+        self.last_expected_count = None
+        self.last_dropped_offsets = []
+
+    def fetch(self, date_start, date_end, limit=1, probe_only=False):
+        self.last_expected_count = self.totals.get(f"{date_start}..{date_end}", 0)
+        return []
+
+    def fetch_pages(self, date_start, date_end):
+        key = f"{date_start}..{date_end}"
+        total = self.totals.get(key, 0)
+        self.last_expected_count = total
+        self.last_dropped_offsets = []
+        for skip in range(0, total, PAGE):
+            if skip in self.drop.get(key, ()):
+                self.last_dropped_offsets.append(skip)
+                continue
+            yield [{"id": f"{date_start}-{i}"} for i in range(skip, min(total, skip + PAGE))]
+        # a failed page past the last record loses nothing
+        self.last_dropped_offsets.extend(skip for skip in self.drop.get(key, ()) if skip >= total)
+
+
+class _FakeExtractor:
+    def __init__(self):
+        self.rows = []
+
+    def save_data(self, chunk):
+        self.rows.extend(chunk)
+
+
+def _service(fetcher, tmp_path):
+    checkpoint = CheckpointStore(str(tmp_path / "checkpoints.sqlite"))
+    service = OireachtasQuestionIngestionService(fetcher, _FakeExtractor(), chunk_size=7, checkpoint=checkpoint)
+    return service, checkpoint
+
+
+JAN, FEB = "2024-01-01..2024-01-31", "2024-02-01..2024-02-29"
+
+
+def test_month_with_dropped_page_is_not_checkpointed(tmp_path):
+    fetcher = _FakeFetcher({JAN: 45, FEB: 30}, drop={JAN: [20]})
+    service, checkpoint = _service(fetcher, tmp_path)
+
+    service.ingest(date(2024, 1, 1), date(2024, 2, 29))
+
+    assert checkpoint.completed(CHECKPOINT_JOB) == {FEB}
+
+    # the retry fetches the whole month and only then checkpoints it
+    fetcher.drop = {}
+    service.ingest(date(2024, 1, 1), date(2024, 2, 29))
+    assert checkpoint.completed(CHECKPOINT_JOB) == {JAN, FEB}
+
+
+def test_incomplete_day_keeps_its_month_open(tmp_path, monkeypatch):
+    monkeypatch.setattr("data.services.oireachtas_question_service.SAFE_THRESHOLD", 50)
+    days = {"2024-03-01..2024-03-01": 0, "2024-03-02..2024-03-02": 25, "2024-03-03..2024-03-03": 35}
+    fetcher = _FakeFetcher({"2024-03-01..2024-03-03": 60, **days}, drop={"2024-03-03..2024-03-03": [10]})
+    service, checkpoint = _service(fetcher, tmp_path)
+
+    service.ingest(date(2024, 3, 1), date(2024, 3, 3))
+
+    assert checkpoint.completed(CHECKPOINT_JOB) == {"2024-03-01", "2024-03-02"}
+
+    fetcher.drop = {}
+    service.ingest(date(2024, 3, 1), date(2024, 3, 3))
+    assert checkpoint.completed(CHECKPOINT_JOB) == {"2024-03-01", "2024-03-02", "2024-03-03", "2024-03-01..2024-03-03"}
+    # days already done are not fetched again
+    assert len(service.extractor.rows) == 25 + 25 + 35
+
+
+def test_dropped_page_still_checkpoints_when_total_was_saved(tmp_path):
+    fetcher = _FakeFetcher({FEB: 30}, drop={FEB: [30]})
+    service, checkpoint = _service(fetcher, tmp_path)
+
+    service.ingest(date(2024, 2, 1), date(2024, 2, 29))
+
+    assert checkpoint.completed(CHECKPOINT_JOB) == {FEB}
+
+
+
+class _FakeParser:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+
+    def fetch_xml(self, uri):
+        return f"<xml>{uri}</xml>"
+
+    def parse(self, xml):
+        if xml == f"<xml>{self.fail_on}</xml>":
+            raise ValueError("bad answer xml")
+        return {"text": xml, "speaker": "minister", "recorded_time": None}
+
+
+class _AnsweredFetcher(_FakeFetcher):
+    """Question records pointing at one of five answer XMLs, like a debate section shared by several questions."""
+
+    def fetch_pages(self, date_start, date_end):
+        for page in super().fetch_pages(date_start, date_end):
+            yield [{"question": {**r, "debateSection": {"formats": {"xml": {"uri": f"u{i % 5}"}}}}}
+                   for i, r in enumerate(page)]
+
+
+class _FailingExtractor(_FakeExtractor):
+    def save_data(self, chunk):
+        if self.rows:
+            raise RuntimeError("database went away")
+        super().save_data(chunk)
+
+
+def _stream(service, timeout=30):
+    """Run _stream_range on a thread so a deadlock fails the test instead of hanging it."""
+    outcome = {}
+
+    def target():
+        try:
+            outcome["saved"] = service._stream_range("2024-01-01", "2024-01-31")
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "_stream_range did not finish"
+    return outcome
+
+
+@pytest.mark.parametrize("answer_workers,write_workers", [(1, 1), (6, 3)])
+def test_stream_range_saves_every_record_exactly_once(answer_workers, write_workers):
+    service = OireachtasQuestionIngestionService(
+        _AnsweredFetcher({JAN: 1234}), _FakeExtractor(), chunk_size=50,
+        answer_workers=answer_workers, write_workers=write_workers, queue_size=20,
+    )
+    service.answer_parser = _FakeParser()
+
+    outcome = _stream(service)
+
+    ids = [r["question"]["id"] for r in service.extractor.rows]
+    assert sorted(ids) == sorted(f"2024-01-01-{i}" for i in range(1234))
+    assert outcome["saved"] == 1234
+    assert all(r["_answer_text"] == f"<xml>{r['question']['debateSection']['formats']['xml']['uri']}</xml>"
+               for r in service.extractor.rows)
+
+
+def test_stream_range_saved_count_excludes_dropped_pages():
+    service = OireachtasQuestionIngestionService(
+        _AnsweredFetcher({JAN: 95}, drop={JAN: [30, 60]}), _FakeExtractor(), chunk_size=7, queue_size=5,
+    )
+    service.answer_parser = _FakeParser()
+
+    outcome = _stream(service)
+
+    assert outcome["saved"] == len(service.extractor.rows) == 75
+    assert service._range_complete(JAN, outcome["saved"]) is False
+
+
+def _failing_fetch_pages(date_start, date_end):
+    yield [{"id": "q-0"}]
+    raise ConnectionError("API down")
+
+
+@pytest.mark.parametrize("stage", ["fetch", "answer", "write"])
+def test_stream_range_reraises_stage_errors_without_deadlock(stage):
+    fetcher = _AnsweredFetcher({JAN: 5000})
+    extractor = _FailingExtractor() if stage == "write" else _FakeExtractor()
+    # small queues: the other stages are blocked on full or empty queues when the error hits
+    service = OireachtasQuestionIngestionService(
+        fetcher, extractor, chunk_size=10, answer_workers=4, write_workers=2, queue_size=3,
+    )
+    service.answer_parser = _FakeParser(fail_on="u3" if stage == "answer" else None)
+    if stage == "fetch":
+        fetcher.fetch_pages = _failing_fetch_pages
+
+    outcome = _stream(service)
+
+    expected = {"fetch": ConnectionError, "answer": ValueError, "write": RuntimeError}[stage]
+    assert isinstance(outcome.get("error"), expected)
+    assert len(extractor.rows) < 5000
@@ -0,0 +1,42 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fetchers.pagination import fetch_offsets_concurrently, iter_offsets_concurrently
+
+
+def _fake_pages(delay_for):
+    in_flight = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def fetch_page(skip):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(delay_for(skip))
+        with lock:
+            in_flight["now"] -= 1
+        if skip == 300:
+            return None  # a page that could not be fetched
+        return [{"skip": skip, "i": i} for i in range(2)]
+
+    return fetch_page, in_flight
+
+
+def test_pages_are_yielded_in_offset_order_with_bounded_requests():
+    # later offsets finish first
+    fetch_page, in_flight = _fake_pages(lambda skip: 0.05 - skip / 20000)
+    offsets = list(range(100, 1000, 100))
+
+    pages = list(iter_offsets_concurrently(fetch_page, offsets, concurrency=3))
+
+    assert [p[0]["skip"] for p in pages] == [o for o in offsets if o != 300]
+    assert in_flight["max"] <= 3
+    assert [r for p in pages for r in p] == fetch_offsets_concurrently(fetch_page, offsets, concurrency=3)
+
+
+def test_no_offsets():
+    assert list(iter_offsets_concurrently(lambda skip: [], [], concurrency=4)) == []
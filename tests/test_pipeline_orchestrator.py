@@ -0,0 +1,81 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from orchestrator.pipeline_orchestrator import PipelineOrchestrator
+from pipelines.base import PipelineStage
+
+
+class _SleepPipeline:
+    def __init__(self, seconds, output=None, fail=False):
+        self.seconds = seconds
+        self.output = output
+        self.fail = fail
+        self.received = None
+        self.thread = None
+
+    def execute(self, data=None):
+        self.received = data
+        self.thread = threading.current_thread().name
+        time.sleep(self.seconds)
+        if self.fail:
+            raise RuntimeError("boom")
+        return self.output
+
+
+def test_independent_branches_overlap():
+    members, parties, comments = _SleepPipeline(0.3, "m"), _SleepPipeline(0.3, "p"), _SleepPipeline(0.3, "c")
+    stages = [
+        PipelineStage("members", members),
+        PipelineStage("parties", parties),
+        PipelineStage("comments", comments),
+    ]
+    orchestrator = PipelineOrchestrator(pipelines=[], stages=stages, parallel=True, max_retries=1)
+
+    start = time.perf_counter()
+    results = orchestrator.run_graph()
+    elapsed = time.perf_counter() - start
+
+    assert results == {"members": "m", "parties": "p", "comments": "c"}
+    # three 0.3s stages overlapping should take roughly one stage, not the sum
+    assert elapsed < 0.8
+    assert set(orchestrator.stage_timings) == {"members", "parties", "comments"}
+
+
+def test_dependency_output_is_passed_downstream_and_failures_skip_dependents():
+    upstream = _SleepPipeline(0.01, "discussions")
+    downstream = _SleepPipeline(0.01, "comments")
+    broken = _SleepPipeline(0.01, fail=True)
+    after_broken = _SleepPipeline(0.01, "never")
+    stages = [
+        PipelineStage("discussions", upstream),
+        PipelineStage("comments", downstream, depends_on=["discussions"]),
+        PipelineStage("broken", broken),
+        PipelineStage("after_broken", after_broken, depends_on=["broken"]),
+    ]
+    orchestrator = PipelineOrchestrator(pipelines=[], stages=stages, parallel=True, max_retries=1)
+
+    results = orchestrator.run_graph()
+
+    assert downstream.received == "discussions"
+    assert "broken" not in results
+    assert "after_broken" not in results
+    assert after_broken.received is None
+
+
+def test_graph_validation_rejects_cycles_and_unknown_dependencies():
+    cycle = [
+        PipelineStage("a", _SleepPipeline(0), depends_on=["b"]),
+        PipelineStage("b", _SleepPipeline(0), depends_on=["a"]),
+    ]
+    with pytest.raises(ValueError, match="cycle"):
+        PipelineOrchestrator(pipelines=[], stages=cycle, parallel=True).run_graph()
+
+    unknown = [PipelineStage("a", _SleepPipeline(0), depends_on=["missing"])]
+    with pytest.raises(ValueError, match="unknown"):
+        PipelineOrchestrator(pipelines=[], stages=unknown, parallel=True).run_graph()
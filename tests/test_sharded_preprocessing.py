@@ -0,0 +1,51 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd
+
+from preprocessing import PreprocessorFactory
+from preprocessing.sharded import ShardedExecutor, resolve_n_jobs
+
+STEPS = [
+    {"name": "lowercase"},
+    {"name": "remove_urls", "params": {"field": "body"}},
+    {"name": "remove_punctuation_noise", "params": {"field": "body"}},
+    {"name": "remove_whitespace", "params": {"field": "body"}},
+]
+
+TEXTS = [
+    f"Post {i}:   Visit https://example.com/{i} NOW!!!" if i % 3 else f"Plain   reply {i % 7}"
+    for i in range(200)
+]
+
+
+def _executor():
+    executor = ShardedExecutor(n_jobs=2, chunk_size=30, min_rows=0)
+    # resolve_n_jobs caps at the machine's cores; force a pool even on one core
+    executor.n_jobs = 2
+    return executor
+
+
+def test_resolve_n_jobs():
+    assert resolve_n_jobs(None) == 1
+    assert resolve_n_jobs(1) == 1
+    assert resolve_n_jobs(-1) >= 1
+
+
+def test_sharded_texts_match_sequential_steps_in_order():
+    sequential = list(TEXTS)
+    for cfg in STEPS:
+        sequential = PreprocessorFactory.create(cfg["name"], **cfg.get("params", {})).fit_transform(sequential)
+
+    assert _executor().map_texts(STEPS, TEXTS) == sequential
+
+
+def test_sharded_frame_matches_whole_frame():
+    cfg = {"name": "remove_html_tags", "params": {"columns": ["body"]}}
+    df = pd.DataFrame({"body": [f"<p>row {i}<br>line</p>" for i in range(100)], "Id": range(100)})
+
+    expected = PreprocessorFactory.create(cfg["name"], **cfg["params"]).fit_transform(df)
+
+    pd.testing.assert_frame_equal(_executor().map_frame(cfg, df), expected)
@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+from sklearn.datasets import make_blobs
+from sklearn.metrics import silhouette_samples
+
+from evaluators.silhouette import SilhouetteEstimator
+
+X, LABELS = make_blobs(n_samples=2000, n_features=6, centers=4, cluster_std=2.5, random_state=0)
+LABELS = LABELS.copy()
+LABELS[:50] = -1  # noise label, scored as its own cluster like sklearn does
+LABELS[50] = 7    # singleton
+EXACT = silhouette_samples(X, LABELS)
+
+
+def test_chunked_matches_sklearn_with_small_memory_budget():
+    result = SilhouetteEstimator(mode="chunked", working_memory_mb=1).evaluate(X, LABELS)
+    np.testing.assert_allclose(result["values"], EXACT, atol=1e-9)
+    assert result["average"] == pytest.approx(EXACT.mean())
+
+
+def test_sampled_is_stratified_and_its_interval_covers_the_exact_average():
+    result = SilhouetteEstimator(mode="sampled", sample_size=400, random_state=0).evaluate(X, LABELS)
+
+    assert result["n_points"] < len(LABELS)
+    # every cluster is represented, the singleton included
+    assert set(result["labels"]) == set(LABELS)
+    low, high = result["ci"]
+    assert low <= EXACT.mean() <= high
+
+
+def test_simplified_is_bounded_and_close_for_compact_clusters():
+    result = SilhouetteEstimator(mode="simplified").evaluate(X, LABELS)
+    assert np.all(np.abs(result["values"]) <= 1)
+    assert result["average"] == pytest.approx(EXACT.mean(), abs=0.15)
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError):
+        SilhouetteEstimator(mode="approximate")
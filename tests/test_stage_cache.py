@@ -0,0 +1,46 @@
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.stage_cache import StageCache
+
+
+def test_frames_and_matrices_round_trip_and_key_tracks_content(tmp_path):
+    cache = StageCache(cache_dir=str(tmp_path))
+    df = pd.DataFrame({"Description": ["a b", "c d"], "Tags": [["x"], ["y", "z"]]})
+
+    key = StageCache.make_key("preprocessing", {"steps": ["lowercase"]}, StageCache.fingerprint(df))
+    assert cache.get_frame(key) is None
+    cache.put_frame(key, df)
+    pd.testing.assert_frame_equal(cache.get_frame(key), df)
+
+    changed = df.assign(Description=["a b", "c e"])
+    assert StageCache.make_key("preprocessing", {"steps": ["lowercase"]}, StageCache.fingerprint(changed)) != key
+    assert StageCache.make_key("preprocessing", {"steps": ["stemmer"]}, StageCache.fingerprint(df)) != key
+
+    dense, sparse_X = np.arange(6, dtype=np.float32).reshape(2, 3), sparse.random(5, 4, density=0.5, format="csr")
+    cache.put_matrix("dense", dense)
+    cache.put_matrix("sparse", sparse_X)
+    np.testing.assert_array_equal(cache.get_matrix("dense"), dense)
+    assert (cache.get_matrix("sparse") != sparse_X).nnz == 0
+
+
+def test_least_recently_used_entries_are_evicted_first(tmp_path):
+    cache = StageCache(cache_dir=str(tmp_path), max_size_mb=0.25)
+    block = np.zeros(100_000 // 8)  # ~100 KB each
+
+    cache.put_matrix("first", block)
+    cache.put_matrix("second", block)
+    os.utime(tmp_path / "second.npy", (0, 0))  # make "second" the stalest
+    cache.get_matrix("first")
+    cache.put_matrix("third", block)
+
+    assert cache.get_matrix("second") is None
+    assert cache.get_matrix("first") is not None
+    assert cache.get_matrix("third") is not None
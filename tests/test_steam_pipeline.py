@@ -0,0 +1,129 @@
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from pipelines.steam_pipeline import CHECKPOINT_JOB, SteamDataPipeline
+from utils.checkpoint_store import CheckpointStore
+from utils.steam_http import FailedApps
+
+APP_IDS = list(range(1, 11))
+
+
+class _FakeAppListFetcher:
+    def fetch(self):
+        return {app_id: f"app {app_id}" for app_id in APP_IDS}
+
+
+class _FakeStoreFetcher:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.failures = FailedApps()
+
+    def fetch(self, app_ids):
+        return [d for d in (self.fetch_one(a) for a in app_ids) if d is not None]
+
+    def fetch_one(self, app_id, dump_debug=False):
+        time.sleep(0.002 * (len(APP_IDS) - app_id))  # later apps answer first
+        if app_id in self.failing:
+            self.failures.add(app_id)
+            return None
+        return {"steam_appid": app_id, "name": f"game {app_id}", "type": "game"}
+
+
+class _FakeReviewFetcher(_FakeStoreFetcher):
+    def fetch_one(self, app_id, dump_debug=False):
+        if app_id in self.failing:
+            self.failures.add(app_id)
+            return None
+        return {"AppID": app_id, "total_reviews": app_id * 10}
+
+
+class _FakeCurrentUserFetcher:
+    def fetch(self, app_ids):
+        return [self.fetch_one(a) for a in app_ids]
+
+    def fetch_one(self, app_id):
+        return {"AppID": app_id, "current_players": app_id}
+
+
+class _FakeExtractor:
+    def __init__(self, fail_on_batch=None):
+        self.fail_on_batch = fail_on_batch
+        self.batches = []
+        self.rows = []
+
+    def save_data(self, rows):
+        if len(self.batches) == self.fail_on_batch:
+            raise RuntimeError("database went away")
+        self.batches.append([r["AppID"] for r in rows])
+        self.rows.extend(rows)
+
+
+class _FakeClient:
+    def stats(self):
+        return {"requests": 0, "throttled": 0}
+
+
+class _FakeContext:
+    client = _FakeClient()
+
+
+def _pipeline(store_failing=(), review_failing=(), checkpoint=None, concurrency=1, extractor=None):
+    pipeline = SteamDataPipeline.__new__(SteamDataPipeline)
+    pipeline.logger = logging.getLogger("test_steam_pipeline")
+    pipeline.limit_apps = None
+    pipeline.offset_apps = 0
+    pipeline.concurrency = concurrency
+    pipeline.checkpoint = checkpoint
+    pipeline.fetcher_context = _FakeContext()
+    pipeline.app_list_fetcher = _FakeAppListFetcher()
+    pipeline.store_fetcher = _FakeStoreFetcher(store_failing)
+    pipeline.review_fetcher = _FakeReviewFetcher(review_failing)
+    pipeline.current_user_fetcher = _FakeCurrentUserFetcher()
+    pipeline.steam_extractor = extractor or _FakeExtractor()
+    return pipeline
+
+
+def test_review_failure_is_checkpointed_and_not_saved_twice(tmp_path):
+    checkpoint = CheckpointStore(str(tmp_path / "checkpoints.sqlite"))
+    first = _pipeline(store_failing={3}, review_failing={5}, checkpoint=checkpoint)
+
+    first.run()
+
+    saved = [a for batch in first.steam_extractor.batches for a in batch]
+    assert saved == [a for a in APP_IDS if a != 3]
+    # app 5 was saved without its reviews, so it is done; app 3 was never saved
+    assert checkpoint.completed(CHECKPOINT_JOB) == {str(a) for a in APP_IDS if a != 3}
+
+    second = _pipeline(checkpoint=checkpoint)
+    second.run()
+
+    assert [a for batch in second.steam_extractor.batches for a in batch] == [3]
+    assert checkpoint.completed(CHECKPOINT_JOB) == {str(a) for a in APP_IDS}
+
+
+def test_concurrent_run_saves_the_same_batches_in_order_as_serial(monkeypatch):
+    monkeypatch.setattr("pipelines.steam_pipeline.BATCH_SIZE", 3)
+    serial = _pipeline(store_failing={4}, review_failing={8})
+    serial.run()
+    concurrent = _pipeline(store_failing={4}, review_failing={8}, concurrency=4)
+    concurrent.run()
+
+    assert serial.steam_extractor.batches == [[1, 2, 3], [5, 6], [7, 8, 9], [10]]
+    assert concurrent.steam_extractor.batches == serial.steam_extractor.batches
+    assert concurrent.steam_extractor.rows == serial.steam_extractor.rows
+
+
+def test_concurrent_run_raises_save_errors(monkeypatch):
+    monkeypatch.setattr("pipelines.steam_pipeline.BATCH_SIZE", 3)
+    pipeline = _pipeline(concurrency=4, extractor=_FakeExtractor(fail_on_batch=1))
+
+    with pytest.raises(RuntimeError, match="database went away"):
+        pipeline.run()
+
+    assert pipeline.steam_extractor.batches == [[1, 2, 3]]
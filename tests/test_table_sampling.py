@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+from sqlalchemy import Column, Integer, create_engine, insert
+from sqlalchemy.orm import Session, declarative_base
+
+from data.query.sampling import SamplingSpec
+from data.table_extractor import TableDataExtractor
+
+Base = declarative_base()
+N_ROWS = 100_000
+
+
+class _Row(Base):
+    __tablename__ = "sampled_rows"
+    Id = Column(Integer, primary_key=True)
+    value = Column(Integer)
+
+
+class _Connector:
+    def __init__(self):
+        self.engine = create_engine("sqlite:///:memory:", future=True)
+        Base.metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(insert(_Row), [{"Id": i, "value": i % 7} for i in range(1, N_ROWS + 1)])
+
+    def get_session(self):
+        return Session(self.engine)
+
+
+@pytest.fixture(scope="module")
+def connector():
+    return _Connector()
+
+
+def _ids(connector, method, seed, sample_size=None, percent=None):
+    extractor = TableDataExtractor(
+        connector, _Row, sample_size=sample_size, columns=["Id"],
+        sampling=SamplingSpec(method=method, percent=percent, seed=seed),
+    )
+    ids = sorted(r["Id"] for r in extractor.fetch_all())
+    assert extractor.last_sample_size == len(ids)
+    return ids
+
+
+@pytest.mark.parametrize("method", ["hash", "bernoulli"])
+def test_capped_sample_is_reproducible_exact_and_covers_the_key_range(connector, method):
+    first = _ids(connector, method, seed=3, sample_size=1000)
+
+    assert first == _ids(connector, method, seed=3, sample_size=1000)
+    assert len(first) == 1000
+    # the cap must not keep only the lowest keys of the oversampled draw
+    top_fifth = sum(i > 0.8 * N_ROWS for i in first)
+    assert 120 < top_fifth < 280
+    assert max(first) > 0.99 * N_ROWS
+
+
+@pytest.mark.parametrize("method", ["hash", "bernoulli"])
+def test_other_seeds_give_other_samples(connector, method):
+    a = set(_ids(connector, method, seed=1, sample_size=1000))
+    b = set(_ids(connector, method, seed=2, sample_size=1000))
+    # two unrelated 1% samples share about 10 rows
+    assert len(a & b) < 50
+
+
+def test_bernoulli_seeds_are_not_shifted_copies(connector):
+    a = _ids(connector, "bernoulli", seed=1, percent=2.0)
+    b = set(_ids(connector, "bernoulli", seed=2, percent=2.0))
+    # a seed that only offset the key (key + seed * 40503) would reproduce a's rows shifted
+    shifted = {i - 40503 for i in a}
+    assert len(shifted & b) < 0.1 * len(a)
+
+
+def test_percent_sample_size_is_close_to_target(connector):
+    ids = _ids(connector, "bernoulli", seed=0, percent=5.0)
+    assert 4500 < len(ids) < 5500
@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from vectorizers.word2vec_vectorizer import Word2VecVectorizer
+
+CORPUS = [
+    "the minister answered the question on housing",
+    "housing rent and housing supply",
+    "the hospital waiting list grew",
+    "waiting list for the hospital and the minister",
+    "rent supply question",
+]
+
+
+def _loop_transform(vectorizer, texts):
+    # the per-document loop transform used to run, kept as the reference
+    def embed(sentence):
+        tokens = sentence.split()
+        vectors = [vectorizer.model.wv[w] for w in tokens if w in vectorizer.model.wv]
+        return np.mean(vectors, axis=0) if vectors else np.zeros(vectorizer.vector_size)
+
+    return np.vstack([embed(t) for t in texts])
+
+
+def test_sparse_mean_transform_matches_per_document_loop():
+    vectorizer = Word2VecVectorizer("w2v", column="text", vector_size=16, min_count=1, epochs=5, workers=1, seed=1)
+    vectorizer.fit(pd.DataFrame({"text": CORPUS}))
+
+    texts = [
+        "housing housing rent",            # repeated tokens count once per occurrence
+        "the minister and the hospital",
+        "unseen words only",               # no in-vocabulary token
+        "",
+        "hospital",
+    ]
+    result = vectorizer.transform(pd.DataFrame({"text": texts}))
+
+    assert result.shape == (len(texts), 16)
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, _loop_transform(vectorizer, texts), rtol=1e-5, atol=1e-6)
+    assert not result[2].any() and not result[3].any()
+
+
+def test_missing_text_gives_a_zero_vector():
+    vectorizer = Word2VecVectorizer("w2v", column="text", vector_size=8, min_count=1, epochs=2, workers=1, seed=1)
+    vectorizer.fit(pd.DataFrame({"text": CORPUS}))
+
+    result = vectorizer.transform(pd.DataFrame({"text": ["rent supply", None]}))
+
+    np.testing.assert_allclose(result[0], _loop_transform(vectorizer, ["rent supply"])[0], rtol=1e-5, atol=1e-6)
+    assert not result[1].any()
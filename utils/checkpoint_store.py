@@ -0,0 +1,88 @@
+# utils/checkpoint_store.py
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional, Set
+
+from logs.logger import get_logger
+
+DEFAULT_CHECKPOINT_PATH = os.getenv("CHECKPOINT_PATH", "cache/checkpoints.sqlite")
+
+
+class CheckpointStore:
+    """Durable record of completed ingestion units, in a local SQLite file.
+
+    A unit is whatever an ingestion job commits in one go (a Steam app, an Oireachtas month
+    or day, a boards.ie day). Jobs mark units done only after their batch has been saved,
+    and skip units already marked on the next run, so a crashed backfill resumes where it
+    stopped instead of starting over. Units are namespaced by job name, so several
+    pipelines can share one file. Safe to use from several threads.
+
+    YAML (on a pipeline's params):
+      checkpoint:
+        path: cache/checkpoints.sqlite
+    `checkpoint: true` uses the default path.
+    """
+
+    def __init__(self, path: str = DEFAULT_CHECKPOINT_PATH):
+        self.logger = get_logger(self.__class__.__name__)
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                "job TEXT NOT NULL, unit TEXT NOT NULL, completed_at TEXT NOT NULL, meta TEXT, "
+                "PRIMARY KEY (job, unit))"
+            )
+        self.logger.info(f"Opened checkpoint store {self.path}")
+
+    @classmethod
+    def from_config(cls, cfg: Any) -> Optional["CheckpointStore"]:
+        if not cfg:
+            return None
+        if isinstance(cfg, CheckpointStore):
+            return cfg
+        if cfg is True:
+            return cls()
+        return cls(path=cfg.get("path", DEFAULT_CHECKPOINT_PATH))
+
+    def completed(self, job: str) -> Set[str]:
+        """All units of `job` already marked done."""
+        with self._lock:
+            rows = self._conn.execute("SELECT unit FROM checkpoints WHERE job = ?", (job,)).fetchall()
+        return {unit for (unit,) in rows}
+
+    def is_done(self, job: str, unit: Any) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM checkpoints WHERE job = ? AND unit = ?", (job, str(unit))
+            ).fetchone()
+        return row is not None
+
+    def mark_done(self, job: str, unit: Any, **meta) -> None:
+        """Record `unit` as committed; `meta` (e.g. a record count) is stored as JSON."""
+        self.mark_many(job, [unit], **meta)
+
+    def mark_many(self, job: str, units: Iterable[Any], **meta) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        payload = json.dumps(meta, default=str) if meta else None
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO checkpoints (job, unit, completed_at, meta) VALUES (?, ?, ?, ?)",
+                ((job, str(unit), now, payload) for unit in units),
+            )
+
+    def reset(self, job: str) -> None:
+        """Forget every unit of `job`, so the next run fetches everything again."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM checkpoints WHERE job = ?", (job,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
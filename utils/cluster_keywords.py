@@ -0,0 +1,66 @@
+# utils/cluster_keywords.py
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+from scipy import sparse
+
+KEYWORD_SCORINGS = ("mean", "ctfidf")
+
+
+def cluster_keywords(
+    X,
+    labels: Sequence,
+    terms: Sequence[str],
+    top_n: int = 10,
+    scoring: str = "mean",
+    exclude: Iterable = (-1,),
+) -> Dict[int, List[str]]:
+    """Top `top_n` terms per cluster, most important first.
+
+    One sparse (clusters x documents) indicator matrix times the document-term matrix gives
+    every cluster's term totals at once; each cluster's top terms then come from an
+    `argpartition` over its non-zero entries only, so nothing is densified.
+
+    scoring:
+      - mean:   centroid weight (the mean of the document vectors in the cluster)
+      - ctfidf: class-based TF-IDF as in BERTopic: term totals per cluster, normalised per
+                cluster, times log(1 + A / f_t) with A the average cluster total and f_t the
+                term's total over all clusters (excluded clusters such as noise included)
+    """
+    if scoring not in KEYWORD_SCORINGS:
+        raise ValueError(f"Unknown keyword scoring '{scoring}'. Use one of {KEYWORD_SCORINGS}")
+    labels = np.asarray(labels)
+    clusters, codes = np.unique(labels, return_inverse=True)
+    sizes = np.bincount(codes, minlength=len(clusters)).astype(np.float64)
+    indicator = sparse.csr_matrix(
+        (np.ones(len(codes)), (codes, np.arange(len(codes)))), shape=(len(clusters), len(codes))
+    )
+    X = sparse.csr_matrix(X) if not sparse.issparse(X) else X.tocsr()
+    totals = (indicator @ X).tocsr()
+
+    if scoring == "mean":
+        scores = sparse.diags(1.0 / sizes) @ totals
+    else:
+        row_sums = np.asarray(totals.sum(axis=1)).ravel()
+        tf = sparse.diags(np.divide(1.0, row_sums, out=np.zeros_like(row_sums), where=row_sums > 0)) @ totals
+        term_totals = np.asarray(totals.sum(axis=0)).ravel()
+        avg = totals.sum() / len(clusters)
+        idf = np.log1p(np.divide(avg, term_totals, out=np.zeros_like(term_totals), where=term_totals > 0))
+        scores = tf @ sparse.diags(idf)
+    scores = sparse.csr_matrix(scores)
+    scores.eliminate_zeros()
+
+    skip = set(exclude)
+    result: Dict[int, List[str]] = {}
+    for row, cluster_id in enumerate(clusters):
+        if cluster_id in skip:
+            continue
+        start, end = scores.indptr[row], scores.indptr[row + 1]
+        data, cols = scores.data[start:end], scores.indices[start:end]
+        if len(data) > top_n:
+            part = np.argpartition(-data, top_n - 1)[:top_n]
+            data, cols = data[part], cols[part]
+        order = np.argsort(-data, kind="stable")
+        key = cluster_id.item() if hasattr(cluster_id, "item") else cluster_id
+        result[key] = [terms[int(c)] for c in cols[order]]
+    return result
@@ -0,0 +1,264 @@
+# utils/http_client.py
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from logs.logger import get_logger
+
+# (calls, period in seconds) per host. A key matches the host itself or any subdomain,
+# so every steampowered.com host shares the one 200-per-5-minute Steam budget.
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[int, float]] = {
+    "www.boards.ie": (1, 1.0),
+    "steampowered.com": (200, 300.0),
+}
+
+# Ceilings (requests per second) for hosts whose rate adapts to the server's responses,
+# starting from the DEFAULT_RATE_LIMITS rate. boards.ie publishes no limit, so probe upwards.
+DEFAULT_ADAPTIVE_RATE_LIMITS: Dict[str, float] = {
+    "www.boards.ie": 4.0,
+}
+
+RETRY_STATUSES = (429, 502, 503, 504)
+THROTTLE_STATUSES = (429, 503)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `capacity` tokens, refilled continuously over `period` seconds."""
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a token is available; returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(delay)
+            waited += delay
+
+    def block_for(self, seconds: float) -> None:
+        """Hold every caller of this bucket back for `seconds` (used for Retry-After)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """Token bucket whose rate follows the server: additive increase, multiplicative decrease.
+
+    Starts at `capacity / period`. Every successful response raises the rate by
+    `increase` of the starting rate, up to `max_rate` per second; every throttling response
+    (429/503) halves it, down to `min_rate` (an eighth of the starting rate by default).
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        period: float,
+        max_rate: float,
+        min_rate: Optional[float] = None,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+    ):
+        super().__init__(capacity, period)
+        self.start_rate = self.rate
+        self.max_rate = max(max_rate, self.rate)
+        self.min_rate = min_rate if min_rate is not None else self.rate / 8
+        self.increase = increase
+        self.decrease = decrease
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase * self.start_rate)
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+
+
+class HttpClient:
+    """Shared HTTP client: pooled keep-alive session, per-host token buckets and retries.
+
+    Requests are retried with exponential backoff on connection errors and on
+    429/502/503/504. A `Retry-After` header pauses the whole host bucket, so every
+    thread sharing this client backs off together. Hosts listed in `adaptive_rate_limits`
+    get an AdaptiveTokenBucket that speeds up towards the given ceiling (requests per
+    second) while responses succeed and slows down on 429/503. Counters are available
+    via `stats()`.
+    """
+
+    def __init__(
+        self,
+        rate_limits: Optional[Dict[str, Tuple[int, float]]] = None,
+        default_rate_limit: Optional[int] = None,
+        retries: int = 3,
+        backoff_factor: float = 1.0,
+        max_backoff: float = 60.0,
+        pool_maxsize: int = 10,
+        headers: Optional[dict] = None,
+        proxy: Optional[str] = None,
+        adaptive_rate_limits: Optional[Dict[str, float]] = None,
+    ):
+        self.logger = get_logger(self.__class__.__name__)
+        self.rate_limits = dict(DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits)
+        self.adaptive_rate_limits = dict(
+            DEFAULT_ADAPTIVE_RATE_LIMITS if adaptive_rate_limits is None else adaptive_rate_limits
+        )
+        self.default_rate_limit = default_rate_limit
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+        if proxy:
+            self.session.proxies.update({"http": proxy, "https": proxy})
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "errors": 0,
+            "retries": 0,
+            "throttled": 0,
+            "throttle_wait_seconds": 0.0,
+            "latency_seconds": 0.0,
+            "max_latency_seconds": 0.0,
+        }
+
+    def get(self, url: str, params: Optional[dict] = None, retries: Optional[int] = None, **kwargs) -> requests.Response:
+        return self.request("GET", url, params=params, retries=retries, **kwargs)
+
+    def request(self, method: str, url: str, retries: Optional[int] = None, **kwargs) -> requests.Response:
+        """Send a rate-limited request, retrying transient failures.
+
+        Returns the last response once retries are exhausted (callers still call
+        `raise_for_status`); re-raises the last `RequestException` if no response was received.
+        """
+        retries = self.retries if retries is None else retries
+        bucket = self._bucket_for(url)
+
+        for attempt in range(retries + 1):
+            if bucket is not None:
+                waited = bucket.acquire()
+                if waited:
+                    self._record(throttle_wait_seconds=waited)
+
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                self._record(requests=1, errors=1, latency=time.perf_counter() - start)
+                if attempt == retries:
+                    raise
+                delay = self._backoff(attempt)
+                self.logger.warning(f"Request to {url} failed ({e}); retry {attempt + 1}/{retries} in {delay:.1f}s")
+                self._record(retries=1)
+                time.sleep(delay)
+                continue
+
+            self._record(requests=1, latency=time.perf_counter() - start)
+            if isinstance(bucket, AdaptiveTokenBucket):
+                if response.status_code in THROTTLE_STATUSES:
+                    bucket.on_throttle()
+                elif response.status_code < 400:
+                    bucket.on_success()
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                return response
+
+            retry_after = self._retry_after(response)
+            delay = retry_after if retry_after is not None else self._backoff(attempt)
+            if response.status_code == 429:
+                self._record(throttled=1)
+            self.logger.warning(
+                f"{response.status_code} from {url}; retry {attempt + 1}/{retries} in {delay:.1f}s"
+            )
+            self._record(retries=1)
+            if bucket is not None:
+                bucket.block_for(delay)
+            else:
+                time.sleep(delay)
+
+        return response
+
+    def stats(self) -> dict:
+        """Snapshot of request, latency and throttle counters."""
+        with self._lock:
+            snapshot = dict(self._stats)
+        snapshot["mean_latency_seconds"] = (
+            snapshot["latency_seconds"] / snapshot["requests"] if snapshot["requests"] else 0.0
+        )
+        return snapshot
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _bucket_for(self, url: str) -> Optional[TokenBucket]:
+        host = (urlsplit(url).hostname or "").lower()
+        key, limit = None, None
+        for pattern, pattern_limit in self.rate_limits.items():
+            if host == pattern or host.endswith("." + pattern):
+                key, limit = pattern, pattern_limit
+                break
+        if limit is None:
+            if not self.default_rate_limit:
+                return None
+            key, limit = host, (self.default_rate_limit, 60.0)
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                max_rate = self.adaptive_rate_limits.get(key)
+                if max_rate:
+                    bucket = AdaptiveTokenBucket(*limit, max_rate=max_rate)
+                else:
+                    bucket = TokenBucket(*limit)
+                self._buckets[key] = bucket
+            return bucket
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return delay + random.uniform(0, delay * 0.1)
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _record(self, latency: Optional[float] = None, **counts) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                self._stats[name] += value
+            if latency is not None:
+                self._stats["latency_seconds"] += latency
+                self._stats["max_latency_seconds"] = max(self._stats["max_latency_seconds"], latency)
@@ -1,23 +1,15 @@
 # utils/request_rate_limiter.py
-from ratelimit import limits, sleep_and_retry
-import requests
-import time
+from utils.http_client import HttpClient
 
 ONE_MINUTE = 60
 MAX_REQUESTS_PER_MINUTE = 100  # adjust based on Steam API tolerance
 
-@sleep_and_retry
-@limits(calls=MAX_REQUESTS_PER_MINUTE, period=ONE_MINUTE)
-def rate_limited_request(url, params=None, timeout=10):
-    """Send a GET request respecting rate limits and retry on 429."""
-    response = requests.get(url, params=params, timeout=timeout)
+# Budget applies per host; 429s are retried honouring Retry-After
+_client = HttpClient(rate_limits={}, default_rate_limit=MAX_REQUESTS_PER_MINUTE, retries=5)
 
-    retries = 0
-    while response.status_code == 429 and retries < 5:
-        retry_after = int(response.headers.get("Retry-After", 5))
-        time.sleep(retry_after)
-        response = requests.get(url, params=params, timeout=timeout)
-        retries += 1
 
+def rate_limited_request(url, params=None, timeout=10):
+    """Send a GET request respecting rate limits and retry on 429."""
+    response = _client.get(url, params=params, timeout=timeout)
     response.raise_for_status()
     return response
@@ -0,0 +1,200 @@
+# utils/stage_cache.py
+import hashlib
+import json
+import os
+import pickle
+import threading
+import uuid
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from logs.logger import get_logger
+
+DEFAULT_CACHE_DIR = os.getenv("STAGE_CACHE_DIR", "cache/stages")
+DEFAULT_MAX_SIZE_MB = 2048
+
+
+class StageCache:
+    """On-disk, content-addressed cache for stage outputs.
+
+    Entries are keyed by a hash of the input data fingerprint and the stage config, so a
+    hit is only possible when both are unchanged. DataFrames are stored as Parquet (pickle
+    when a column cannot be written to Parquet), dense matrices as `.npy` and sparse ones
+    as `.npz`. Reads refresh an entry's mtime; once the directory exceeds `max_size_mb`
+    the least recently used entries are evicted.
+
+    YAML (on PreprocessingPipeline params, or a `vectorizer` block):
+      cache:
+        dir: cache/stages
+        max_size_mb: 2048
+    `cache: true` uses the defaults.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_size_mb: float = DEFAULT_MAX_SIZE_MB):
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.logger = get_logger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, cfg: Any) -> Optional["StageCache"]:
+        if not cfg:
+            return None
+        if cfg is True:
+            return cls()
+        return cls(
+            cache_dir=cfg.get("dir", DEFAULT_CACHE_DIR),
+            max_size_mb=cfg.get("max_size_mb", DEFAULT_MAX_SIZE_MB),
+        )
+
+    # ----- keys --------------------------------------------------------------
+
+    @staticmethod
+    def fingerprint(data: Any) -> str:
+        """Content hash of a DataFrame, Series, ndarray, sparse matrix or list of texts."""
+        h = hashlib.sha256()
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            frame = data.to_frame() if isinstance(data, pd.Series) else data
+            h.update(repr([(str(c), str(t)) for c, t in frame.dtypes.items()]).encode())
+            h.update(repr(frame.shape).encode())
+            for col in frame.columns:
+                try:
+                    values = pd.util.hash_pandas_object(frame[col], index=True).to_numpy()
+                except TypeError:
+                    # unhashable cells (lists, dicts) hash by their repr
+                    values = pd.util.hash_pandas_object(frame[col].map(repr), index=True).to_numpy()
+                h.update(values.tobytes())
+        elif isinstance(data, np.ndarray):
+            h.update(f"{data.dtype}{data.shape}".encode())
+            h.update(np.ascontiguousarray(data).tobytes())
+        elif hasattr(data, "tocsr"):
+            csr = data.tocsr()
+            h.update(f"{csr.dtype}{csr.shape}".encode())
+            for part in (csr.indptr, csr.indices, csr.data):
+                h.update(np.ascontiguousarray(part).tobytes())
+        else:
+            h.update(json.dumps(data, sort_keys=True, default=str).encode())
+        return h.hexdigest()
+
+    @staticmethod
+    def make_key(stage: str, config: Any, *fingerprints: str) -> str:
+        payload = json.dumps({"stage": stage, "config": config, "inputs": fingerprints}, sort_keys=True, default=str)
+        return f"{stage}-{hashlib.sha256(payload.encode()).hexdigest()[:32]}"
+
+    # ----- DataFrames ----------------------------------------------------------
+
+    def get_frame(self, key: str) -> Optional[pd.DataFrame]:
+        for ext, reader in ((".parquet", pd.read_parquet), (".pkl", pd.read_pickle)):
+            path = self._path(key, ext)
+            if os.path.exists(path):
+                self._touch(path)
+                self.logger.info(f"Stage cache hit: {key}")
+                return reader(path)
+        return None
+
+    def put_frame(self, key: str, df: pd.DataFrame) -> None:
+        try:
+            self._write(key, ".parquet", lambda p: df.to_parquet(p, index=True))
+        except Exception as e:
+            self.logger.info(f"Parquet write failed for {key} ({e}); caching as pickle")
+            self._write(key, ".pkl", lambda p: df.to_pickle(p))
+
+    # ----- matrices -----------------------------------------------------------
+
+    def get_matrix(self, key: str) -> Optional[Any]:
+        npy, npz = self._path(key, ".npy"), self._path(key, ".npz")
+        if os.path.exists(npy):
+            self._touch(npy)
+            self.logger.info(f"Stage cache hit: {key}")
+            return np.load(npy, allow_pickle=False)
+        if os.path.exists(npz):
+            from scipy import sparse
+
+            self._touch(npz)
+            self.logger.info(f"Stage cache hit: {key}")
+            return sparse.load_npz(npz)
+        return None
+
+    def put_matrix(self, key: str, X: Any) -> None:
+        if hasattr(X, "tocsr"):
+            from scipy import sparse
+
+            self._write(key, ".npz", lambda p: sparse.save_npz(p, X.tocsr()))
+        else:
+            self._write(key, ".npy", lambda p: np.save(p, np.asarray(X), allow_pickle=False))
+
+    # ----- fitted objects -----------------------------------------------------
+
+    def get_object(self, key: str) -> Optional[Any]:
+        path = self._path(key, ".pkl")
+        if not os.path.exists(path):
+            return None
+        self._touch(path)
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def put_object(self, key: str, obj: Any) -> None:
+        def dump(p):
+            with open(p, "wb") as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        try:
+            self._write(key, ".pkl", dump)
+        except Exception as e:
+            self.logger.warning(f"Could not cache object {key}: {e}")
+
+    # ----- storage ------------------------------------------------------------
+
+    def _path(self, key: str, ext: str) -> str:
+        return os.path.join(self.cache_dir, key + ext)
+
+    def _write(self, key: str, ext: str, writer) -> None:
+        path = self._path(key, ext)
+        # write under a temp name and rename, so a crash never leaves a truncated entry
+        tmp = os.path.join(self.cache_dir, f".{uuid.uuid4().hex}.tmp{ext}")
+        try:
+            writer(tmp)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        self.logger.info(f"Cached stage output {os.path.basename(path)} ({os.path.getsize(path) / 1e6:.1f} MB)")
+        self._evict()
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if name.startswith("."):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    self.logger.info(f"Evicted {os.path.basename(path)} from stage cache")
+                except OSError:
+                    pass
+
+    def stats(self) -> Dict[str, Any]:
+        names = [n for n in os.listdir(self.cache_dir) if not n.startswith(".")]
+        size = sum(os.path.getsize(os.path.join(self.cache_dir, n)) for n in names)
+        return {"entries": len(names), "size_mb": size / (1024 * 1024), "max_size_mb": self.max_bytes / (1024 * 1024)}
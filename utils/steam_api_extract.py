@@ -19,7 +19,9 @@ if __name__ == "__main__":
         api_key=api_key,
         chunk_size=100,
         limit_apps=50000,
-        offset_apps=48832  #
+        offset_apps=48832,  # progress made before checkpointing; later restarts resume from the checkpoint
+        concurrency=8,  # per-app requests in flight; the shared Steam rate budget still applies
+        checkpoint=True  # saved apps are recorded in cache/checkpoints.sqlite and skipped on restart
     )
     logger.info("Running Steam data extraction pipeline...")
     steam_pipeline.run()
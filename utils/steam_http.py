@@ -1,31 +1,31 @@
 #utils/steam_http.py
-import time
+import threading
+from typing import Iterable, Optional, Set
 import requests
-from ratelimit import limits, sleep_and_retry
 from logs.logger import get_logger
+from utils.http_client import HttpClient
 
 FIVE_MINUTES = 300
 STEAM_CALLS_PER_WINDOW = 200  # official limit
 logger = get_logger("utils.steam_http.steam_get")
 
-@sleep_and_retry
-@limits(calls=STEAM_CALLS_PER_WINDOW, period=FIVE_MINUTES)
-def steam_get(url: str, params: dict, timeout: int = 10) -> requests.Response:
-    #logger = get_logger("utils/http/steam_get")
+# Fallback for callers without a FetcherContext; all steampowered.com hosts share one budget
+_default_client = HttpClient(rate_limits={"steampowered.com": (STEAM_CALLS_PER_WINDOW, FIVE_MINUTES)})
+
+
+def steam_get(url: str, params: dict, timeout: int = 10, client: Optional[HttpClient] = None) -> requests.Response:
+    """GET a Steam endpoint through the shared rate-limited client.
+
+    429s are retried by the client (honouring Retry-After). Returns None on 5xx or
+    connection errors so callers can skip the app; other HTTP errors are raised.
+    """
+    client = client or _default_client
     req = requests.Request("GET", url, params=params).prepare()
     full_url = req.url
     logger.info(f"fetching URL: {full_url}")
 
     try:
-        response = requests.get(url, params=params, timeout=timeout)
-
-        # Defensive handling if Steam still returns 429
-        if response.status_code == 429:
-            logger.info("Received 429 Too Many Requests from Steam, retrying after delay")
-            retry_after = int(response.headers.get("Retry-After", 10))
-            time.sleep(retry_after)
-            response = requests.get(url, params=params, timeout=timeout)
-
+        response = client.get(url, params=params, timeout=timeout)
         response.raise_for_status()
         return response
     except requests.exceptions.HTTPError as e:
@@ -39,3 +39,22 @@ def steam_get(url: str, params: dict, timeout: int = 10) -> requests.Response:
         logger.warning(f"Request exception when accessing Steam API: {e}")
         return None
 
+
+class FailedApps:
+    """Thread-safe set of app IDs whose request failed (5xx, connection error), so a
+    pipeline can tell a transient failure apart from an app Steam has no data for."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids: Set[int] = set()
+
+    def add(self, app_id: int) -> None:
+        with self._lock:
+            self._ids.add(app_id)
+
+    def pop(self, app_ids: Iterable[int]) -> Set[int]:
+        """Remove and return the failed IDs among `app_ids`."""
+        with self._lock:
+            failed = self._ids.intersection(app_ids)
+            self._ids -= failed
+        return failed
@@ -4,6 +4,7 @@ from .bert_vectorizer import BERTVectorizer
 from .tfidf_vectorizer import TFIDFTextVectorizer
 from .word2vec_vectorizer import Word2VecVectorizer
 from .factory import VectorizerFactory
+from .cache import fit_transform_cached
 
 VectorizerFactory.register_vectorizer('tfidf', TFIDFTextVectorizer)
 VectorizerFactory.register_vectorizer('word2vec', Word2VecVectorizer)
@@ -15,4 +16,5 @@ __all__ = [
     "TFIDFTextVectorizer",
     "Word2VecVectorizer",
     "VectorizerFactory",
+    "fit_transform_cached",
 ]
@@ -2,6 +2,9 @@
 from abc import ABC, abstractmethod
 
 class Vectorizer(ABC):
+    # whether the fitted vectorizer is pickled next to its cached output (see vectorizers/cache.py);
+    # vectorizers without fitted state skip it
+    cache_fitted = True
 
     @abstractmethod
     def fit(self, X):
@@ -19,3 +22,6 @@ class Vectorizer(ABC):
         self.fit(X)
         return self.transform(X)
 
+    def restore_from_cache(self, X_fit) -> None:
+        """Hook called with the cached fit output when a cache hit skips fitting."""
+        return None
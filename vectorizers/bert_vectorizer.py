@@ -1,22 +1,73 @@
 # vectorizers/bert_vectorizer.py
+from typing import List, Optional
 from sentence_transformers import SentenceTransformer
 from .base import Vectorizer
+from .embedding_store import EmbeddingStore
 import numpy as np
 
 class BERTVectorizer(Vectorizer):
-    def __init__(self, name: str, column: str, model_name="sentence-transformers/all-mpnet-base-v2"):
+    """Sentence-transformer embeddings of one text column.
+
+    Texts are deduplicated and encoded in length-sorted batches of `batch_size`. With
+    `embedding_store` set (a directory), embeddings persist across runs keyed by model name
+    and text hash, and only texts not already in the store are encoded; the model itself is
+    only loaded when something needs encoding. `store_dtype: float16` halves the store size.
+    """
+    # no fitted state: the pretrained model is reloaded rather than pickled into the cache
+    cache_fitted = False
+
+    def __init__(
+        self,
+        name: str,
+        column: str,
+        model_name="sentence-transformers/all-mpnet-base-v2",
+        batch_size: int = 64,
+        embedding_store: Optional[str] = None,
+        store_dtype: str = "float32",
+    ):
         self.name = name
         self.column = column
-        self.model = SentenceTransformer(model_name)
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.store = EmbeddingStore(embedding_store, model_name, dtype=store_dtype) if embedding_store else None
+        self._model = None
+        self._dim = None
+
+    @property
+    def model(self) -> SentenceTransformer:
+        if self._model is None:
+            self._model = SentenceTransformer(self.model_name)
+        return self._model
 
     def fit(self, X):
         return  # no fitting
 
     def transform(self, X):
-        return self.model.encode(X[self.column].tolist(), show_progress_bar=False)
+        texts = X[self.column].tolist()
+        if self.store is not None:
+            embeddings = self.store.get_or_encode(texts, self._encode_batch, batch_size=self.batch_size)
+        else:
+            embeddings = self._encode_unique(texts)
+        self._dim = embeddings.shape[1]
+        return embeddings
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        return self.model.encode(texts, batch_size=self.batch_size, show_progress_bar=False)
+
+    def _encode_unique(self, texts: List[str]) -> np.ndarray:
+        """Encode each distinct text once, similar-length texts batched together, then scatter back."""
+        unique = sorted(set(texts), key=len)
+        position = {t: i for i, t in enumerate(unique)}
+        encoded = np.vstack([
+            self._encode_batch(unique[i:i + self.batch_size]) for i in range(0, len(unique), self.batch_size)
+        ]) if unique else np.empty((0, 0), dtype=np.float32)
+        return encoded[[position[t] for t in texts]]
+
+    def restore_from_cache(self, X_fit) -> None:
+        self._dim = X_fit.shape[1]
 
     def get_feature_names(self):
         """Return placeholder feature names for pipeline compatibility."""
         if self._dim is None:
             return []  # not fit yet
-        return np.array([f"bert_dim_{i}" for i in range(self._dim)])
\ No newline at end of file
+        return np.array([f"bert_dim_{i}" for i in range(self._dim)])
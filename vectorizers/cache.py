@@ -0,0 +1,39 @@
+# vectorizers/cache.py
+from typing import Any, Dict, List, Tuple
+
+from utils.stage_cache import StageCache
+from .base import Vectorizer
+
+
+def fit_transform_cached(
+    vectorizer: Vectorizer,
+    cache: StageCache,
+    config: Dict[str, Any],
+    X_fit,
+    *X_transform,
+) -> Tuple[Vectorizer, List[Any]]:
+    """Fit `vectorizer` on `X_fit` and transform it plus every `X_transform`, via the stage cache.
+
+    The key covers `config` (vectorizer name and params) and the content of the vectorized
+    column in each input, so changing either refits. On a hit the matrices are loaded from
+    disk and, for vectorizers with fitted state, the fitted vectorizer is unpickled and
+    returned in place of the one passed in (so `get_feature_names` still works).
+    """
+    column = getattr(vectorizer, "column", None)
+    inputs = [X_fit, *X_transform]
+    fingerprints = [StageCache.fingerprint(X[column] if column is not None else X) for X in inputs]
+    base_key = StageCache.make_key(f"vectorizer_{vectorizer.name}", config, *fingerprints)
+    keys = [f"{base_key}-{i}" for i in range(len(inputs))]
+
+    matrices = [cache.get_matrix(k) for k in keys]
+    fitted = cache.get_object(f"{base_key}-fitted") if vectorizer.cache_fitted else vectorizer
+    if fitted is not None and all(m is not None for m in matrices):
+        fitted.restore_from_cache(matrices[0])
+        return fitted, matrices
+
+    matrices = [vectorizer.fit_transform(X_fit)] + [vectorizer.transform(X) for X in X_transform]
+    for key, matrix in zip(keys, matrices):
+        cache.put_matrix(key, matrix)
+    if vectorizer.cache_fitted:
+        cache.put_object(f"{base_key}-fitted", vectorizer)
+    return vectorizer, matrices
@@ -0,0 +1,132 @@
+# vectorizers/embedding_store.py
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+from logs.logger import get_logger
+
+_DIGEST_SIZE = 16
+
+
+def text_digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=_DIGEST_SIZE).digest()
+
+
+class EmbeddingStore:
+    """Persistent, append-only store of text embeddings for one model.
+
+    Layout under `store_dir/<model slug>/`:
+      - meta.json          model name, dimension and dtype
+      - index.bin          16-byte blake2b digest of each stored text, in row order
+      - vectors.bin        raw row-major matrix (float16 or float32), memory-mapped on read
+
+    `index.bin` is written after `vectors.bin`, so its length is the committed row count;
+    rows past it (from an interrupted append) are truncated on the next write. One writer
+    per store directory at a time.
+    """
+
+    def __init__(self, store_dir: str, model_name: str, dtype: str = "float32"):
+        if dtype not in ("float16", "float32"):
+            raise ValueError(f"dtype must be 'float16' or 'float32', got '{dtype}'")
+        self.model_name = model_name
+        self.path = os.path.join(store_dir, re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name))
+        self.logger = get_logger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+
+        self._meta_path = os.path.join(self.path, "meta.json")
+        self._index_path = os.path.join(self.path, "index.bin")
+        self._vectors_path = os.path.join(self.path, "vectors.bin")
+
+        self.dim: Optional[int] = None
+        self.dtype = np.dtype(dtype)
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("model_name") != model_name:
+                raise ValueError(f"Embedding store at {self.path} belongs to {meta.get('model_name')}")
+            self.dim = meta["dim"]
+            self.dtype = np.dtype(meta["dtype"])
+
+        self._rows = {}
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "rb") as f:
+                raw = f.read()
+            for i in range(len(raw) // _DIGEST_SIZE):
+                self._rows[raw[i * _DIGEST_SIZE:(i + 1) * _DIGEST_SIZE]] = i
+        self.logger.info(f"Opened embedding store {self.path} with {len(self._rows)} vectors")
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get_or_encode(
+        self,
+        texts: List[str],
+        encode: Callable[[List[str]], np.ndarray],
+        batch_size: int = 64,
+    ) -> np.ndarray:
+        """Return one float32 row per text, encoding (and storing) only texts not seen before.
+
+        Unseen texts are deduplicated and encoded in batches sorted by length, so each batch
+        pads to similar lengths.
+        """
+        digests = [text_digest(t) for t in texts]
+        missing = {}
+        for d, t in zip(digests, texts):
+            if d not in self._rows and d not in missing:
+                missing[d] = t
+
+        if missing:
+            self._encode_and_append(missing, encode, batch_size)
+        self.logger.info(
+            f"Embeddings: {len(texts)} texts, {len(set(digests))} distinct, "
+            f"{len(set(digests)) - len(missing)} from store, {len(missing)} encoded"
+        )
+
+        vectors = self._vectors()
+        rows = np.fromiter((self._rows[d] for d in digests), dtype=np.int64, count=len(digests))
+        return np.asarray(vectors[rows], dtype=np.float32)
+
+    def _encode_and_append(self, missing: dict, encode, batch_size: int) -> None:
+        items = sorted(missing.items(), key=lambda kv: len(kv[1]))
+        start = time.perf_counter()
+        encoded = 0
+        for i in range(0, len(items), batch_size):
+            batch = items[i:i + batch_size]
+            vectors = np.asarray(encode([t for _, t in batch]))
+            self._append([d for d, _ in batch], vectors)
+            encoded += len(batch)
+            elapsed = time.perf_counter() - start
+            self.logger.info(
+                f"Encoded {encoded}/{len(items)} texts ({encoded / elapsed if elapsed else 0.0:.1f} texts/s)"
+            )
+
+    def _append(self, digests: List[bytes], vectors: np.ndarray) -> None:
+        with self._lock:
+            if self.dim is None:
+                self.dim = int(vectors.shape[1])
+                with open(self._meta_path, "w", encoding="utf-8") as f:
+                    json.dump({"model_name": self.model_name, "dim": self.dim, "dtype": self.dtype.name}, f)
+            if vectors.shape[1] != self.dim:
+                raise ValueError(f"Expected {self.dim}-dimensional embeddings, got {vectors.shape[1]}")
+
+            committed = len(self._rows) * self.dim * self.dtype.itemsize
+            with open(self._vectors_path, "ab") as f:
+                # drop rows an interrupted append wrote without indexing
+                f.truncate(committed)
+                f.write(np.ascontiguousarray(vectors, dtype=self.dtype).tobytes())
+            with open(self._index_path, "ab") as f:
+                f.truncate(len(self._rows) * _DIGEST_SIZE)
+                f.write(b"".join(digests))
+            for d in digests:
+                self._rows[d] = len(self._rows)
+
+    def _vectors(self) -> np.ndarray:
+        if not self._rows:
+            return np.empty((0, self.dim or 0), dtype=self.dtype)
+        return np.memmap(self._vectors_path, dtype=self.dtype, mode="r", shape=(len(self._rows), self.dim))
@@ -1,32 +1,98 @@
 # vectorizers/word2vec_vectorizer.py
+import os
+import tempfile
 import numpy as np
 from gensim.models import Word2Vec
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
 from .base import Vectorizer
 
 class Word2VecVectorizer(Vectorizer):
-    def __init__(self, name: str, column: str, vector_size=300, window=5, min_count=2, **kwargs):
+    """Mean (or TF-IDF weighted mean) Word2Vec vector per document.
+
+    transform builds a sparse document x vocabulary count matrix in one pass and multiplies
+    it by `wv.vectors`, instead of averaging per document in Python.
+
+    Training options:
+      - workers:     gensim worker threads (default: all cores)
+      - corpus_file: train from a temporary LineSentence file; gensim's corpus_file mode
+                     scales with `workers` far better than an in-memory iterable
+      - weighting:   "mean" (default) or "tfidf" (IDF from the training corpus)
+    """
+
+    def __init__(self, name: str, column: str, vector_size=300, window=5, min_count=2, epochs=10,
+                 workers=None, corpus_file=False, weighting="mean", **kwargs):
+        if weighting not in ("mean", "tfidf"):
+            raise ValueError(f"weighting must be 'mean' or 'tfidf', got '{weighting}'")
         self.name = name
         self.column = column
         self.vector_size = vector_size
+        self.epochs = epochs
+        self.corpus_file = corpus_file
+        self.weighting = weighting
+        self.workers = workers or os.cpu_count() or 1
         self.model = Word2Vec(
             vector_size=vector_size,
             window=window,
             min_count=min_count,
+            workers=self.workers,
             **kwargs
         )
+        self._idf = None
 
     def fit(self, X):
-        sentences = [t.split() for t in X[self.column]]
-        self.model.build_vocab(sentences)
-        self.model.train(sentences, total_examples=len(sentences), epochs=10)
+        texts = self._texts(X)
+        if self.corpus_file:
+            self._fit_corpus_file(texts)
+        else:
+            # tokenised once; gensim iterates the list once for the vocab and once per epoch
+            sentences = [t.split() for t in texts]
+            self.model.build_vocab(sentences)
+            self.model.train(sentences, total_examples=len(sentences), epochs=self.epochs)
+
+        if self.weighting == "tfidf":
+            counts = self._counts(texts)
+            doc_freq = np.bincount(counts.indices, minlength=counts.shape[1])
+            self._idf = (np.log((1 + counts.shape[0]) / (1 + doc_freq)) + 1).astype(np.float32)
+
+    def _fit_corpus_file(self, texts):
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", encoding="utf-8", delete=False) as f:
+            for t in texts:
+                f.write(" ".join(t.split()) + "\n")
+            path = f.name
+        try:
+            self.model.build_vocab(corpus_file=path)
+            self.model.train(
+                corpus_file=path,
+                total_examples=self.model.corpus_count,
+                total_words=self.model.corpus_total_words,
+                epochs=self.epochs,
+            )
+        finally:
+            os.remove(path)
 
     def transform(self, X):
-        def embed(sentence):
-            tokens = sentence.split()
-            vectors = [self.model.wv[w] for w in tokens if w in self.model.wv]
-            return np.mean(vectors, axis=0) if vectors else np.zeros(self.vector_size)
+        counts = self._counts(self._texts(X))
+        weights = counts.multiply(self._idf).tocsr() if self._idf is not None else counts
+        totals = np.asarray(weights.sum(axis=1)).ravel()
+        # documents without a known token keep a zero vector
+        scale = np.divide(1.0, totals, out=np.zeros_like(totals, dtype=np.float64), where=totals > 0)
+        weights = sparse.diags(scale.astype(np.float32)) @ weights
+        return np.asarray(weights @ self.model.wv.vectors, dtype=np.float32)
+
+    def _texts(self, X):
+        return X[self.column].fillna("").astype(str)
 
-        return np.vstack([embed(t) for t in X[self.column]])
+    def _counts(self, texts) -> sparse.csr_matrix:
+        """Document x vocabulary count matrix over the trained vocabulary (column i = wv.vectors[i])."""
+        counter = CountVectorizer(
+            vocabulary=self.model.wv.key_to_index,
+            tokenizer=str.split,
+            token_pattern=None,
+            lowercase=False,
+            dtype=np.float32,
+        )
+        return counter.transform(texts)
 
     def get_feature_names(self):
         return [f"w2v_dim_{i}" for i in range(self.vector_size)]